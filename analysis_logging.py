@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Analysis logging
+Level-gated, structured logging for the analysis hot paths (shot detection, DTW, extraction loops)
+
+Loggers live under the "basketball" namespace (basketball.shot_detection.shot_detector, ...),
+so levels can be set for a whole package or a single module. Messages use logging's lazy
+%-formatting: disabled debug lines cost a level check, not a string format.
+
+Environment:
+    ANALYSIS_LOG_LEVEL   Default level (INFO; the backend configures WARNING)
+    ANALYSIS_LOG_LEVELS  Per-module levels, e.g. "shot_detection=WARNING,shooting_comparison.dtw_analysis=DEBUG"
+    ANALYSIS_LOG_FORMAT  "text" (message only, like the CLI prints) or "json" (one object per line,
+                         with a Cloud Logging "severity" field)
+"""
+
+import os
+import sys
+import json
+import logging
+from typing import Dict, Optional
+
+ROOT_LOGGER_NAME = "basketball"
+
+# Extraction loops report progress every PROGRESS_STEP_PERCENT percent of frames
+PROGRESS_STEP_PERCENT = 10
+
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per record (severity/logger/message plus structured fields)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "severity": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _parse_module_levels(spec: str) -> Dict[str, str]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            module, level = item.split("=", 1)
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(level: Optional[str] = None, module_levels: Optional[Dict[str, str]] = None,
+                      log_format: Optional[str] = None):
+    """
+    Configure the analysis loggers (environment variables take precedence over arguments).
+
+    Args:
+        level: Default level name (e.g. "INFO", "WARNING")
+        module_levels: Per-module level names, keyed by module path (e.g. {"shot_detection": "WARNING"})
+        log_format: "text" or "json"
+    """
+    level = os.getenv("ANALYSIS_LOG_LEVEL", level or "INFO").upper()
+    module_levels = dict(module_levels or {})
+    module_levels.update(_parse_module_levels(os.getenv("ANALYSIS_LOG_LEVELS", "")))
+    log_format = os.getenv("ANALYSIS_LOG_FORMAT", log_format or "text")
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(level)
+    root.propagate = False
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonLogFormatter() if log_format == "json" else logging.Formatter("%(message)s"))
+    root.addHandler(handler)
+
+    for module, module_level in module_levels.items():
+        logging.getLogger(f"{ROOT_LOGGER_NAME}.{module}").setLevel(module_level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Logger for a module (call with __name__).
+
+    Args:
+        name: Module name
+
+    Returns:
+        Logger under the "basketball" namespace
+    """
+    if not logging.getLogger(ROOT_LOGGER_NAME).handlers:
+        configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def log_progress(logger: logging.Logger, label: str, current: int, total: int):
+    """
+    Log loop progress at INFO every PROGRESS_STEP_PERCENT percent (and every frame at DEBUG).
+
+    Args:
+        logger: Module logger
+        label: What is being processed (e.g. "Processing frame")
+        current: Frames processed so far
+        total: Total frames (0 if unknown)
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %d/%d", label, current, total)
+    elif total > 0 and logger.isEnabledFor(logging.INFO):
+        step = max(1, total * PROGRESS_STEP_PERCENT // 100)
+        if current % step == 0 or current == total:
+            logger.info("%s: %d/%d (%.0f%%)", label, current, total, current / total * 100,
+                        extra={"fields": {"current": current, "total": total}})
@@ -1,5 +1,7 @@
 # Configuration settings for the basketball form analyzer
 
+import os
+
 # Ball detection settings
 MIN_BALL_SIZE = 0.01
 MIN_BALL_CONFIDENCE = 0.3
@@ -12,6 +14,23 @@ DEFAULT_FPS = 22
 BASE_FILENAME = "demo"
 OUTPUT_DIR = "data/extracted_data"
 
+# Analysis job settings (per instance)
+# Each analysis runs MoveNet + YOLO on the whole video, so keep this at the
+# number of analyses the instance can hold in memory at once.
+MAX_CONCURRENT_ANALYSES = int(os.getenv("MAX_CONCURRENT_ANALYSES", "1"))
+MAX_PENDING_JOBS = int(os.getenv("MAX_PENDING_JOBS", "8"))
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "3600"))
+
+# Result cache settings (repeat submissions of the same clip return the stored result)
+# "sqlite", "disk" or "none"
+RESULT_CACHE_BACKEND = os.getenv("RESULT_CACHE_BACKEND", "sqlite")
+RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", "data/result_cache")
+# Must stay below the 7-day expiry of the signed URLs stored in the results
+RESULT_CACHE_TTL_SECONDS = int(os.getenv("RESULT_CACHE_TTL_SECONDS", str(24 * 3600)))
+# Bump when pipeline code changes its output (analysis config files and model weights are hashed into
+# the cache key automatically), so older cached results are not served
+PIPELINE_VERSION = os.getenv("PIPELINE_VERSION", "1")
+
 # Pose detection settings
 POSE_CONFIDENCE_THRESHOLD = 0.3
 
@@ -8,6 +8,8 @@ them with synthetic NBA player motion profiles.
 
 import os
 import sys
+import asyncio
+from typing import Dict, Optional
 # Add current directory to path for imports
 # sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -18,10 +20,23 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
 
-from backend.services.analysis_service import compare_with_player_service, auto_compare_service
+from backend.services.analysis_service import (save_upload_to_temp, compare_with_player_from_path,
+                                               auto_compare_from_path, is_complete_result)
+from backend.services.job_service import job_manager, JobQueueFullError
+from backend.services.model_pool import model_pool
+from backend.services.result_cache import result_cache
+from backend.config import PLAYER_IDS
+from shooting_comparison.reference_feature_store import reference_feature_store
+from shooting_comparison.dtw_analysis.plot_renderer import normalize_plot_options, plot_renderer
 
 from backend.services.twilio_service import send_sms
+from analysis_logging import configure_logging
+
+# Analysis logs: warnings and errors only, as JSON lines (ANALYSIS_LOG_LEVEL / ANALYSIS_LOG_LEVELS /
+# ANALYSIS_LOG_FORMAT override this, e.g. ANALYSIS_LOG_LEVELS="shot_detection=DEBUG" when debugging)
+configure_logging(level="WARNING", log_format="json")
 
 app = FastAPI(
     title="Basketball Form Analyzer - Synthetic Profiles Integration",
@@ -51,17 +66,145 @@ visualized_video_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "
 # async def analyze_video(video: UploadFile = File(...)):
 #     return JSONResponse(content=analyze_video_service(video))
 
+@app.on_event("startup")
+async def warm_model_pool():
+    # Load MoveNet/YOLO and the comparison analyzers once, before the first request
+    await run_in_threadpool(model_pool.warm_up)
+    # Player reference analyses are normally built ahead of deploy; build any that are missing
+    await run_in_threadpool(reference_feature_store.build, [f"output_dir/{player_id}" for player_id in PLAYER_IDS])
+    # Start the DTW plot render workers (spawned processes take a few seconds to import matplotlib)
+    await run_in_threadpool(plot_renderer.warm_up)
+
+@app.on_event("shutdown")
+def stop_plot_renderer():
+    plot_renderer.shutdown()
+
+def _submit_analysis(job_type: str, video_path: str, fn, *args, cache_key: Optional[str] = None) -> str:
+    if cache_key is not None:
+        fn = _caching(fn, cache_key)
+    try:
+        return job_manager.submit(job_type, fn, video_path, *args)
+    except JobQueueFullError as e:
+        os.unlink(video_path)
+        raise HTTPException(status_code=429, detail=f"Analysis queue is full, retry later ({e})")
+
+def _caching(fn, cache_key: str):
+    # Store the finished response so a repeat upload of the same clip is served from the cache;
+    # incomplete ones (failed LLM call, missing upload) are not cached so a retry can fix them
+    def run(*args, **kwargs):
+        result = fn(*args, **kwargs)
+        if is_complete_result(result):
+            result_cache.set(cache_key, result)
+        else:
+            print("⚠️ Incomplete analysis response, not cached")
+        return result
+    return run
+
+async def _cached_result(job_type: str, video_path: str, **params):
+    """
+    Look up an uploaded video in the result cache.
+
+    Args:
+        job_type: Request type
+        video_path: Uploaded video
+        **params: Request parameters that change the result
+
+    Returns:
+        Tuple of (cache key, cached result or None); the key is None when caching is disabled
+    """
+    if not result_cache.enabled:
+        return None, None
+    cache_key = await run_in_threadpool(result_cache.make_key, video_path, job_type, **params)
+    result = await run_in_threadpool(result_cache.get, cache_key)
+    if result is not None:
+        os.unlink(video_path)  # Not analyzed, so nothing else cleans it up
+    return cache_key, result
+
+def _plot_options(plot_width: Optional[int], plot_format: Optional[str]) -> Dict:
+    # Validate before the upload is queued, so a bad size/format fails fast with 400
+    try:
+        width, image_format = normalize_plot_options(plot_width, plot_format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"width": width, "image_format": image_format}
+
+async def _run_analysis(job_type: str, video: UploadFile, fn, *args, cache_params: Dict) -> JSONResponse:
+    # The analysis runs on the job pool so the event loop stays free for other requests
+    video_path = await run_in_threadpool(save_upload_to_temp, video)
+    cache_key, cached = await _cached_result(job_type, video_path, **cache_params)
+    if cached is not None:
+        return JSONResponse(content=cached, headers={"X-Result-Cache": "hit"})
+    job_id = _submit_analysis(job_type, video_path, fn, *args, cache_key=cache_key)
+    result = await asyncio.wrap_future(job_manager.get_future(job_id))
+    return JSONResponse(content=result, headers={"X-Result-Cache": "miss"})
+
+async def _queue_analysis(job_type: str, video: UploadFile, fn, *args, cache_params: Dict) -> JSONResponse:
+    video_path = await run_in_threadpool(save_upload_to_temp, video)
+    cache_key, cached = await _cached_result(job_type, video_path, **cache_params)
+    if cached is not None:
+        job_id = job_manager.add_completed(job_type, cached)
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status": "succeeded"},
+                            headers={"X-Result-Cache": "hit"})
+    job_id = _submit_analysis(job_type, video_path, fn, *args, cache_key=cache_key)
+    return JSONResponse(status_code=202, content={"job_id": job_id, "status": "queued"},
+                        headers={"X-Result-Cache": "miss"})
+
 @app.post("/analysis/compare-with-player")
 async def compare_with_player(
     video: UploadFile = File(...),
     player_id: str = Form(...),
-    player_style: str = Form(...)
+    player_style: str = Form(...),
+    plot_width: Optional[int] = Form(None),
+    plot_format: Optional[str] = Form(None),
+    multi_shot: bool = Form(False)
 ):
-    return JSONResponse(content=compare_with_player_service(video, player_id, player_style))
+    plot_options = _plot_options(plot_width, plot_format)
+    return await _run_analysis("compare-with-player", video, compare_with_player_from_path,
+                               player_id, player_style, plot_options, multi_shot,
+                               cache_params={"player_id": player_id, "player_style": player_style,
+                                             "plot_options": plot_options, "multi_shot": multi_shot})
 
 @app.post("/analysis/auto")
-async def auto_compare(video: UploadFile = File(...)):
-    return JSONResponse(content=auto_compare_service(video))
+async def auto_compare(
+    video: UploadFile = File(...),
+    plot_width: Optional[int] = Form(None),
+    plot_format: Optional[str] = Form(None)
+):
+    plot_options = _plot_options(plot_width, plot_format)
+    return await _run_analysis("auto", video, auto_compare_from_path, plot_options,
+                               cache_params={"plot_options": plot_options})
+
+@app.post("/jobs/compare-with-player")
+async def submit_compare_with_player(
+    video: UploadFile = File(...),
+    player_id: str = Form(...),
+    player_style: str = Form(...),
+    plot_width: Optional[int] = Form(None),
+    plot_format: Optional[str] = Form(None),
+    multi_shot: bool = Form(False)
+):
+    plot_options = _plot_options(plot_width, plot_format)
+    return await _queue_analysis("compare-with-player", video, compare_with_player_from_path,
+                                 player_id, player_style, plot_options, multi_shot,
+                                 cache_params={"player_id": player_id, "player_style": player_style,
+                                               "plot_options": plot_options, "multi_shot": multi_shot})
+
+@app.post("/jobs/auto")
+async def submit_auto_compare(
+    video: UploadFile = File(...),
+    plot_width: Optional[int] = Form(None),
+    plot_format: Optional[str] = Form(None)
+):
+    plot_options = _plot_options(plot_width, plot_format)
+    return await _queue_analysis("auto", video, auto_compare_from_path, plot_options,
+                                 cache_params={"plot_options": plot_options})
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    job = job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JSONResponse(content=job)
 
 @app.post("/send-sms")
 async def send_sms_endpoint(request: Request):
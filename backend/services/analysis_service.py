@@ -4,15 +4,14 @@ import shutil
 import math
 from datetime import datetime
 from fastapi import UploadFile, HTTPException
-from typing import Dict
+from typing import Callable, Dict, Optional
 import json
 
 from shooting_comparison.analysis_interpreter import AnalysisInterpreter
-from shooting_comparison.enhanced_pipeline import EnhancedShootingComparisonPipeline
 from backend.routes.llm_routes import LLMService
 from backend.config import PLAYER_IDS, PLAYERS
-from backend.services.storage_service import storage_service
-from basketball_shooting_integrated_pipeline import BasketballShootingIntegratedPipeline
+from backend.services.upload_service import upload_manager, UploadBatch
+from backend.services.model_pool import model_pool, PipelineSlot
 ANALYSIS_AVAILABLE = True 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -113,15 +112,76 @@ def user_video_replay(video_path: str):
     except Exception as e:
         print(f"Error loading normalized data: {e}")
 
+def save_upload_to_temp(video: UploadFile) -> str:
+    """Copy an uploaded video to a temporary file and return its path"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
+        shutil.copyfileobj(video.file, tmp_file)
+        return tmp_file.name
+
+def _report_stage(progress_callback: Optional[Callable[[str], None]], stage: str):
+    if progress_callback is not None:
+        progress_callback(stage)
+
+# DTW comparison plots uploaded with every result
+PLOT_KEYS = ['ball_trajectory', 'wrist_trajectory', 'elbow_angle', 'hip_stability']
+
+def _start_uploads(plot_paths: Dict[str, str], analyzed_video_path: str) -> UploadBatch:
+    """Upload the plots and the analyzed video concurrently (local files are removed once uploaded)"""
+    uploads = upload_manager.batch()
+    for key in PLOT_KEYS:
+        if key in plot_paths:
+            uploads.submit(key, plot_paths[key], kind="image")
+    uploads.submit("analyzed_video", analyzed_video_path, kind="video")
+    return uploads
+
+def _collect_uploads(uploads: UploadBatch):
+    """Wait for a job's uploads; returns (plot URLs, analyzed video URL)"""
+    urls = uploads.results()
+    uploaded_plots = {key: urls[key] for key in PLOT_KEYS if key in urls}
+    return uploaded_plots, urls["analyzed_video"]
+
+def is_complete_result(results: Dict) -> bool:
+    """
+    Whether a response has every part the app shows (LLM feedback, all plot URLs, the analyzed video URL).
+    Degraded responses (e.g. the LLM call failed and returned None) must not be cached.
+    """
+    plots = results.get("plots") or {}
+    return (results.get("llm_response") is not None
+            and all(plots.get(key) for key in PLOT_KEYS)
+            and bool(results.get("analyzed_video_path")))
+
 def compare_with_player_service(video: UploadFile, player_id: str, player_style: str):
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-            shutil.copyfileobj(video.file, tmp_file)
-            video_path = tmp_file.name
+    video_path = save_upload_to_temp(video)
+    return compare_with_player_from_path(video_path, player_id, player_style)
+
+def compare_with_player_from_path(video_path: str, player_id: str, player_style: str,
+                                  plot_options: Optional[Dict] = None, multi_shot: bool = False,
+                                  progress_callback: Optional[Callable[[str], None]] = None):
+    """
+    Analyze a saved video and compare it with one player profile
+
+    Args:
+        video_path: Temporary video file (removed once analysis is done)
+        player_id: Player profile to compare against
+        player_style: Player style selected in the app
+        plot_options: DTW plot size/format ({'width': px, 'image_format': 'png'|'webp'|'jpg'})
+        multi_shot: Compare every detected shot and report per-shot scores and consistency
+            (the response's comparison_result/plots/LLM feedback are for the best shot)
+        progress_callback: Called with the stage name as each stage starts
+            (extract, segment, normalize, compare, llm, upload)
+    """
+    with model_pool.acquire() as slot:
+        return _compare_with_player(slot, video_path, player_id, player_style, plot_options, multi_shot,
+                                    progress_callback)
 
+def _compare_with_player(slot: PipelineSlot, video_path: str, player_id: str, player_style: str,
+                         plot_options: Optional[Dict], multi_shot: bool,
+                         progress_callback: Optional[Callable[[str], None]]):
+    try:
         if ANALYSIS_AVAILABLE:
-            pipeline = BasketballShootingIntegratedPipeline()
-            success = pipeline.run_full_pipeline(video_path, overwrite_mode=True, use_existing_extraction=False)
+            pipeline = slot.integrated_pipeline
+            success = pipeline.run_full_pipeline(video_path, overwrite_mode=True, use_existing_extraction=False,
+                                                 progress_callback=progress_callback)
             if success:
                 data = user_video_replay(video_path)
                 normalized_data = data.get("normalized_data", [])
@@ -131,43 +191,37 @@ def compare_with_player_service(video: UploadFile, player_id: str, player_style:
             user_result = mock_analyze_video(video_path)
 
         print("debug: User video analyzed")
-        enhanced_pipeline = EnhancedShootingComparisonPipeline()
+        _report_stage(progress_callback, "compare")
+        enhanced_pipeline = slot.comparison_pipeline
         synthetic_base_path = f"output_dir/{player_id.lower()}"
-        comparison_result = enhanced_pipeline.run_comparison(
-            video_path, synthetic_base_path, save_results=True, include_dtw=True, create_visualizations=True, enable_shot_selection=False
-        )
+        shot_comparison = None
+        if multi_shot:
+            # All shots of the clip are scored in parallel; plots are rendered for the best shot
+            shot_comparison = enhanced_pipeline.compare_shots(
+                video_path, synthetic_base_path, save_results=True, create_visualizations=True,
+                plot_options=plot_options
+            )
+            if 'error' in shot_comparison:
+                raise RuntimeError(shot_comparison['error'])
+            comparison_result = shot_comparison.pop("best_result")
+        else:
+            comparison_result = enhanced_pipeline.run_comparison(
+                video_path, synthetic_base_path, save_results=True, include_dtw=True, create_visualizations=True, enable_shot_selection=False,
+                plot_options=plot_options
+            )
         os.unlink(video_path)
         metadata = comparison_result.get("metadata", {})
         plot_paths = metadata.get("visualizations", {})
-        uploaded_plots = {}
-        
-        if 'ball_trajectory' in plot_paths:
-            uploaded_plots['ball_trajectory'] = storage_service.upload_comparison_image(
-                plot_paths['ball_trajectory']
-            )
-            os.remove(plot_paths['ball_trajectory'])  # Cleanup local file
-        
-        if 'wrist_trajectory' in plot_paths:
-            uploaded_plots['wrist_trajectory'] = storage_service.upload_comparison_image(
-                plot_paths['wrist_trajectory']
-            )
-            os.remove(plot_paths['wrist_trajectory'])
-        
-        if 'elbow_angle' in plot_paths:
-            uploaded_plots['elbow_angle'] = storage_service.upload_comparison_image(
-                plot_paths['elbow_angle']
-            )
-            os.remove(plot_paths['elbow_angle'])
-        
-        if 'hip_stability' in plot_paths:
-            uploaded_plots['hip_stability'] = storage_service.upload_comparison_image(
-                plot_paths['hip_stability']
-            )
-            os.remove(plot_paths['hip_stability'])
-                
-        interpretation = comparison_result.get("interpretation", "No interpretation available")
+
         output_dir = os.path.abspath(os.path.join(CURRENT_DIR, "../../shooting_comparison/results"))
         video_output_dir = os.path.abspath(os.path.join(CURRENT_DIR, "../../data/visualized_video"))
+        file_name = os.path.basename(video_path)
+        base_name = os.path.splitext(file_name)[0]
+        # Uploads run while the LLM response is generated
+        uploads = _start_uploads(plot_paths, os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
+
+        _report_stage(progress_callback, "llm")
+        interpretation = comparison_result.get("interpretation", "No interpretation available")
         interpreter = AnalysisInterpreter()
         llm_prompt = interpreter.generate_llm_prompt(interpretation)
         prompt_file_name = f"llm_prompt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
@@ -180,16 +234,12 @@ def compare_with_player_service(video: UploadFile, player_id: str, player_style:
         print("debug: Generating LLM response")
         llm_response = llm_service.generate_response()
         print("debug: LLM response generated")
-        file_name = os.path.basename(video_path)
-        base_name = os.path.splitext(file_name)[0]
+
+        _report_stage(progress_callback, "upload")
+        uploaded_plots, video_public_url = _collect_uploads(uploads)
         # image_rel_path = f"dtw_viz_{base_name}_vs_{player_id}/trajectory_comparison.png"
         # image_path = f"/results/{image_rel_path}"
         # image_public_url = storage_service.upload_comparison_image(os.path.join(output_dir, image_rel_path))
-        video_public_url = storage_service.upload_analyzed_video(os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
-        #delete the local video file after upload
-        os.remove(os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
-        #delete the local image file after upload
-        # os.remove(os.path.join(output_dir, image_rel_path))
         results = {
             "comparison_result": comparison_result,
             "llm_response": llm_response,
@@ -199,6 +249,8 @@ def compare_with_player_service(video: UploadFile, player_id: str, player_style:
             "selectedPlayer": PLAYERS.get(player_id, {}),
             "analyzed_video_path": video_public_url,
         }
+        if shot_comparison is not None:
+            results["shot_comparison"] = shot_comparison
 
         results = clean_floats(results)
         return results
@@ -207,14 +259,30 @@ def compare_with_player_service(video: UploadFile, player_id: str, player_style:
         raise HTTPException(status_code=500, detail=f"Comparison failed: {str(e)}")
 
 def auto_compare_service(video: UploadFile):
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-            shutil.copyfileobj(video.file, tmp_file)
-            video_path = tmp_file.name
+    video_path = save_upload_to_temp(video)
+    return auto_compare_from_path(video_path)
+
+def auto_compare_from_path(video_path: str, plot_options: Optional[Dict] = None,
+                           progress_callback: Optional[Callable[[str], None]] = None):
+    """
+    Analyze a saved video and compare it with every player profile, keeping the best match
+
+    Args:
+        video_path: Temporary video file (removed once analysis is done)
+        plot_options: DTW plot size/format ({'width': px, 'image_format': 'png'|'webp'|'jpg'})
+        progress_callback: Called with the stage name as each stage starts
+            (extract, segment, normalize, compare, llm, upload)
+    """
+    with model_pool.acquire() as slot:
+        return _auto_compare(slot, video_path, plot_options, progress_callback)
 
+def _auto_compare(slot: PipelineSlot, video_path: str, plot_options: Optional[Dict],
+                  progress_callback: Optional[Callable[[str], None]]):
+    try:
         if ANALYSIS_AVAILABLE:
-            pipeline = BasketballShootingIntegratedPipeline()
-            success = pipeline.run_full_pipeline(video_path, overwrite_mode=True, use_existing_extraction=False)
+            pipeline = slot.integrated_pipeline
+            success = pipeline.run_full_pipeline(video_path, overwrite_mode=True, use_existing_extraction=False,
+                                                 progress_callback=progress_callback)
             if success:
                 data = user_video_replay(video_path)
                 normalized_data = data.get("normalized_data", [])
@@ -222,39 +290,34 @@ def auto_compare_service(video: UploadFile):
         else:
             user_result = mock_analyze_video(video_path)
         print("debug: User video analyzed")
-        enhanced_pipeline = EnhancedShootingComparisonPipeline()
-        best_overall_score = -1
-        best_comparison_result = None
-        best_player_id = None
-        best_interpretation = None
+        _report_stage(progress_callback, "compare")
+        enhanced_pipeline = slot.comparison_pipeline
         output_dir = os.path.abspath(os.path.join(CURRENT_DIR, "../../shooting_comparison/results"))
         video_output_dir = os.path.abspath(os.path.join(CURRENT_DIR, "../../data/visualized_video"))
-        plot_paths = {}
-        for player_id in PLAYER_IDS:
-        
-            synthetic_base_path = f"output_dir/{player_id.lower()}"
-            comparison_result = enhanced_pipeline.run_comparison(
-                video_path, synthetic_base_path, save_results=True, include_dtw=True, create_visualizations=True, enable_shot_selection=False
-            )
-            # os.unlink(video_path)
-            print("debug: Comparison result obtained")
-            interpretation = comparison_result.get("interpretation", "No interpretation available")
-
-            dtw_analysis = comparison_result.get("dtw_analysis", {})
-            overall_score = dtw_analysis.get("overall_similarity", 0)
-            print("[DEBUG]: overall_score", overall_score)
-            print("[DEBUG]: player_id", player_id)
-            if overall_score > best_overall_score:
-                best_overall_score = overall_score
-                best_comparison_result = comparison_result
-                best_player_id = player_id
-                best_interpretation = interpretation
-                metadata = comparison_result.get("metadata", {})
-                plot_paths = metadata.get("visualizations", {})
+        # User side is analyzed once; plots are only rendered for the best matching player
+        player_paths = {f"output_dir/{player_id.lower()}": player_id for player_id in PLAYER_IDS}
+        one_to_many_result = enhanced_pipeline.compare_one_to_many(
+            video_path, list(player_paths.keys()), save_results=True, create_visualizations=True,
+            plot_options=plot_options
+        )
+        if 'error' in one_to_many_result:
+            raise RuntimeError(one_to_many_result['error'])
+        print("debug: Comparison result obtained")
+        best_comparison_result = one_to_many_result["best_result"]
+        best_player_id = player_paths[one_to_many_result["best_reference"]]
+        best_overall_score = one_to_many_result["scores"][one_to_many_result["best_reference"]]
+        best_interpretation = best_comparison_result.get("interpretation", "No interpretation available")
+        metadata = best_comparison_result.get("metadata", {})
+        plot_paths = metadata.get("visualizations", {})
 
         os.unlink(video_path)
         print(plot_paths)
         print("debug: best overall score", best_overall_score)
+        file_name = os.path.basename(video_path)
+        base_name = os.path.splitext(file_name)[0]
+        # Uploads run while the LLM response is generated
+        uploads = _start_uploads(plot_paths, os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
+        _report_stage(progress_callback, "llm")
         interpreter = AnalysisInterpreter()
         llm_prompt = interpreter.generate_llm_prompt(best_interpretation)
         prompt_file_name = f"llm_prompt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
@@ -269,43 +332,11 @@ def auto_compare_service(video: UploadFile):
         # print("debug: Generating LLM response")
         llm_response = llm_service.generate_response()
         # print("debug: LLM response generated")
-        file_name = os.path.basename(video_path)
-        base_name = os.path.splitext(file_name)[0]
         # image_rel_path = f"dtw_viz_{base_name}_vs_{player_id}/trajectory_comparison.png"
         # image_path = f"/results/{image_rel_path}"
         # image_public_url = storage_service.upload_comparison_image(os.path.join(output_dir, image_rel_path))
-        uploaded_plots = {}
-        
-        if 'ball_trajectory' in plot_paths:
-            uploaded_plots['ball_trajectory'] = storage_service.upload_comparison_image(
-                plot_paths['ball_trajectory']
-            )
-            os.remove(plot_paths['ball_trajectory'])  # Cleanup local file
-        
-        if 'wrist_trajectory' in plot_paths:
-            uploaded_plots['wrist_trajectory'] = storage_service.upload_comparison_image(
-                plot_paths['wrist_trajectory']
-            )
-            os.remove(plot_paths['wrist_trajectory'])
-        
-        if 'elbow_angle' in plot_paths:
-            uploaded_plots['elbow_angle'] = storage_service.upload_comparison_image(
-                plot_paths['elbow_angle']
-            )
-            os.remove(plot_paths['elbow_angle'])
-        
-        if 'hip_stability' in plot_paths:
-            uploaded_plots['hip_stability'] = storage_service.upload_comparison_image(
-                plot_paths['hip_stability']
-            )
-            os.remove(plot_paths['hip_stability'])
-        
-
-        video_public_url = storage_service.upload_analyzed_video(os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
-        #delete the local video file after upload
-        os.remove(os.path.join(video_output_dir, f"{base_name}_original_analyzed.mp4"))
-        #delete the local image file after upload
-        # os.remove(os.path.join(output_dir, image_rel_path))
+        _report_stage(progress_callback, "upload")
+        uploaded_plots, video_public_url = _collect_uploads(uploads)
     
         # print("debug: Image path set to", image_path)
         results = {
@@ -0,0 +1,163 @@
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from backend.config import MAX_CONCURRENT_ANALYSES, MAX_PENDING_JOBS, JOB_RESULT_TTL_SECONDS
+
+# Stages reported by the analysis services, in execution order
+JOB_STAGES = ["extract", "segment", "normalize", "compare", "llm", "upload"]
+
+
+class JobQueueFullError(Exception):
+    """Raised when the instance already holds MAX_PENDING_JOBS unfinished jobs"""
+
+
+class AnalysisJobManager:
+    """
+    Bounded worker pool for video analysis jobs.
+
+    Analyses are CPU/memory heavy, so at most `max_workers` run at a time on
+    this instance; further jobs wait in the executor queue up to `max_pending`.
+    """
+
+    def __init__(self, max_workers: int = MAX_CONCURRENT_ANALYSES,
+                 max_pending: int = MAX_PENDING_JOBS,
+                 result_ttl: int = JOB_RESULT_TTL_SECONDS):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="analysis")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict] = {}
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, job_type: str, fn: Callable, *args, **kwargs) -> str:
+        """
+        Queue an analysis function.
+
+        Args:
+            job_type: Label returned to clients (e.g. "compare-with-player", "auto")
+            fn: Service function accepting a `progress_callback` keyword argument
+            *args, **kwargs: Arguments forwarded to fn
+
+        Returns:
+            job_id
+        """
+        with self._lock:
+            self._expire_finished()
+            unfinished = sum(1 for job in self._jobs.values() if job["status"] in ("queued", "running"))
+            if unfinished >= self.max_pending:
+                raise JobQueueFullError(f"{unfinished} analyses already queued or running")
+
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "type": job_type,
+                "status": "queued",
+                "stage": None,
+                "stages_completed": [],
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "result": None,
+            }
+            self._futures[job_id] = self._executor.submit(self._run, job_id, fn, *args, **kwargs)
+        return job_id
+
+    def add_completed(self, job_type: str, result: Dict) -> str:
+        """
+        Register an already finished job (e.g. a result served from the result cache).
+
+        Args:
+            job_type: Label returned to clients
+            result: Job result
+
+        Returns:
+            job_id
+        """
+        now = time.time()
+        future = Future()
+        future.set_result(result)
+        with self._lock:
+            self._expire_finished()
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "type": job_type,
+                "status": "succeeded",
+                "stage": None,
+                "stages_completed": list(JOB_STAGES),
+                "created_at": now,
+                "started_at": now,
+                "finished_at": now,
+                "error": None,
+                "result": result,
+            }
+            self._futures[job_id] = future
+        return job_id
+
+    def _run(self, job_id: str, fn: Callable, *args, **kwargs):
+        with self._lock:
+            job = self._jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = time.time()
+
+        try:
+            result = fn(*args, progress_callback=lambda stage: self._set_stage(job_id, stage), **kwargs)
+        except Exception as e:
+            with self._lock:
+                job["status"] = "failed"
+                job["error"] = getattr(e, "detail", None) or str(e)
+                job["finished_at"] = time.time()
+            raise
+
+        with self._lock:
+            if job["stage"] and job["stage"] not in job["stages_completed"]:
+                job["stages_completed"].append(job["stage"])
+            job["status"] = "succeeded"
+            job["result"] = result
+            job["finished_at"] = time.time()
+        return result
+
+    def _set_stage(self, job_id: str, stage: str):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if job["stage"] and job["stage"] not in job["stages_completed"]:
+                job["stages_completed"].append(job["stage"])
+            job["stage"] = stage
+
+    def _expire_finished(self):
+        # Caller holds self._lock
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job["finished_at"] is not None and now - job["finished_at"] > self.result_ttl]
+        for job_id in expired:
+            self._jobs.pop(job_id, None)
+            self._futures.pop(job_id, None)
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Return a snapshot of the job status, or None if unknown/expired"""
+        with self._lock:
+            self._expire_finished()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = {key: value for key, value in job.items() if key != "result"}
+            snapshot["stages_completed"] = list(job["stages_completed"])
+            snapshot["progress"] = len(snapshot["stages_completed"]) / len(JOB_STAGES)
+            if job["status"] == "succeeded":
+                snapshot["progress"] = 1.0
+                snapshot["result"] = job["result"]
+            return snapshot
+
+    def get_future(self, job_id: str) -> Optional[Future]:
+        with self._lock:
+            return self._futures.get(job_id)
+
+
+job_manager = AnalysisJobManager()
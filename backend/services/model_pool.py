@@ -0,0 +1,78 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from backend.config import MAX_CONCURRENT_ANALYSES
+from basketball_shooting_integrated_pipeline import BasketballShootingIntegratedPipeline
+from shooting_comparison.enhanced_pipeline import EnhancedShootingComparisonPipeline
+
+
+class PipelineSlot:
+    """
+    One warm set of pipelines (MoveNet + YOLO + comparison analyzers).
+    A slot is used by a single request at a time; per-request state is reset on checkout.
+    """
+
+    def __init__(self):
+        self.integrated_pipeline = BasketballShootingIntegratedPipeline()
+        self.comparison_pipeline = EnhancedShootingComparisonPipeline()
+
+    def reset(self):
+        self.integrated_pipeline.reset_run_state()
+
+
+class ModelPool:
+    """
+    Pool of warm pipeline slots shared across backend requests.
+
+    Models are loaded once (at startup via warm_up, or lazily on first use) instead of
+    per request. The pool size matches MAX_CONCURRENT_ANALYSES, so a job always finds a slot.
+    """
+
+    def __init__(self, size: int = MAX_CONCURRENT_ANALYSES):
+        self.size = max(1, size)
+        self._slots: "queue.Queue[PipelineSlot]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Load every slot up front so the first requests do not pay model load time"""
+        with self._lock:
+            while self._created < self.size:
+                self._slots.put(PipelineSlot())
+                self._created += 1
+        print(f"✅ Model pool warmed: {self.size} slot(s)")
+
+    def _get_slot(self) -> PipelineSlot:
+        try:
+            return self._slots.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if not create:
+            return self._slots.get()
+        try:
+            return PipelineSlot()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    @contextmanager
+    def acquire(self):
+        """Check out a slot for one request; it is returned to the pool afterwards"""
+        slot = self._get_slot()
+        try:
+            slot.reset()
+            yield slot
+        finally:
+            self._slots.put(slot)
+
+
+model_pool = ModelPool()
@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from backend.config import (RESULT_CACHE_BACKEND, RESULT_CACHE_PATH, RESULT_CACHE_TTL_SECONDS,
+                            PIPELINE_VERSION, PLAYER_IDS)
+# Shared with the extraction cache, which then reuses the upload's hash instead of reading it again
+from extraction_cache import file_sha256, model_fingerprint
+from pose_extraction.pose_model_layer import MOVENET_MODEL_PATH
+from ball_extraction.ball_detection_layer import YOLO_MODEL_PATH
+from shooting_comparison.reference_feature_store import compute_config_version
+
+
+class SQLiteResultStore:
+    """Results in one SQLite table (key, JSON value, expiry)"""
+
+    def __init__(self, path: str):
+        self.path = path if path.endswith(".sqlite") else os.path.join(path, "results.sqlite")
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Tuple[List, int]:
+        # One short-lived connection per call: requests and analysis jobs use the store from different threads
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:  # Commits on success
+                cursor = connection.execute(sql, params)
+                rows = cursor.fetchall()
+            return rows, cursor.rowcount
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> Optional[str]:
+        rows, _ = self._execute("SELECT value FROM results WHERE key = ? AND expires_at > ?", (key, time.time()))
+        return rows[0][0] if rows else None
+
+    def set(self, key: str, value: str, ttl: float):
+        self._execute("INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)",
+                      (key, value, time.time() + ttl))
+
+    def evict_expired(self) -> int:
+        _, deleted = self._execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        return deleted
+
+
+class DiskResultStore:
+    """Results as one JSON file per key ({"expires_at": ..., "value": ...})"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry["expires_at"] <= time.time():
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: str, ttl: float):
+        # Write then rename, so readers never see a partial file
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"expires_at": time.time() + ttl, "value": value}, f)
+        os.replace(temp_path, path)
+
+    def evict_expired(self) -> int:
+        evicted = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            if self.get(key) is None:
+                try:
+                    os.remove(self._path(key))
+                    evicted += 1
+                except OSError:
+                    pass
+        return evicted
+
+
+class ResultCache:
+    """
+    Content-addressed cache of analysis responses.
+
+    The key is the SHA-256 of the uploaded video together with the request type,
+    its parameters (player, plot options) and the pipeline/config/model versions, so a
+    retried upload of the same clip gets the stored response (JSON and storage URLs)
+    instead of a new analysis.
+    """
+
+    # Entries are evicted at most this often (on writes)
+    EVICT_INTERVAL_SECONDS = 600
+
+    # Result store class per backend
+    STORES = {"sqlite": SQLiteResultStore, "disk": DiskResultStore}
+
+    def __init__(self, backend: str = RESULT_CACHE_BACKEND, path: str = RESULT_CACHE_PATH,
+                 ttl: float = RESULT_CACHE_TTL_SECONDS):
+        """
+        Args:
+            backend: "sqlite", "disk" or "none" (anything else disables caching)
+            path: SQLite file or directory for the store
+            ttl: Seconds a result is served for
+        """
+        self.backend = backend
+        self.path = path
+        self.ttl = ttl
+        self._store = None
+        self._store_lock = threading.Lock()
+        self._last_evict = 0.0
+        self._versions = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend in self.STORES
+
+    @property
+    def store(self):
+        """Store for the configured backend, created on first use (importing the backend writes nothing)"""
+        if self._store is None and self.enabled:
+            with self._store_lock:
+                if self._store is None:
+                    self._store = self.STORES[self.backend](self.path)
+        return self._store
+
+    def versions(self) -> Dict[str, str]:
+        """
+        Versions of everything a result depends on besides the request: PIPELINE_VERSION, the
+        analysis/DTW config files and the MoveNet/YOLO weights (computed once per process;
+        config and model changes take effect on restart)
+        """
+        if self._versions is None:
+            self._versions = {
+                "pipeline": PIPELINE_VERSION,
+                "config": compute_config_version(),
+                "movenet": model_fingerprint(MOVENET_MODEL_PATH),
+                "yolo": model_fingerprint(YOLO_MODEL_PATH)
+            }
+        return self._versions
+
+    def make_key(self, video_path: str, job_type: str, **params) -> str:
+        """
+        Cache key for an uploaded video and request parameters.
+
+        Args:
+            video_path: Uploaded video (hashed by content)
+            job_type: Request type ("compare-with-player", "auto")
+            **params: Request parameters that change the result (player_id, plot_options, ...)
+
+        Returns:
+            Hex key
+        """
+        key_data = json.dumps({
+            "video": file_sha256(video_path),
+            "type": job_type,
+            "params": params,
+            "versions": self.versions(),
+            "players": PLAYER_IDS
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+        try:
+            value = self.store.get(key)
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️ Result cache read failed: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, result: Dict):
+        if not self.enabled:
+            return
+        try:
+            self.store.set(key, json.dumps(result), self.ttl)
+            if time.time() - self._last_evict > self.EVICT_INTERVAL_SECONDS:
+                self._last_evict = time.time()
+                self.store.evict_expired()
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️ Result cache write failed: {e}")
+
+
+def create_result_cache(backend: str = RESULT_CACHE_BACKEND, path: str = RESULT_CACHE_PATH) -> ResultCache:
+    """Result cache for the configured backend ("sqlite", "disk" or "none"); the store is created lazily"""
+    return ResultCache(backend, path)
+
+
+result_cache = create_result_cache()
@@ -1,13 +1,51 @@
 import os
+import shutil
+import threading
 from pathlib import Path
-from google.cloud import storage
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import uuid
 from typing import Optional
 
+try:
+    from google.cloud import storage
+    from requests.adapters import HTTPAdapter
+    GCS_AVAILABLE = True
+    GCS_IMPORT_ERROR = None
+except ImportError as e:
+    GCS_AVAILABLE = False
+    GCS_IMPORT_ERROR = e
+
 load_dotenv()
 
+# "gcs" = Google Cloud Storage, "local" = copy into LOCAL_STORAGE_DIR (development/tests)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "gcs")
+LOCAL_STORAGE_DIR = os.getenv("LOCAL_STORAGE_DIR", "data/storage")
+LOCAL_STORAGE_BASE_URL = os.getenv("LOCAL_STORAGE_BASE_URL", "")  # Empty = file:// URLs
+# Uploads running at once (also the size of the shared GCS HTTP connection pool)
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "8"))
+# Files above the threshold are sent as resumable uploads in UPLOAD_CHUNK_SIZE chunks
+# (a multiple of 256 KB), so a dropped connection only resends the current chunk
+RESUMABLE_UPLOAD_THRESHOLD = int(os.getenv("RESUMABLE_UPLOAD_THRESHOLD", str(8 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+
+CONTENT_TYPES = {
+    '.mp4': 'video/mp4',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp'
+}
+
+
+def _unique_blob_name(local_file_path: str, destination_folder: str) -> str:
+    """destination_folder/<timestamp>_<random id><extension>"""
+    file_extension = Path(local_file_path).suffix
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    unique_id = uuid.uuid4().hex[:8]
+    return f"{destination_folder}/{timestamp}_{unique_id}{file_extension}"
+
+
 class StorageService:
     """Service for uploading files to Google Cloud Storage"""
     
@@ -24,32 +62,44 @@ class StorageService:
         
         self._client = None
         self._bucket = None
+        # Uploads run on several threads; the client/bucket are created once and shared
+        self._lock = threading.Lock()
+        self._signed_urls = None
 
     @property
     def client(self):
         """Lazy initialization of GCS client"""
-        if self._client is None:
-            # Client will automatically use GOOGLE_APPLICATION_CREDENTIALS if set
-            self._client = storage.Client(project=self.project_id)
-            print(f"Connected to GCS project: {self.project_id}")
+        with self._lock:
+            if self._client is None:
+                # Client will automatically use GOOGLE_APPLICATION_CREDENTIALS if set
+                client = storage.Client(project=self.project_id)
+                # One connection per concurrent upload instead of requests' default pool of 10
+                adapter = HTTPAdapter(pool_connections=UPLOAD_WORKERS, pool_maxsize=UPLOAD_WORKERS)
+                client._http.mount("https://", adapter)
+                self._client = client
+                print(f"Connected to GCS project: {self.project_id}")
         return self._client
 
     @property
     def bucket(self):
         """Lazy initialization of GCS bucket"""
-        if self._bucket is None:
-            self._bucket = self.client.bucket(self.bucket_name)
-            print(f"Connected to GCS bucket: {self.bucket_name}")
+        client = self.client
+        with self._lock:
+            if self._bucket is None:
+                self._bucket = client.bucket(self.bucket_name)
+                print(f"Connected to GCS bucket: {self.bucket_name}")
         return self._bucket
     
     def _can_generate_signed_urls(self) -> bool:
-        """Check if we can generate signed URLs (requires service account)"""
-        try:
-            # Try to access service account email (only available with service account creds)
-            _ = self.client._credentials.service_account_email
-            return True
-        except AttributeError:
-            return False
+        """Check if we can generate signed URLs (requires service account, checked once)"""
+        if self._signed_urls is None:
+            try:
+                # Try to access service account email (only available with service account creds)
+                _ = self.client._credentials.service_account_email
+                self._signed_urls = True
+            except AttributeError:
+                self._signed_urls = False
+        return self._signed_urls
     
     def upload_file(
         self, 
@@ -68,23 +118,14 @@ class StorageService:
             
             # Generate unique filename
             file_extension = Path(local_file_path).suffix
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            unique_id = uuid.uuid4().hex[:8]
-            filename = f"{timestamp}_{unique_id}{file_extension}"
-            blob_name = f"{destination_folder}/{filename}"
+            blob_name = _unique_blob_name(local_file_path, destination_folder)
             
-            # Create blob and upload
-            blob = self.bucket.blob(blob_name)
+            # Create blob and upload (large files, i.e. analyzed videos, as chunked resumable uploads)
+            chunk_size = UPLOAD_CHUNK_SIZE if os.path.getsize(local_file_path) > RESUMABLE_UPLOAD_THRESHOLD else None
+            blob = self.bucket.blob(blob_name, chunk_size=chunk_size)
             
             # Set content type
-            if content_type:
-                blob.content_type = content_type
-            elif file_extension == '.mp4':
-                blob.content_type = 'video/mp4'
-            elif file_extension == '.png':
-                blob.content_type = 'image/png'
-            elif file_extension in ['.jpg', '.jpeg']:
-                blob.content_type = 'image/jpeg'
+            blob.content_type = content_type or CONTENT_TYPES.get(file_extension.lower())
             
             # Upload file
             blob.upload_from_filename(local_file_path)
@@ -118,11 +159,10 @@ class StorageService:
             raise
     
     def upload_comparison_image(self, local_path: str) -> str:
-        """Upload comparison visualization image"""
+        """Upload comparison visualization image (content type from the extension: png/webp/jpg)"""
         return self.upload_file(
             local_path, 
             destination_folder='comparison-images',
-            content_type='image/png',
             url_expiration_days=7
         )
     
@@ -161,5 +201,85 @@ class StorageService:
         except Exception as e:
             print(f"Cleanup failed: {e}")
 
+class LocalStorageService(StorageService):
+    """
+    Filesystem stand-in for StorageService (development and tests).
+
+    Files are copied into LOCAL_STORAGE_DIR/<folder>/ under the same unique names
+    GCS uploads use; URLs are LOCAL_STORAGE_BASE_URL/<blob name> or file:// URLs.
+    """
+
+    def __init__(self, root_dir: str = LOCAL_STORAGE_DIR, base_url: str = LOCAL_STORAGE_BASE_URL):
+        self.root_dir = os.path.abspath(root_dir)
+        self.base_url = base_url.rstrip('/')
+        print(f"Using local storage: {self.root_dir}")
+
+    def upload_file(
+        self, 
+        local_file_path: str, 
+        destination_folder: str = 'results',
+        content_type: Optional[str] = None,
+        make_public: bool = True,
+        url_expiration_days: int = 7
+    ) -> str:
+        """
+        Copy file into the local storage directory and return its URL
+        """
+        if not os.path.exists(local_file_path):
+            raise FileNotFoundError(f"File not found: {local_file_path}")
+        
+        blob_name = _unique_blob_name(local_file_path, destination_folder)
+        destination = os.path.join(self.root_dir, blob_name)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copyfile(local_file_path, destination)
+        
+        url = f"{self.base_url}/{blob_name}" if self.base_url else Path(destination).as_uri()
+        print(f"Stored: {local_file_path}")
+        print(f"   → {url}")
+        return url
+
+    def delete_file(self, blob_name: str):
+        """Delete file from the local storage directory"""
+        try:
+            os.remove(os.path.join(self.root_dir, blob_name))
+            print(f"Deleted: {blob_name}")
+        except OSError as e:
+            print(f"Delete failed for {blob_name}: {e}")
+
+    def cleanup_old_files(self, max_age_days: int = 7):
+        """Delete files older than max_age_days"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).timestamp()
+        deleted_count = 0
+        for folder, _, files in os.walk(self.root_dir):
+            for name in files:
+                path = os.path.join(folder, name)
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    deleted_count += 1
+        print(f"Cleaned up {deleted_count} old files")
+
+
+def create_storage_service(backend: str = STORAGE_BACKEND) -> StorageService:
+    """
+    Storage for the configured backend.
+
+    Args:
+        backend: "local" for LocalStorageService; anything else uses Google Cloud Storage
+
+    Returns:
+        Storage service
+
+    Raises:
+        ImportError: GCS storage requested but google-cloud-storage is not installed
+    """
+    if backend == "local":
+        return LocalStorageService()
+    if not GCS_AVAILABLE:
+        raise ImportError(
+            f"google-cloud-storage is required for STORAGE_BACKEND={backend!r} "
+            "(set STORAGE_BACKEND=local to store files locally)"
+        ) from GCS_IMPORT_ERROR
+    return StorageService()
+
 # Singleton instance
-storage_service = StorageService()
\ No newline at end of file
+storage_service = create_storage_service()
\ No newline at end of file
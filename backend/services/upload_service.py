@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional
+
+from backend.services.storage_service import storage_service, StorageService, UPLOAD_WORKERS
+
+
+class UploadBatch:
+    """
+    Uploads of one analysis job.
+
+    Files are uploaded as soon as they are submitted, so the job can keep working
+    (e.g. wait for the LLM response) and collect the URLs afterwards with results().
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor, storage: StorageService):
+        self._executor = executor
+        self._storage = storage
+        self._uploads: Dict[str, Future] = {}
+
+    def submit(self, key: str, local_path: str, kind: str = "image", remove_after: bool = True) -> Future:
+        """
+        Start uploading a file.
+
+        Args:
+            key: Name of the artifact in results() (e.g. "ball_trajectory", "analyzed_video")
+            local_path: File to upload
+            kind: "image" (comparison image) or "video" (analyzed video)
+            remove_after: Delete the local file once it is uploaded
+
+        Returns:
+            Future resolving to the file's URL
+        """
+        upload = self._storage.upload_analyzed_video if kind == "video" else self._storage.upload_comparison_image
+        future = self._executor.submit(self._upload, upload, local_path, remove_after)
+        self._uploads[key] = future
+        return future
+
+    @staticmethod
+    def _upload(upload, local_path: str, remove_after: bool) -> str:
+        url = upload(local_path)
+        if remove_after:
+            os.remove(local_path)  # Cleanup local file
+        return url
+
+    def results(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        """
+        Wait for every upload of the batch.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            Dictionary of artifact key -> URL
+
+        Raises:
+            The first upload error, after all uploads have finished
+        """
+        done, not_done = wait(self._uploads.values(), timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} uploads still running after {timeout}s")
+        return {key: future.result() for key, future in self._uploads.items()}
+
+
+class UploadManager:
+    """
+    Shared upload pool for all analysis jobs.
+
+    At most `max_workers` uploads run at once on this instance; they share the
+    storage service's client and its HTTP connection pool.
+    """
+
+    def __init__(self, storage: StorageService = storage_service, max_workers: int = UPLOAD_WORKERS):
+        self.storage = storage
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="upload")
+
+    def batch(self) -> UploadBatch:
+        """New batch for one job's artifacts"""
+        return UploadBatch(self._executor, self.storage)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+# Singleton instance
+upload_manager = UploadManager()
@@ -9,8 +9,15 @@ import numpy as np
 from ultralytics import YOLO
 from typing import Dict, List, Tuple
 
+from analysis_logging import get_logger, log_progress
+
+logger = get_logger(__name__)
+
+# Default YOLOv8 ball/rim weights
+YOLO_MODEL_PATH = "ball_extraction/models/yolov8n736-customContinue.pt"
+
 class BallDetectionLayer:
-    def __init__(self, model_path: str = "ball_extraction/models/yolov8n736-customContinue.pt"):
+    def __init__(self, model_path: str = YOLO_MODEL_PATH):
         """
         Initialize basketball detection model
         
@@ -29,7 +36,8 @@ class BallDetectionLayer:
         except Exception as e:
             print(f"Model load failed: {e}")
             # Fallback to default YOLOv8 model
-            self.model = YOLO("yolov8n.pt")
+            self.model_path = "yolov8n.pt"
+            self.model = YOLO(self.model_path)
             print("Fallback to default YOLOv8 model")
 
     def _apply_aspect_ratio_correction(self, x: float, y: float, frame_h: int, frame_w: int) -> Tuple[float, float]:
@@ -54,6 +62,77 @@ class BallDetectionLayer:
         
         return corrected_x, y
 
+    def _parse_detection_result(self, result, h: int, w: int) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Convert one Ultralytics result (one frame) into ball and rim detection dicts
+        
+        All boxes of the frame are moved to NumPy once and normalized together;
+        only the final per-detection dicts are built in Python.
+        
+        Args:
+            result: Ultralytics Results object for a single frame
+            h: Frame height
+            w: Frame width
+            
+        Returns:
+            Tuple of (ball_detections, rim_detections)
+        """
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return [], []
+        
+        xyxy = boxes.xyxy.cpu().numpy()
+        confidences = boxes.conf.cpu().numpy()
+        class_ids = boxes.cls.cpu().numpy().astype(int)
+        aspect_ratio = w / h
+        
+        x1, y1, x2, y2 = xyxy[:, 0], xyxy[:, 1], xyxy[:, 2], xyxy[:, 3]
+        
+        # Normalize to 0~1 without padding correction
+        x1_rel = np.clip(x1 / w, 0, 1)
+        y1_rel = np.clip(y1 / h, 0, 1)
+        x2_rel = np.clip(x2 / w, 0, 1)
+        y2_rel = np.clip(y2 / h, 0, 1)
+
+        # movenet과 동일하게 x축에 aspect ratio 보정(곱하기)
+        x1_rel_corr = x1_rel * aspect_ratio
+        x2_rel_corr = x2_rel * aspect_ratio
+        center_x_rel_corr = (x1_rel_corr + x2_rel_corr) / 2
+        width_rel_corr = x2_rel_corr - x1_rel_corr
+
+        center_y_rel = (y1_rel + y2_rel) / 2
+        height_rel = y2_rel - y1_rel
+        
+        bboxes = np.stack([x1_rel_corr, y1_rel, x2_rel_corr, y2_rel], axis=1).tolist()
+        confidences = confidences.tolist()
+        center_x_list = center_x_rel_corr.tolist()
+        center_y_list = center_y_rel.tolist()
+        width_list = width_rel_corr.tolist()
+        height_list = height_rel.tolist()
+        pixel_width_list = (x2 - x1).tolist()
+        pixel_height_list = (y2 - y1).tolist()
+        
+        def build_detections(class_id: int) -> List[Dict]:
+            return [
+                {
+                    'bbox': bboxes[i],
+                    'confidence': confidences[i],
+                    'class_id': class_id,
+                    'center_x': center_x_list[i],
+                    'center_y': center_y_list[i],
+                    'width': width_list[i],
+                    'height': height_list[i],
+                    'pixel_width': pixel_width_list[i],
+                    'pixel_height': pixel_height_list[i]
+                }
+                for i in np.flatnonzero(class_ids == class_id)
+            ]
+        
+        # Class 0 = ball, class 2 = rim (class 1 is detected but not recorded)
+        ball_detections = build_detections(0)
+        rim_detections = build_detections(2)
+        return ball_detections, rim_detections
+
     def _detect_ball_and_rim_in_frame(self, frame: np.ndarray, conf_threshold: float = 0.15, 
                            classes: List[int] = [0, 1, 2], iou_threshold: float = 0.1) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -76,61 +155,43 @@ class BallDetectionLayer:
         
         # Get frame dimensions for normalization
         h, w = frame.shape[:2]
-        aspect_ratio = w / h
         
         for result in results:
-            boxes = result.boxes
-            if boxes is not None:
-                for box in boxes:
-                    x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                    confidence = box.conf[0].cpu().numpy()
-                    class_id = int(box.cls[0].cpu().numpy())
-                    
-                    # Normalize to 0~1 without padding correction
-                    x1_rel = np.clip(x1 / w, 0, 1)
-                    y1_rel = np.clip(y1 / h, 0, 1)
-                    x2_rel = np.clip(x2 / w, 0, 1)
-                    y2_rel = np.clip(y2 / h, 0, 1)
-
-                    # movenet과 동일하게 x축에 aspect ratio 보정(곱하기)
-                    x1_rel_corr = x1_rel * aspect_ratio
-                    x2_rel_corr = x2_rel * aspect_ratio
-                    center_x_rel_corr = (x1_rel_corr + x2_rel_corr) / 2
-                    width_rel_corr = x2_rel_corr - x1_rel_corr
-
-                    center_y_rel = (y1_rel + y2_rel) / 2
-                    height_rel = y2_rel - y1_rel
-
-                    if class_id == 0:
-                        ball_info = {
-                            'bbox': [float(x1_rel_corr), float(y1_rel), float(x2_rel_corr), float(y2_rel)],
-                            'confidence': float(confidence),
-                            'class_id': class_id,
-                            'center_x': float(center_x_rel_corr),
-                            'center_y': float(center_y_rel),
-                            'width': float(width_rel_corr),
-                            'height': float(height_rel),
-                            'pixel_width': float(x2 - x1),
-                            'pixel_height': float(y2 - y1)
-                        }
-                        ball_detections.append(ball_info)
-                    elif class_id == 2:
-                        rim_info = {
-                            'bbox': [float(x1_rel_corr), float(y1_rel), float(x2_rel_corr), float(y2_rel)],
-                            'confidence': float(confidence),
-                            'class_id': class_id,
-                            'center_x': float(center_x_rel_corr),
-                            'center_y': float(center_y_rel),
-                            'width': float(width_rel_corr),
-                            'height': float(height_rel),
-                            'pixel_width': float(x2 - x1),
-                            'pixel_height': float(y2 - y1)
-                        }  
-                        rim_detections.append(rim_info)
+            frame_balls, frame_rims = self._parse_detection_result(result, h, w)
+            ball_detections.extend(frame_balls)
+            rim_detections.extend(frame_rims)
         return ball_detections, rim_detections
 
+    def _detect_ball_and_rim_in_frames(self, frames: List[np.ndarray], conf_threshold: float = 0.15,
+                                       classes: List[int] = [0, 1, 2], iou_threshold: float = 0.1) -> List[Tuple[List[Dict], List[Dict]]]:
+        """
+        Detect ball and rim in a batch of frames with a single forward pass
+        
+        Args:
+            frames: Input frames (same resolution, in video order)
+            conf_threshold: Confidence threshold
+            classes: Classes to detect
+            iou_threshold: IoU threshold
+            
+        Returns:
+            List of (ball_detections, rim_detections), one entry per input frame
+        """
+        if not frames:
+            return []
+        
+        # Ultralytics returns one result per image, in input order
+        results = self.model(frames, conf=conf_threshold, classes=classes,
+                             iou=iou_threshold, imgsz=736, verbose=False)
+        
+        detections = []
+        for frame, result in zip(frames, results):
+            h, w = frame.shape[:2]
+            detections.append(self._parse_detection_result(result, h, w))
+        return detections
+
     def extract_ball_trajectory_and_rim_info_from_video(self, video_path: str, conf_threshold: float = 0.15,
-                                         classes: List[int] = [0, 1, 2], iou_threshold: float = 0.1) -> Tuple[List[Dict], List[Dict]]:
+                                         classes: List[int] = [0, 1, 2], iou_threshold: float = 0.1,
+                                         batch_size: int = 1) -> Tuple[List[Dict], List[Dict]]:
         """
         Extract basketball trajectory from video
         
@@ -139,6 +200,7 @@ class BallDetectionLayer:
             conf_threshold: Confidence threshold
             classes: Classes to detect
             iou_threshold: IoU threshold
+            batch_size: Number of decoded frames per YOLO forward pass (1 = per-frame inference)
             
         Returns:
             List of per-frame ball detection info
@@ -149,40 +211,51 @@ class BallDetectionLayer:
         cap = cv2.VideoCapture(video_path)
         fps = int(cap.get(cv2.CAP_PROP_FPS))
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        batch_size = max(1, int(batch_size))
         
-        print(f"Basketball trajectory extraction started: {total_frames} frames, {fps}fps")
+        print(f"Basketball trajectory extraction started: {total_frames} frames, {fps}fps, batch size {batch_size}")
         
         ball_trajectory = []
         rim_info = []
         frame_count = 0
+        pending_frames = []
         
         while True:
             ret, frame = cap.read()
-            if not ret:
+            if ret:
+                pending_frames.append(frame)
+                if len(pending_frames) < batch_size:
+                    continue
+            elif not pending_frames:
                 break
-                
-            frame_count += 1
-            print(f"Ball detection processing: {frame_count}/{total_frames}", end="\r")
             
-            # Detect ball in current frame
-            ball_detections, rim_detections = self._detect_ball_and_rim_in_frame(
-                frame, conf_threshold, classes, iou_threshold
+            # Run one forward pass over the collected frames and split results back per frame
+            batch_detections = self._detect_ball_and_rim_in_frames(
+                pending_frames, conf_threshold, classes, iou_threshold
             )
+            pending_frames = []
             
-            frame_data = {
-                "frame_number": frame_count,
-                "timestamp": frame_count / fps,
-                "ball_detections": ball_detections,
-                "ball_count": len(ball_detections)
-            }
-            rim_data = {
-                "frame_number": frame_count,
-                "timestamp": frame_count / fps,
-                "rim_detections": rim_detections,
-                "rim_count": len(rim_detections)
-            }
-            ball_trajectory.append(frame_data)
-            rim_info.append(rim_data)
+            for ball_detections, rim_detections in batch_detections:
+                frame_count += 1
+                frame_data = {
+                    "frame_number": frame_count,
+                    "timestamp": frame_count / fps,
+                    "ball_detections": ball_detections,
+                    "ball_count": len(ball_detections)
+                }
+                rim_data = {
+                    "frame_number": frame_count,
+                    "timestamp": frame_count / fps,
+                    "rim_detections": rim_detections,
+                    "rim_count": len(rim_detections)
+                }
+                ball_trajectory.append(frame_data)
+                rim_info.append(rim_data)
+            
+            log_progress(logger, "Ball detection processing", frame_count, total_frames)
+            
+            if not ret:
+                break
     
         cap.release()
         print(f"\nBasketball trajectory extraction complete: {len(ball_trajectory)} frames")
@@ -222,7 +295,7 @@ class BallDetectionLayer:
                 break
                 
             frame_count += 1
-            print(f"Ball detection processing: {frame_count}/{total_frames}", end="\r")
+            log_progress(logger, "Ball detection processing", frame_count, total_frames)
             
             # Detect ball in current frame with normalized coordinates
             ball_detections, rim_detections = self._detect_ball_and_rim_in_frame(
@@ -316,25 +389,39 @@ class BallDetectionLayer:
             std = 0
         
         for frame_data in ball_trajectory:
-            filtered_detections = []
-            
-            for detection in frame_data['ball_detections']:
-                if (detection['confidence'] >= min_confidence and 
-                    detection['width'] >= min_ball_size and 
-                    detection['height'] >= min_ball_size):
-                    filtered_detections.append(detection)
-            
-            filtered_frame = {
-                "frame_number": frame_data['frame_number'],
-                "timestamp": frame_data['timestamp'],
-                "ball_detections": filtered_detections,
-                "ball_count": len(filtered_detections)
-            }
-            filtered_trajectory.append(filtered_frame)
+            filtered_trajectory.append(self.filter_ball_frame(frame_data, min_confidence, min_ball_size))
         
         print(f"Ball detection filtering: {len(ball_trajectory)} -> {len(filtered_trajectory)} frames")
         return filtered_trajectory
 
+    def filter_ball_frame(self, frame_data: Dict, min_confidence: float = 0.3,
+                          min_ball_size: float = 10.0) -> Dict:
+        """
+        Filter one frame's ball detections (same criteria as filter_ball_detections)
+        
+        Args:
+            frame_data: Ball data for one frame
+            min_confidence: Minimum confidence
+            min_ball_size: Minimum ball size (pixels)
+            
+        Returns:
+            Filtered ball data for the frame
+        """
+        filtered_detections = []
+        
+        for detection in frame_data['ball_detections']:
+            if (detection['confidence'] >= min_confidence and 
+                detection['width'] >= min_ball_size and 
+                detection['height'] >= min_ball_size):
+                filtered_detections.append(detection)
+        
+        return {
+            "frame_number": frame_data['frame_number'],
+            "timestamp": frame_data['timestamp'],
+            "ball_detections": filtered_detections,
+            "ball_count": len(filtered_detections)
+        }
+
     def get_ball_statistics(self, ball_trajectory: List[Dict]) -> Dict:
         """Return ball detection statistics"""
         total_frames = len(ball_trajectory)
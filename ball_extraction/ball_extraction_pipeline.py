@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 Basketball Ball Extraction Integrated Pipeline
-Extracts only original absolute coordinates and saves as JSON
+Extracts only original absolute coordinates and saves them (columnar .npz, optional JSON export)
 """
 
 import os
@@ -10,20 +10,30 @@ from typing import Dict, List
 
 # Import layer modules
 from .ball_detection_layer import BallDetectionLayer
-from .ball_storage_layer import BallStorageLayer
+from .ball_storage_layer import BallStorageLayer, load_ball_original, load_rim_original
 
 class BallExtractionPipeline:
-    def __init__(self, model_path: str = "ball_extraction/models/yolov8n736-customContinue.pt", output_dir: str = "data"):
-        """Initialize ball extraction pipeline"""
+    def __init__(self, model_path: str = "ball_extraction/models/yolov8n736-customContinue.pt", output_dir: str = "data",
+                 export_json: bool = False):
+        """
+        Initialize ball extraction pipeline
+        
+        Args:
+            model_path: YOLO model path
+            output_dir: Directory for extracted data
+            export_json: Also write the original ball/rim data as JSON (the columnar .npz is always written)
+        """
         self.detection_layer = BallDetectionLayer(model_path)
         self.storage_layer = BallStorageLayer(output_dir)
+        self.export_json = export_json
         
         print("Ball extraction pipeline initialized")
         print("=" * 50)
 
     def extract_ball_trajectory(self, video_path: str, conf_threshold: float = 0.15,
                                classes: List[int] = [0, 1, 2], iou_threshold: float = 0.1,
-                               min_confidence: float = 0.3, min_ball_size: float = 0.01) -> str:
+                               min_confidence: float = 0.3, min_ball_size: float = 0.01,
+                               batch_size: int = 1) -> str:
         """
         Run ball extraction pipeline for original absolute coordinates
         
@@ -34,6 +44,7 @@ class BallExtractionPipeline:
             iou_threshold: IoU threshold
             min_confidence: Minimum confidence (for filtering)
             min_ball_size: Minimum ball size (pixels)
+            batch_size: Number of frames per YOLO forward pass
         
         Returns:
             Path to saved file
@@ -47,36 +58,78 @@ class BallExtractionPipeline:
             # Step 1: Detection layer - extract original ball trajectory
             print("🔍 Step 1: Extracting original basketball trajectory and rim info...")
             raw_ball_trajectory, rim_info = self.detection_layer.extract_ball_trajectory_and_rim_info_from_video(
-                video_path, conf_threshold, classes, iou_threshold
+                video_path, conf_threshold, classes, iou_threshold, batch_size=batch_size
             )
             print(f"✅ Extraction complete: {len(raw_ball_trajectory)} frames")
             
-            # Step 2: Confidence and size filtering
-            print("\n🔄 Step 2: Filtering by confidence...")
-            filtered_trajectory = self.detection_layer.filter_ball_detections(
-                raw_ball_trajectory, min_confidence, min_ball_size
+            return self.save_extracted_ball_data(
+                video_path, raw_ball_trajectory, rim_info, min_confidence, min_ball_size
             )
-            print(f"✅ Filtering complete: {len(filtered_trajectory)} frames")
-            filtered_rim = self.detection_layer.filter_rim_detections(rim_info, min_confidence)
-            # Step 3: Save original absolute coordinates as JSON
-            print("\n💾 Step 3: Saving original data...")
-            base_filename = f"{os.path.splitext(os.path.basename(video_path))[0]}_ball_original"
-            saved_file = self.storage_layer.save_original_as_json(filtered_trajectory, f"{base_filename}.json")
-
-            base_filename2 = f"{os.path.splitext(os.path.basename(video_path))[0]}_rim_original"
-            self.storage_layer.save_rim_original_as_json(filtered_rim, f"{base_filename2}.json")
-            print("✅ Save complete")
-            print("=" * 50)
-            
-            # Print summary
-            self._print_summary(filtered_trajectory, saved_file)
-            
-            return saved_file
             
         except Exception as e:
             print(f"❌ Error occurred: {e}")
             raise
 
+    def save_extracted_ball_data(self, video_path: str, raw_ball_trajectory: List[Dict], rim_info: List[Dict],
+                                 min_confidence: float = 0.3, min_ball_size: float = 0.01) -> str:
+        """
+        Filter and save raw per-frame ball/rim data produced by the detection layer
+        
+        Shared by extract_ball_trajectory and the fused single-decode extraction in
+        the integrated pipeline, so both write identical files.
+        
+        Args:
+            video_path: Path to video file (used for the output filenames)
+            raw_ball_trajectory: Per-frame ball records from BallDetectionLayer
+            rim_info: Per-frame rim records from BallDetectionLayer
+            min_confidence: Minimum confidence (for filtering)
+            min_ball_size: Minimum ball size (pixels)
+        
+        Returns:
+            Path to saved ball file
+        """
+        # Step 2: Confidence and size filtering
+        print("\n🔄 Step 2: Filtering by confidence...")
+        filtered_trajectory = self.detection_layer.filter_ball_detections(
+            raw_ball_trajectory, min_confidence, min_ball_size
+        )
+        print(f"✅ Filtering complete: {len(filtered_trajectory)} frames")
+        filtered_rim = self.detection_layer.filter_rim_detections(rim_info, min_confidence)
+        # Step 3: Save original absolute coordinates (ball + rim in one columnar .npz, JSON as optional export)
+        print("\n💾 Step 3: Saving original data...")
+        base_filename = f"{os.path.splitext(os.path.basename(video_path))[0]}_ball_original"
+        saved_file = self.storage_layer.save_original_as_npz(filtered_trajectory, filtered_rim, f"{base_filename}.npz")
+
+        if self.export_json:
+            self.storage_layer.save_original_as_json(filtered_trajectory, f"{base_filename}.json")
+            base_filename2 = f"{os.path.splitext(os.path.basename(video_path))[0]}_rim_original"
+            self.storage_layer.save_rim_original_as_json(filtered_rim, f"{base_filename2}.json")
+        print("✅ Save complete")
+        print("=" * 50)
+        
+        # Print summary
+        self._print_summary(filtered_trajectory, saved_file)
+        
+        return saved_file
+
+    def export_original_json(self, video_path: str) -> str:
+        """
+        Write the ball and rim JSON exports of an already saved columnar ball file
+        
+        Used when the .npz comes from the extraction cache instead of a fresh extraction.
+        
+        Args:
+            video_path: Path to video file (used for the filenames)
+        
+        Returns:
+            Path to the ball JSON file
+        """
+        base_name = os.path.splitext(os.path.basename(video_path))[0]
+        npz_file = os.path.join(self.storage_layer.output_dir, f"{base_name}_ball_original.npz")
+        ball_file = self.storage_layer.save_original_as_json(load_ball_original(npz_file), f"{base_name}_ball_original.json")
+        self.storage_layer.save_rim_original_as_json(load_rim_original(npz_file), f"{base_name}_rim_original.json")
+        return ball_file
+
     def _print_summary(self, ball_trajectory: List[Dict], saved_file: str):
         """Print extraction summary"""
         # Statistics
@@ -11,6 +11,8 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from columnar_storage import load_npz_arrays, save_npz_atomic
+
 def convert_numpy_types(obj):
     """Convert numpy types to Python basic types"""
     if isinstance(obj, np.integer):
@@ -26,6 +28,89 @@ def convert_numpy_types(obj):
     else:
         return obj
 
+# Column order of the per-detection arrays in the columnar (.npz) format (bbox = x1, y1, x2, y2)
+DETECTION_FIELDS = ['bbox_x1', 'bbox_y1', 'bbox_x2', 'bbox_y2', 'confidence',
+                    'center_x', 'center_y', 'width', 'height', 'pixel_width', 'pixel_height']
+
+def _detections_to_arrays(frames: List[Dict], detections_key: str, prefix: str) -> Dict[str, np.ndarray]:
+    """Flatten per-frame detection lists into CSR-style arrays (offsets + one row per detection)"""
+    counts = [len(frame[detections_key]) for frame in frames]
+    detections = [detection for frame in frames for detection in frame[detections_key]]
+    values = np.array(
+        [list(detection['bbox']) + [detection[field] for field in DETECTION_FIELDS[4:]] for detection in detections],
+        dtype=np.float64
+    ).reshape(len(detections), len(DETECTION_FIELDS))
+    return {
+        f"{prefix}_frame_number": np.array([frame['frame_number'] for frame in frames], dtype=np.int64),
+        f"{prefix}_timestamp": np.array([frame['timestamp'] for frame in frames], dtype=np.float64),
+        f"{prefix}_offsets": np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+        f"{prefix}_detections": values,
+        f"{prefix}_class_id": np.array([detection['class_id'] for detection in detections], dtype=np.int64)
+    }
+
+def _arrays_to_detections(arrays: Dict[str, np.ndarray], prefix: str) -> List[Dict]:
+    """Rebuild per-frame records (same structure as the original JSON ball_trajectory / rim_info)"""
+    values = arrays[f"{prefix}_detections"].tolist()
+    class_ids = arrays[f"{prefix}_class_id"].tolist()
+    offsets = arrays[f"{prefix}_offsets"].tolist()
+    frames = []
+    for i, (frame_number, timestamp) in enumerate(zip(arrays[f"{prefix}_frame_number"].tolist(),
+                                                      arrays[f"{prefix}_timestamp"].tolist())):
+        detections = []
+        for row in range(offsets[i], offsets[i + 1]):
+            (x1, y1, x2, y2, confidence, center_x, center_y,
+             width, height, pixel_width, pixel_height) = values[row]
+            detections.append({
+                'bbox': [x1, y1, x2, y2],
+                'confidence': confidence,
+                'class_id': class_ids[row],
+                'center_x': center_x,
+                'center_y': center_y,
+                'width': width,
+                'height': height,
+                'pixel_width': pixel_width,
+                'pixel_height': pixel_height
+            })
+        frames.append({
+            "frame_number": frame_number,
+            "timestamp": timestamp,
+            f"{prefix}_detections": detections,
+            f"{prefix}_count": len(detections)
+        })
+    return frames
+
+def load_ball_arrays(filepath: str) -> Dict[str, np.ndarray]:
+    """
+    Load a columnar ball/rim file written by BallStorageLayer.save_original_as_npz
+    
+    Returns:
+        Dict with, for prefix in ("ball", "rim"): <prefix>_frame_number, <prefix>_timestamp,
+        <prefix>_offsets (frames + 1; detections of frame i are rows offsets[i]:offsets[i+1]),
+        <prefix>_detections (detections, len(DETECTION_FIELDS)), <prefix>_class_id,
+        plus metadata (JSON str); arrays are read-only memory maps into the file (see columnar_storage)
+    """
+    return load_npz_arrays(filepath)
+
+def load_ball_original(filepath: str) -> List[Dict]:
+    """Load original ball trajectory from either the columnar .npz or the JSON export"""
+    if filepath.endswith(".npz"):
+        return _arrays_to_detections(load_ball_arrays(filepath), "ball")
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "ball_trajectory" in data:
+        return data["ball_trajectory"]
+    return data
+
+def load_rim_original(filepath: str) -> List[Dict]:
+    """Load original rim info from either the columnar .npz (ball file) or the JSON export"""
+    if filepath.endswith(".npz"):
+        return _arrays_to_detections(load_ball_arrays(filepath), "rim")
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "rim_info" in data:
+        return data["rim_info"]
+    return data
+
 class BallStorageLayer:
     def __init__(self, output_dir: str = "data"):
         self.output_dir = output_dir
@@ -87,6 +172,41 @@ class BallStorageLayer:
         print(f"Original rim info JSON save complete: {filepath}")
         return filepath
 
+    def save_original_as_npz(self, ball_trajectory: List[Dict], rim_info: List[Dict],
+                             filename: Optional[str] = None) -> str:
+        """
+        Save original ball trajectory and rim info in one columnar binary file (see load_ball_arrays)
+        
+        Same content as save_original_as_json + save_rim_original_as_json, stored as arrays:
+        no per-value text encoding on save and no JSON parsing on load.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"ball_original_{timestamp}.npz"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        
+        metadata = {
+            "total_frames": len(ball_trajectory),
+            "extraction_time": datetime.now().isoformat(),
+            "frames_with_ball": sum(1 for frame in ball_trajectory if frame['ball_count'] > 0),
+            "total_balls_detected": sum(frame['ball_count'] for frame in ball_trajectory),
+            "frames_with_rim": sum(1 for frame in rim_info if frame['rim_count'] > 0),
+            "total_rims_detected": sum(frame['rim_count'] for frame in rim_info),
+            "detection_fields": DETECTION_FIELDS,
+            "coordinate_system": "relative_coordinates_with_aspect_ratio_correction"
+        }
+        
+        save_npz_atomic(
+            filepath,
+            metadata=np.array(json.dumps(metadata)),
+            **_detections_to_arrays(ball_trajectory, 'ball_detections', 'ball'),
+            **_detections_to_arrays(rim_info, 'rim_detections', 'rim')
+        )
+        
+        print(f"Original ball/rim NPZ save complete: {filepath}")
+        return filepath
+
     def save_as_json(self, ball_trajectory: List[Dict], filename: Optional[str] = None) -> str:
         """Save ball trajectory data as JSON"""
         if filename is None:
@@ -296,30 +416,18 @@ class BallStorageLayer:
         return saved_files
 
     def load_ball_trajectory(self, filepath: str) -> List[Dict]:
-        """Load saved ball trajectory data"""
+        """Load saved ball trajectory data (.npz or .json)"""
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        if "ball_trajectory" in data:
-            return data["ball_trajectory"]
-        else:
-            return data  # If directly an array
+        return load_ball_original(filepath)
     
     def load_rim_info(self, filepath: str) -> List[Dict]:
-        """Load saved ball trajectory data"""
+        """Load saved rim info data (.npz or .json)"""
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        if "rim_info" in data:
-            return data["rim_info"]
-        else:
-            return data  # If directly an array
+        return load_rim_original(filepath)
 
     def get_storage_info(self) -> Dict:
         """Return storage info"""
@@ -329,6 +437,7 @@ class BallStorageLayer:
         files = os.listdir(self.output_dir)
         json_files = [f for f in files if f.endswith('.json')]
         csv_files = [f for f in files if f.endswith('.csv')]
+        npz_files = [f for f in files if f.endswith('.npz')]
         
         return {
             "output_dir": self.output_dir,
@@ -336,5 +445,6 @@ class BallStorageLayer:
             "total_files": len(files),
             "json_files": len(json_files),
             "csv_files": len(csv_files),
+            "npz_files": len(npz_files),
             "file_list": files
         } 
\ No newline at end of file
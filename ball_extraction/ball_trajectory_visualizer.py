@@ -12,6 +12,10 @@ from datetime import datetime
 from ultralytics import YOLO
 import traceback
 
+from analysis_logging import get_logger, log_progress
+
+logger = get_logger(__name__)
+
 class BallTrajectoryVisualizer:
     def __init__(self, model_path: str = "ball_extraction/models/yolov8n736-customContinue.pt"):
         """
@@ -188,7 +192,7 @@ class BallTrajectoryVisualizer:
                 break
             
             frame_count += 1
-            print(f"Processing frame: {frame_count}/{total_frames}", end="\r")
+            log_progress(logger, "Processing frame", frame_count, total_frames)
             
             # Detect and visualize
             visualized_frame = self.detect_and_visualize_frame(
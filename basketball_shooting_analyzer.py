@@ -18,10 +18,18 @@ from phase_detection.ball_based_phase_detector import BallBasedPhaseDetector
 from phase_detection.torso_based_phase_detector import TorsoBasedPhaseDetector
 from phase_detection.resolution_based_phase_detector import ResolutionBasedPhaseDetector
 from phase_detection.hybrid_fps_phase_detector import HybridFPSPhaseDetector
+from phase_detection.phase_stream import PhaseStream
 
 # Import shot detection module
 from shot_detection.shot_detector import ShotDetector
 
+# Import original extraction data loaders (.npz / .json)
+from pose_extraction.pose_sequence import PoseSequence, load_pose_sequence
+from ball_extraction.ball_storage_layer import load_ball_original, load_rim_original
+
+# Import analyzed-video writer (ffmpeg H.264 / OpenCV)
+from video_encoder import open_video_writer
+
 class BasketballShootingAnalyzer:
     def __init__(self):
         """Initialize the analyzer"""
@@ -259,17 +267,20 @@ class BasketballShootingAnalyzer:
         
         base_name = os.path.splitext(os.path.basename(video_path))[0]
         
-        # Original data file paths
+        # Original data file paths (columnar .npz preferred, JSON export as fallback)
+        pose_original_npz = os.path.join(self.extracted_data_dir, f"{base_name}_pose_original.npz")
+        ball_original_npz = os.path.join(self.extracted_data_dir, f"{base_name}_ball_original.npz")
         pose_original_json = os.path.join(self.extracted_data_dir, f"{base_name}_pose_original.json")
         ball_original_json = os.path.join(self.extracted_data_dir, f"{base_name}_ball_original.json")
-        rim_original_json = os.path.join(self.extracted_data_dir, f"{base_name}_rim_original.json")
+        existing_pose = next((path for path in (pose_original_npz, pose_original_json) if os.path.exists(path)), None)
+        existing_ball = next((path for path in (ball_original_npz, ball_original_json) if os.path.exists(path)), None)
         # If existing files exist and overwrite mode is not selected, check
-        if not overwrite_mode and (os.path.exists(pose_original_json) or os.path.exists(ball_original_json)):
+        if not overwrite_mode and (existing_pose or existing_ball):
             print(f"\n⚠️ Existing original extraction data found:")
-            if os.path.exists(pose_original_json):
-                print(f"  - Pose data: {os.path.basename(pose_original_json)}")
-            if os.path.exists(ball_original_json):
-                print(f"  - Ball data: {os.path.basename(ball_original_json)}")
+            if existing_pose:
+                print(f"  - Pose data: {os.path.basename(existing_pose)}")
+            if existing_ball:
+                print(f"  - Ball data: {os.path.basename(existing_ball)}")
             choice = input("Overwrite and extract new data? (y/n): ").strip().lower()
             if choice != 'y':
                 print("Using existing original extraction data.")
@@ -279,53 +290,38 @@ class BasketballShootingAnalyzer:
         
         # Load original pose data
         pose_files = glob.glob(os.path.join(self.extracted_data_dir, f"{base_name}_pose_original*.json"))
-        if pose_files:
-            pose_file = pose_files[0]  # Use the first file
+        pose_file = pose_original_npz if os.path.exists(pose_original_npz) else (pose_files[0] if pose_files else None)
+        if pose_file:
             try:
-                with open(pose_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and "pose_data" in data:
-                        self.pose_data = data["pose_data"]
-                    else:
-                        self.pose_data = data
+                self.pose_data = load_pose_sequence(pose_file)
                 print(f"✅ Original pose data loaded: {os.path.basename(pose_file)}")
             except Exception as e:
                 print(f"❌ Failed to load original pose data: {e}")
                 return False
         else:
-            print(f"❌ Original pose data file not found: {base_name}_pose_original*.json")
+            print(f"❌ Original pose data file not found: {base_name}_pose_original(.npz|*.json)")
             return False
         
         # Load original ball data
         ball_files = glob.glob(os.path.join(self.extracted_data_dir, f"{base_name}_ball_original*.json"))
-        if ball_files:
-            ball_file = ball_files[0]  # Use the first file
+        ball_file = ball_original_npz if os.path.exists(ball_original_npz) else (ball_files[0] if ball_files else None)
+        if ball_file:
             try:
-                with open(ball_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and "ball_trajectory" in data:
-                        self.ball_data = data["ball_trajectory"]
-                    else:
-                        self.ball_data = data
+                self.ball_data = load_ball_original(ball_file)
                 print(f"✅ Original ball data loaded: {os.path.basename(ball_file)}")
             except Exception as e:
                 print(f"❌ Failed to load original ball data: {e}")
                 return False
         else:
-            print(f"❌ Original ball data file not found: {base_name}_ball_original*.json")
+            print(f"❌ Original ball data file not found: {base_name}_ball_original(.npz|*.json)")
             return False
         
-        # Load rim data
+        # Load rim data (stored in the ball .npz, or a separate JSON export)
         rim_files = glob.glob(os.path.join(self.extracted_data_dir, f"{base_name}_rim_original*.json"))
-        if rim_files:
-            rim_file = rim_files[0]  # Use the first file
+        rim_file = ball_original_npz if os.path.exists(ball_original_npz) else (rim_files[0] if rim_files else None)
+        if rim_file:
             try:
-                with open(rim_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and "rim_info" in data:
-                        self.rim_data = data["rim_info"]
-                    else:
-                        self.rim_data = data
+                self.rim_data = load_rim_original(rim_file)
                 print(f"✅ Original rim data loaded: {os.path.basename(rim_file)}")
             except Exception as e:
                 print(f"❌ Failed to load original rim data: {e}")
@@ -443,146 +439,96 @@ class BasketballShootingAnalyzer:
         print("🔄 Normalizing all frames with shot-specific values...")
         self.normalized_data = []
         
-        total_frames = len(self.pose_data)
-        for i, frame_data in enumerate(self.pose_data):
-            pose = frame_data.get('pose', {})
-            
-            # Step 1: Get shot information and normalization data for this frame
-            current_shot = self._get_shot_for_frame(i)
-            
-            if current_shot and current_shot['shot_id'] in self.shot_normalization_data:
-                # Use shot-specific normalization data
-                shot_id = current_shot['shot_id']
-                shot_norm_data = self.shot_normalization_data[shot_id]
-                
-                frame_torso_length = shot_norm_data['fixed_torso']
-                facing_direction = shot_norm_data['facing_direction']
-                reference_hip_side = shot_norm_data['reference_hip_side']
-                stable_reference_hip_x = shot_norm_data['stable_hip_x']
-                stable_reference_hip_y = shot_norm_data['stable_hip_y']
-                
-                # print(f"   Frame {i}: Using shot {shot_id} normalization (torso: {frame_torso_length:.4f}, facing: {facing_direction})")
-            else:
-                # Use fallback normalization data
-                if 'global' in self.shot_normalization_data:
-                    global_norm_data = self.shot_normalization_data['global']
-                    frame_torso_length = global_norm_data['fixed_torso']
-                    facing_direction = global_norm_data['facing_direction']
-                    reference_hip_side = global_norm_data['reference_hip_side']
-                    stable_reference_hip_x = global_norm_data['stable_hip_x']
-                    stable_reference_hip_y = global_norm_data['stable_hip_y']
-                else:
-                    # Last resort fallback
-                    frame_torso_length = fallback_torso_length
-                    facing_direction = 'right'
-                    reference_hip_side = 'right'
-                    stable_reference_hip_x = 0.5
-                    stable_reference_hip_y = 0.5
-                
-                # print(f"   Frame {i}: Using fallback normalization (torso: {frame_torso_length:.4f}, facing: {facing_direction})")
-            
-            # Step 2: Scale normalization using frame-specific torso length
-            current_scaling_factor = frame_torso_length
-            scale_normalized_pose = {}
-            for key, kp in pose.items():
-                if isinstance(kp, dict) and 'x' in kp and 'y' in kp:
-                    # Scale normalization only
-                    norm_x = kp['x'] / current_scaling_factor
-                    norm_y = kp['y'] / current_scaling_factor
-                    
-                    scale_normalized_pose[key] = {
-                        'x': norm_x,
-                        'y': norm_y,
-                        'confidence': kp.get('confidence', 0)
-                    }
-                # Missing keypoints are not added (automatically excluded)
-            
-            # Step 3: Coordinate normalization using shot-specific stable reference hip as origin (x=0)
-            coordinate_normalized_pose = {}
-            hip_center_valid = True  # Using stable values, so always valid
-            
-            for key, kp in scale_normalized_pose.items():
-                if isinstance(kp, dict) and 'x' in kp and 'y' in kp:
-                    # Position normalization: stable reference hip becomes (0,0)
-                    norm_x = kp['x'] - (stable_reference_hip_x / current_scaling_factor)
-                    norm_y = kp['y'] - (stable_reference_hip_y / current_scaling_factor)
-                    
-                    coordinate_normalized_pose[key] = {
-                        'x': norm_x,
-                        'y': norm_y,
-                        'confidence': kp.get('confidence', 0)
-                    }
-            
-            
-            # Final pose with horizontal flip applied for left-facing shooters
-            normalized_pose = {}
-            for key, kp in coordinate_normalized_pose.items():
-                if isinstance(kp, dict) and 'x' in kp and 'y' in kp:
-                    norm_x = kp['x']
-                    norm_y = kp['y']
-                    
-                    # Apply horizontal flip for left-facing shooters to make them face right
-                    if facing_direction == 'left':
-                        norm_x = -norm_x  # Flip horizontally
-                    
-                    normalized_pose[key] = {
-                        'x': norm_x,
-                        'y': norm_y,
-                        'confidence': kp.get('confidence', 0)
-                    }
+        pose_sequence = self.pose_data if isinstance(self.pose_data, PoseSequence) else PoseSequence.from_frames(self.pose_data)
+        total_frames = len(pose_sequence)
+        shots = self.shot_detector.shots
+        frame_shot_idx = self._frame_shot_indices(total_frames)
+        
+        # Normalization parameter rows: one per shot (shots without normalization data use the fallback row), then the fallback
+        if 'global' in self.shot_normalization_data:
+            fallback_params = self.shot_normalization_data['global']
+        else:
+            # Last resort fallback
+            fallback_params = {
+                'facing_direction': 'right',
+                'reference_hip_side': 'right',
+                'stable_hip_x': 0.5,
+                'stable_hip_y': 0.5,
+                'fixed_torso': fallback_torso_length
+            }
+        param_rows = [self.shot_normalization_data.get(shot['shot_id'], fallback_params) for shot in shots] + [fallback_params]
+        frame_param_idx = np.where(frame_shot_idx >= 0, frame_shot_idx, len(shots))
+        
+        scale = np.array([params['fixed_torso'] for params in param_rows], dtype=np.float64)
+        hip_x = np.array([params['stable_hip_x'] for params in param_rows], dtype=np.float64)
+        hip_y = np.array([params['stable_hip_y'] for params in param_rows], dtype=np.float64)
+        flip = np.array([params['facing_direction'] == 'left' for params in param_rows])
+        
+        # Per-frame transform: Scale → Coordinate (stable reference hip becomes (0,0)) → Direction (horizontal flip for left-facing)
+        frame_scale = scale[frame_param_idx]
+        frame_offset_x = (hip_x / scale)[frame_param_idx]
+        frame_offset_y = (hip_y / scale)[frame_param_idx]
+        frame_flip = flip[frame_param_idx]
+        
+        keypoints = pose_sequence.keypoints
+        norm_x = keypoints[:, :, 0] / frame_scale[:, None] - frame_offset_x[:, None]
+        norm_y = keypoints[:, :, 1] / frame_scale[:, None] - frame_offset_y[:, None]
+        norm_x = np.where(frame_flip[:, None], -norm_x, norm_x)
+        
+        # Ball position with the same shot-specific transformations as the pose
+        ball = np.full((total_frames, 4), np.nan)
+        for i in range(min(total_frames, len(self.ball_data))):
+            ball_frame_data = self.ball_data[i]
+            if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
+                ball_detections = ball_frame_data['ball_detections']
+                if ball_detections and isinstance(ball_detections[0], dict):
+                    detection = ball_detections[0]
+                    ball[i] = (detection.get('center_x', 0), detection.get('center_y', 0),
+                               detection.get('width', 0.01), detection.get('height', 0.01))
+        ball_detected = ~np.isnan(ball[:, 0])
+        norm_ball_x = ball[:, 0] / frame_scale - frame_offset_x
+        norm_ball_y = ball[:, 1] / frame_scale - frame_offset_y
+        norm_ball_x = np.where(frame_flip, -norm_ball_x, norm_ball_x)
+        norm_ball_w = ball[:, 2] / frame_scale
+        norm_ball_h = ball[:, 3] / frame_scale
+        
+        # Assemble per-frame output (missing keypoints are not added)
+        keypoint_names = pose_sequence.keypoint_names
+        present = ~np.isnan(keypoints[:, :, 2])
+        norm_x_rows, norm_y_rows = norm_x.tolist(), norm_y.tolist()
+        confidence_rows, present_rows = keypoints[:, :, 2].tolist(), present.tolist()
+        ball_rows = np.stack([norm_ball_x, norm_ball_y, norm_ball_w, norm_ball_h], axis=1).tolist()
+        ball_detected_rows = ball_detected.tolist()
+        frame_param_rows = frame_param_idx.tolist()
+        in_shot_rows = (frame_shot_idx >= 0).tolist()
+        frame_shots = self.shot_detector.frame_shots
+        
+        for i in range(total_frames):
+            params = param_rows[frame_param_rows[i]]
+            xs, ys, confidences = norm_x_rows[i], norm_y_rows[i], confidence_rows[i]
+            normalized_pose = {
+                name: {'x': xs[k], 'y': ys[k], 'confidence': confidences[k]}
+                for k, name in enumerate(keypoint_names) if present_rows[i][k]
+            }
             
-            # Step 4: Normalize ball position with same shot-specific transformations
             normalized_ball = {}
-            ball_detected = False
-            
-            if i < len(self.ball_data):
-                ball_frame_data = self.ball_data[i]
-                if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
-                    ball_detections = ball_frame_data['ball_detections']
-                    if ball_detections and isinstance(ball_detections[0], dict):
-                        ball = ball_detections[0]
-                        ball_x = ball.get('center_x', 0)
-                        ball_y = ball.get('center_y', 0)
-                        
-                        # Apply same shot-specific transformations as pose: Scale → Coordinate → Direction
-                        # 1. Scale normalization
-                        norm_ball_x = ball_x / current_scaling_factor
-                        norm_ball_y = ball_y / current_scaling_factor
-                        
-                        # 2. Coordinate normalization (shot-specific reference hip becomes (0,0))
-                        norm_ball_x = norm_ball_x - (stable_reference_hip_x / current_scaling_factor)
-                        norm_ball_y = norm_ball_y - (stable_reference_hip_y / current_scaling_factor)
-                        
-                        # 3. Direction normalization (horizontal flip for left-facing)
-                        if facing_direction == 'left':
-                            norm_ball_x = -norm_ball_x  # Flip horizontally
-                        
-                        normalized_ball = {
-                            'center_x': norm_ball_x,
-                            'center_y': norm_ball_y,
-                            'width': ball.get('width', 0.01) / current_scaling_factor,
-                            'height': ball.get('height', 0.01) / current_scaling_factor
-                        }
-                        ball_detected = True
-            
-            # Get shot information for this frame
-            shot_id = None
-            if i < len(self.shot_detector.frame_shots):
-                shot_id = self.shot_detector.frame_shots[i]
+            if ball_detected_rows[i]:
+                center_x, center_y, width, height = ball_rows[i]
+                normalized_ball = {'center_x': center_x, 'center_y': center_y, 'width': width, 'height': height}
             
             normalized_frame = {
                 'frame_index': i,
                 'normalized_pose': normalized_pose,
                 'normalized_ball': normalized_ball,
-                'stable_reference_hip': [stable_reference_hip_x, stable_reference_hip_y],
-                'scaling_factor': current_scaling_factor,  # 실제 사용된 scaling factor
-                'facing_direction': facing_direction,
-                'reference_hip_side': reference_hip_side,
-                'ball_detected': ball_detected,
-                'hip_center_valid': hip_center_valid,
+                'stable_reference_hip': [params['stable_hip_x'], params['stable_hip_y']],
+                'scaling_factor': params['fixed_torso'],  # 실제 사용된 scaling factor
+                'facing_direction': params['facing_direction'],
+                'reference_hip_side': params['reference_hip_side'],
+                'ball_detected': ball_detected_rows[i],
+                'hip_center_valid': True,  # Using stable values, so always valid
                 'consecutive_missing_hip': 0,  # Always 0 since using stable values
-                'shot': shot_id,
-                'shot_normalization_applied': current_shot is not None  # Whether shot-specific normalization was applied
+                'shot': frame_shots[i] if i < len(frame_shots) else None,
+                'shot_normalization_applied': in_shot_rows[i]  # Whether shot-specific normalization was applied
             }
             
             self.normalized_data.append(normalized_frame)
@@ -964,34 +910,18 @@ class BasketballShootingAnalyzer:
             print(f"   ⚠️ Phase detector not available, calculating from all frames")
             return self._calculate_torso_from_all_frames()
     
-    def _get_torso_for_frame(self, frame_idx: int) -> float:
+    def _frame_shot_indices(self, num_frames: int) -> np.ndarray:
         """
-        Get appropriate torso length for a specific frame
-        Uses shot-based fixed torso if frame belongs to a shot, otherwise fallback
+        Index into shot_detector.shots of the shot each frame belongs to (-1 for none).
+        A frame belongs to a shot when start_frame <= frame <= end_frame; the first matching shot wins.
         """
-        # Check if frame belongs to any shot
-        if len(self.shot_detector.shots) > 0:
-            for shot in self.shot_detector.shots:
-                if shot['start_frame'] <= frame_idx <= shot['end_frame']:
-                    return shot['fixed_torso']
-        
-        # Fallback: use pre-calculated fallback torso
-        if hasattr(self, 'fallback_torso_length'):
-            return self.fallback_torso_length
-        else:
-            # Last resort: use phase detection torso
-            return self._get_torso_from_phase_detection()
-    
-    def _get_shot_for_frame(self, frame_idx: int) -> dict:
-        """
-        Get shot information for a specific frame
-        Returns shot dict if frame belongs to a shot, None otherwise
-        """
-        if len(self.shot_detector.shots) > 0:
-            for shot in self.shot_detector.shots:
-                if shot['start_frame'] <= frame_idx <= shot['end_frame']:
-                    return shot
-        return None
+        frame_shot_idx = np.full(num_frames, -1, dtype=np.int64)
+        # Assign in reverse so earlier shots take precedence where shots overlap
+        for shot_idx in range(len(self.shot_detector.shots) - 1, -1, -1):
+            shot = self.shot_detector.shots[shot_idx]
+            start = max(shot['start_frame'], 0)
+            frame_shot_idx[start:shot['end_frame'] + 1] = shot_idx
+        return frame_shot_idx
     
     def _get_fallback_torso_from_shots(self) -> float:
         """
@@ -1454,147 +1384,17 @@ class BasketballShootingAnalyzer:
         # Select primary hand before phase detection using original data
         self.selected_hand, self.selected_hand_confidence = self.select_primary_hand_from_original_data()
         
-        # Set detector based on type
-        if detector_type == "ball":
-            self.current_detector = self.ball_detector
-        elif detector_type == "torso":
-            self.current_detector = self.torso_detector
-        elif detector_type == "hybrid_fps":
-            self.current_detector = self.hybrid_fps_detector
-            # Set actual video FPS for proper threshold adjustment
-            if hasattr(self, 'video_fps'):
-                self.hybrid_fps_detector.set_fps(self.video_fps)
-        elif detector_type == "resolution":
-            self.current_detector = self.resolution_detector
-        else:
-            print(f"❌ Unknown detector type: {detector_type}. Using ball detector.")
-            self.current_detector = self.ball_detector
-        
-        # Store reference to phase detector for normalization to use
-        self.phase_detector = self.current_detector
+        phase_stream = self.create_phase_stream(detector_type, self.selected_hand)
         
-        self.phases = []
-        current_phase = "General" # Start with a general phase
-        phase_start_frame = 0
+        # Per-frame torso lengths for rolling torso tracking, computed once from the keypoint array
+        frame_torso_lengths = self.pose_data.torso_lengths() if isinstance(self.pose_data, PoseSequence) else None
         
-        # Track phase history for cancellation
-        phase_history = []  # List of (phase, start_frame, end_frame)
-        current_phase_start = 0
+        # Same online segmentation as streaming, stepped over the already extracted frames
+        for i in range(len(self.pose_data)):
+            torso_length = float(frame_torso_lengths[i]) if frame_torso_lengths is not None else None
+            phase_stream.step(i, self.pose_data, self.ball_data, torso_length=torso_length)
         
-        # Setup for noise filtering
-        min_phase_duration = 3  # Must last at least 3 frames
-        noise_threshold = 4  # Changes of 4 frames or less are considered noise
-        
-        for i, frame_data in enumerate(self.pose_data):
-            pose = frame_data.get('pose', {})
-            
-            # Get selected hand keypoints
-            selected_shoulder, selected_elbow, selected_wrist = self.get_selected_hand_keypoints(pose)
-            
-            # Extract necessary keypoints from original data (using selected hand)
-            wrist_x = selected_wrist.get('x', 0)
-            wrist_y = selected_wrist.get('y', 0)
-            elbow_x = selected_elbow.get('x', 0)
-            elbow_y = selected_elbow.get('y', 0)
-            shoulder_x = selected_shoulder.get('x', 0)
-            shoulder_y = selected_shoulder.get('y', 0)
-            
-            # Get hip data (still need both for torso calculations)
-            left_hip = pose.get('left_hip', {'y': 0})
-            right_hip = pose.get('right_hip', {'y': 0})
-            left_hip_y = left_hip.get('y', None)
-            right_hip_y = right_hip.get('y', None)
-            
-            if left_hip_y is not None and right_hip_y is not None:
-                hip_y = max(left_hip_y, right_hip_y)
-            elif left_hip_y is not None:
-                hip_y = left_hip_y
-            elif right_hip_y is not None:
-                hip_y = right_hip_y
-            else:
-                hip_y = 0
-            
-            # Get ball position for calculations from original data
-            ball_info = None
-            if i < len(self.ball_data):
-                ball_frame_data = self.ball_data[i]
-                if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
-                    ball_detections = ball_frame_data['ball_detections']
-                    if ball_detections and isinstance(ball_detections[0], dict):
-                        ball_info = ball_detections[0]
-            
-            ball_x = ball_info.get('center_x', 0) if ball_info else 0
-            ball_y = ball_info.get('center_y', 0) if ball_info else 0
-            
-            # Calculate movement deltas using selected hand
-            if i > 0 and i-1 < len(self.pose_data):
-                prev_frame_data = self.pose_data[i-1]
-                prev_pose = prev_frame_data.get('pose', {})
-                
-                # Get previous selected hand position
-                prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_selected_hand_keypoints(prev_pose)
-                prev_wrist_x = prev_selected_wrist.get('x', 0)
-                prev_wrist_y = prev_selected_wrist.get('y', 0)
-                prev_elbow_x = prev_selected_elbow.get('x', 0)
-                prev_elbow_y = prev_selected_elbow.get('y', 0)
-                
-                # Get previous hip position
-                prev_left_hip = prev_pose.get('left_hip', {'y': None})
-                prev_right_hip = prev_pose.get('right_hip', {'y': None})
-                prev_left_hip_y = prev_left_hip.get('y', None)
-                prev_right_hip_y = prev_right_hip.get('y', None)
-                
-                if prev_left_hip_y is not None and prev_right_hip_y is not None:
-                    prev_hip_y = max(prev_left_hip_y, prev_right_hip_y)
-                elif prev_left_hip_y is not None:
-                    prev_hip_y = prev_left_hip_y
-                elif prev_right_hip_y is not None:
-                    prev_hip_y = prev_right_hip_y
-                else:
-                    prev_hip_y = hip_y
-                
-                d_wrist_y = wrist_y - prev_wrist_y
-                d_elbow_y = elbow_y - prev_elbow_y
-                d_hip_y = hip_y - prev_hip_y
-            else:
-                d_wrist_y = d_elbow_y = d_hip_y = 0
-            
-            # Check if current phase transitions to next phase using current detector
-            # Get FPS from video if available
-            fps = 30.0  # Default FPS
-            if hasattr(self, 'video_fps'):
-                fps = self.video_fps
-                
-            # Provide current torso to detector for threshold calculation
-            current_torso = self._get_current_torso_for_thresholds()
-            if hasattr(self.current_detector, 'set_current_torso'):
-                self.current_detector.set_current_torso(current_torso)
-                
-            next_phase = self.current_detector.check_phase_transition(
-                current_phase, i, self.pose_data, self.ball_data, 
-                fps=fps, selected_hand=self.selected_hand
-            )
-            
-
-            
-            # Update rolling torso tracking (delegated to ShotDetector)  
-            self.shot_detector.update_rolling_torso(i, pose)
-            
-            # Real-time shot detection - detect shot transitions
-            self.shot_detector.detect_shot_transitions(i, next_phase)
-            
-            # Minimum phase duration disabled - transition immediately when conditions are met
-            if next_phase != current_phase:
-                            # Record current phase in history before changing
-                            if current_phase != "General":
-                                phase_history.append((current_phase, current_phase_start, i))
-                            
-                            current_phase = next_phase
-                            phase_start_frame = i
-                            current_phase_start = i
-                # print(f"Frame {i}: {current_phase} phase started")
-            
-            self.phases.append(current_phase)
+        self.phases = phase_stream.phases
         
         # Print phase-by-frame statistics
         phase_counts = {}
@@ -1616,6 +1416,44 @@ class BasketballShootingAnalyzer:
         
         print(f"\n🎯 Real-time shot detection completed: {len(self.shot_detector.shots)} shots detected")
     
+    def create_phase_stream(self, detector_type: str = "ball", selected_hand: Optional[str] = None) -> PhaseStream:
+        """
+        Create an incremental phase segmentation / shot detection stream.
+        
+        Frames can be pushed as they are extracted (PhaseStream.push); completed shots are
+        returned on the frame where Follow-through → General fires.
+        
+        Args:
+            detector_type: Phase detector to use ("ball", "torso", "hybrid_fps", "resolution")
+            selected_hand: Shooting hand (default: self.selected_hand, or "right")
+            
+        Returns:
+            PhaseStream driving the selected detector and this analyzer's ShotDetector
+        """
+        # Set detector based on type
+        if detector_type == "ball":
+            self.current_detector = self.ball_detector
+        elif detector_type == "torso":
+            self.current_detector = self.torso_detector
+        elif detector_type == "hybrid_fps":
+            self.current_detector = self.hybrid_fps_detector
+            # Set actual video FPS for proper threshold adjustment
+            if hasattr(self, 'video_fps'):
+                self.hybrid_fps_detector.set_fps(self.video_fps)
+        elif detector_type == "resolution":
+            self.current_detector = self.resolution_detector
+        else:
+            print(f"❌ Unknown detector type: {detector_type}. Using ball detector.")
+            self.current_detector = self.ball_detector
+        
+        # Store reference to phase detector for normalization to use
+        self.phase_detector = self.current_detector
+        
+        # Get FPS from video if available
+        fps = self.video_fps if hasattr(self, 'video_fps') else 30.0
+        return PhaseStream(self.current_detector, self.shot_detector,
+                           selected_hand=selected_hand or self.selected_hand or "right", fps=fps)
+    
     def _find_first_meaningful_transition(self):
         """Find first meaningful transition from Set-up to Loading/Rising/Loading-Rising after cancellation processing"""
         if not self.phases:
@@ -1648,73 +1486,9 @@ class BasketballShootingAnalyzer:
     def _update_rolling_torso(self, frame_idx: int, pose: Dict):
         """
         Update rolling torso measurement with current frame data
-        Only updates if torso_tracking_active is True
+        Delegates to ShotDetector, which owns the rolling torso window
         """
-        if not self.torso_tracking_active:
-            return
-        
-        # Calculate current frame torso
-        torso_length = self._calculate_frame_torso(pose)
-        
-        if torso_length > 0:
-            # Add new measurement
-            self.rolling_torso_values.append(torso_length)
-            self.rolling_torso_frames.append(frame_idx)
-            
-            # Keep only last 4 measurements
-            if len(self.rolling_torso_values) > 4:
-                self.rolling_torso_values.pop(0)
-                self.rolling_torso_frames.pop(0)
-            
-            # Debug output (disabled for cleaner logs)
-            # if len(self.rolling_torso_values) >= 4:
-            #     avg_torso = np.mean(self.rolling_torso_values)
-            #     print(f"   🔄 Frame {frame_idx}: Rolling torso avg = {avg_torso:.4f} (window: {len(self.rolling_torso_values)}/4)")
-    
-    def _calculate_frame_torso(self, pose: Dict) -> float:
-        """
-        Calculate torso length for a single frame
-        Returns average of left and right torso lengths if both available
-        """
-        required_keypoints = ['left_shoulder', 'right_shoulder', 'left_hip', 'right_hip']
-        for keypoint in required_keypoints:
-            if keypoint not in pose:
-                return 0.0
-            kp_data = pose[keypoint]
-            if not isinstance(kp_data, dict) or 'x' not in kp_data or 'y' not in kp_data:
-                return 0.0
-        
-        # Calculate left torso (left shoulder to left hip)
-        left_shoulder = pose['left_shoulder']
-        left_hip = pose['left_hip']
-        left_torso_length = 0.0
-        
-        if (left_shoulder.get('confidence', 0) > 0.2 and left_hip.get('confidence', 0) > 0.2):  # 0.3 → 0.2로 낮춤
-            left_dx = left_shoulder['x'] - left_hip['x']
-            left_dy = left_shoulder['y'] - left_hip['y']
-            left_torso_length = np.sqrt(left_dx**2 + left_dy**2)
-        
-        # Calculate right torso (right shoulder to right hip)
-        right_shoulder = pose['right_shoulder']
-        right_hip = pose['right_hip']
-        right_torso_length = 0.0
-        
-        if (right_shoulder.get('confidence', 0) > 0.2 and right_hip.get('confidence', 0) > 0.2):  # 0.3 → 0.2로 낮춤
-            right_dx = right_shoulder['x'] - right_hip['x']
-            right_dy = right_shoulder['y'] - right_hip['y']
-            right_torso_length = np.sqrt(right_dx**2 + right_dy**2)
-        
-        # Return average of valid measurements
-        valid_measurements = []
-        if left_torso_length > 0:
-            valid_measurements.append(left_torso_length)
-        if right_torso_length > 0:
-            valid_measurements.append(right_torso_length)
-        
-        if valid_measurements:
-            return np.mean(valid_measurements)
-        else:
-            return 0.0
+        self.shot_detector.update_rolling_torso(frame_idx, pose)
     
     def _get_current_torso_for_thresholds(self) -> float:
         """
@@ -1900,14 +1674,15 @@ class BasketballShootingAnalyzer:
             
             # Generate original visualization
             print("\n🎬 Generating original data visualization...")
-            self.create_original_analysis_video(
+            if not self.create_original_analysis_video(
                 video_path=video_path,
                 output_path=original_output,
                 original_pose_data=original_pose_data,
                 original_ball_data=original_ball_data,
                 original_rim_data=original_rim_data,
                 shooting_phases=self.phases
-            )
+            ):
+                return False
             print(f"✅ Original visualization: {os.path.basename(original_output)}")
             
             return True
@@ -1939,7 +1714,7 @@ class BasketballShootingAnalyzer:
             # Generate dual visualization (if normalized data exists)
             if hasattr(self, 'normalized_data') and self.normalized_data:
                 print("\n🎬 Generating dual visualization...")
-                self.create_dual_analysis_video(
+                if not self.create_dual_analysis_video(
                 video_path=video_path,
                     output_path=dual_output,
                 original_pose_data=original_pose_data,
@@ -1948,7 +1723,8 @@ class BasketballShootingAnalyzer:
                     normalized_ball_data=[frame.get('normalized_ball', {}) for frame in self.normalized_data],
                 original_rim_data=original_rim_data,
                 shooting_phases=self.phases
-            )
+            ):
+                    return False
                 print(f"✅ Dual visualization: {os.path.basename(dual_output)}")
             else:
                 print("\n⚠️ No normalized data available for dual visualization")
@@ -1983,65 +1759,65 @@ class BasketballShootingAnalyzer:
             
             print(f"🎬 Output size: {new_width}x{new_height}")
             
-            # Initialize video writer with mp4v codec (fallback from H264)
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, fps, (new_width, new_height))
+            # Initialize video writer (H.264 via ffmpeg when available, mp4v otherwise)
+            out = open_video_writer(output_path, fps, (new_width, new_height))
             
             if not out.isOpened():
-                print("❌ Failed to initialize H264 video writer")
+                print("❌ Failed to initialize video writer")
                 return False
             
-            print("✅ H264 video writer initialized successfully")
-            
-            frame_count = 0
-            total_frames = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                total_frames += 1
-                
-                # Copy original frame
-                original_frame = frame.copy()
-                normalized_frame = np.zeros_like(frame)
-                
-                # Left: Original absolute coordinates data
-                if frame_count < len(original_pose_data):
-                    original_frame = self._draw_pose_skeleton_original(original_frame, frame_count, original_pose_data)
-                    original_frame = self._draw_ball_original(original_frame, frame_count, original_ball_data)
-                    original_frame = self._draw_rim_original(original_frame, frame_count, original_rim_data)
-    
-                if shooting_phases and frame_count < len(shooting_phases):
-                    original_frame = self._draw_phase_label(original_frame, frame_count, "Original", shooting_phases)
-                
-                # Add selected hand label to original frame
-                original_frame = self._draw_selected_hand_label(original_frame, self.selected_hand, self.selected_hand_confidence, frame_count)
-                
-                # Right: Normalized data
-                if frame_count < len(normalized_pose_data):
-                    normalized_frame = self._draw_pose_skeleton_normalized(normalized_frame, frame_count, normalized_pose_data)
-                    normalized_frame = self._draw_ball_normalized(normalized_frame, frame_count, normalized_ball_data)
-                
-                if shooting_phases and frame_count < len(shooting_phases):
-                    normalized_frame = self._draw_phase_label(normalized_frame, frame_count, "Normalized", shooting_phases)
-                
-                # Add selected hand label to normalized frame
-                normalized_frame = self._draw_selected_hand_label(normalized_frame, self.selected_hand, self.selected_hand_confidence, frame_count)
-                
-                # Stack two frames side by side
-                combined_frame = np.hstack([original_frame, normalized_frame])
+            try:
+                print("✅ Video writer initialized successfully")
                 
-                out.write(combined_frame)
-                frame_count += 1
+                frame_count = 0
+                total_frames = 0
                 
-                # Print progress (every 10 frames) - disabled for cleaner output
-                # if frame_count % 10 == 0:
-                #     print(f"🎬 Processing frames: {frame_count}/{total_frames}")
-            
-            cap.release()
-            out.release()
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    
+                    total_frames += 1
+                    
+                    # Copy original frame
+                    original_frame = frame.copy()
+                    normalized_frame = np.zeros_like(frame)
+                    
+                    # Left: Original absolute coordinates data
+                    if frame_count < len(original_pose_data):
+                        original_frame = self._draw_pose_skeleton_original(original_frame, frame_count, original_pose_data)
+                        original_frame = self._draw_ball_original(original_frame, frame_count, original_ball_data)
+                        original_frame = self._draw_rim_original(original_frame, frame_count, original_rim_data)
+        
+                    if shooting_phases and frame_count < len(shooting_phases):
+                        original_frame = self._draw_phase_label(original_frame, frame_count, "Original", shooting_phases)
+                    
+                    # Add selected hand label to original frame
+                    original_frame = self._draw_selected_hand_label(original_frame, self.selected_hand, self.selected_hand_confidence, frame_count)
+                    
+                    # Right: Normalized data
+                    if frame_count < len(normalized_pose_data):
+                        normalized_frame = self._draw_pose_skeleton_normalized(normalized_frame, frame_count, normalized_pose_data)
+                        normalized_frame = self._draw_ball_normalized(normalized_frame, frame_count, normalized_ball_data)
+                    
+                    if shooting_phases and frame_count < len(shooting_phases):
+                        normalized_frame = self._draw_phase_label(normalized_frame, frame_count, "Normalized", shooting_phases)
+                    
+                    # Add selected hand label to normalized frame
+                    normalized_frame = self._draw_selected_hand_label(normalized_frame, self.selected_hand, self.selected_hand_confidence, frame_count)
+                    
+                    # Stack two frames side by side
+                    combined_frame = np.hstack([original_frame, normalized_frame])
+                    
+                    out.write(combined_frame)
+                    frame_count += 1
+                    
+                    # Print progress (every 10 frames) - disabled for cleaner output
+                    # if frame_count % 10 == 0:
+                    #     print(f"🎬 Processing frames: {frame_count}/{total_frames}")
+            finally:
+                cap.release()
+                out.release()
             
             print(f"✅ Dual visualization video generated: {output_path}")
             print(f"📊 Total processed frames: {frame_count}")
@@ -2070,50 +1846,50 @@ class BasketballShootingAnalyzer:
             print(f"📹 Video information: {width}x{height}, {fps}fps")
             print(f"🎬 Output size: {width}x{height}")
             
-            # Initialize video writer with mp4v codec
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            # Initialize video writer (H.264 via ffmpeg when available, mp4v otherwise)
+            out = open_video_writer(output_path, fps, (width, height))
             
             if not out.isOpened():
                 print("❌ Failed to initialize video writer")
                 return False
             
-            print("✅ Video writer initialized successfully")
-            
-            frame_count = 0
-            total_frames = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                total_frames += 1
-                
-                # Draw original data on frame
-                if frame_count < len(original_pose_data):
-                    frame = self._draw_pose_skeleton_original(frame, frame_count, original_pose_data)
-                    frame = self._draw_ball_original(frame, frame_count, original_ball_data)
-                    frame = self._draw_rim_original(frame, frame_count, original_rim_data)
-    
-                # if shooting_phases and frame_count < len(shooting_phases):
-                    # frame = self._draw_phase_label(frame, frame_count, "Original", shooting_phases)
-                
-                # Add selected hand label
-                frame = self._draw_selected_hand_label(frame, self.selected_hand, self.selected_hand_confidence)
-                
-                # Add shot information label
-                # frame = self._draw_shot_info_label(frame, frame_count)
+            try:
+                print("✅ Video writer initialized successfully")
                 
-                out.write(frame)
-                frame_count += 1
+                frame_count = 0
+                total_frames = 0
                 
-                # Print progress (every 10 frames) - disabled for cleaner output
-                # if frame_count % 10 == 0:
-                #     print(f"🎬 Processing frames: {frame_count}/{total_frames}")
-            
-            cap.release()
-            out.release()
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    
+                    total_frames += 1
+                    
+                    # Draw original data on frame
+                    if frame_count < len(original_pose_data):
+                        frame = self._draw_pose_skeleton_original(frame, frame_count, original_pose_data)
+                        frame = self._draw_ball_original(frame, frame_count, original_ball_data)
+                        frame = self._draw_rim_original(frame, frame_count, original_rim_data)
+        
+                    # if shooting_phases and frame_count < len(shooting_phases):
+                        # frame = self._draw_phase_label(frame, frame_count, "Original", shooting_phases)
+                    
+                    # Add selected hand label
+                    frame = self._draw_selected_hand_label(frame, self.selected_hand, self.selected_hand_confidence)
+                    
+                    # Add shot information label
+                    # frame = self._draw_shot_info_label(frame, frame_count)
+                    
+                    out.write(frame)
+                    frame_count += 1
+                    
+                    # Print progress (every 10 frames) - disabled for cleaner output
+                    # if frame_count % 10 == 0:
+                    #     print(f"🎬 Processing frames: {frame_count}/{total_frames}")
+            finally:
+                cap.release()
+                out.release()
             
             print(f"✅ Original data visualization video generated: {output_path}")
             print(f"📊 Total processed frames: {frame_count}")
@@ -2941,63 +2717,66 @@ class BasketballShootingAnalyzer:
         pose_detected_frames = 0
         
         # Stage 1: Collect proximity and detection statistics from original data
-        for i in range(min(len(self.pose_data), len(self.ball_data))):
-            total_frames += 1
-            pose = self.pose_data[i].get('pose', {})
+        if isinstance(self.pose_data, PoseSequence):
+            left_hand_stats, right_hand_stats = self._collect_hand_stats_from_arrays(original_threshold)
+        else:
+            for i in range(min(len(self.pose_data), len(self.ball_data))):
+                total_frames += 1
+                pose = self.pose_data[i].get('pose', {})
             
-            # Use the same ball data access pattern as phase detection
-            ball_info = None
-            ball_frame_data = self.ball_data[i]
-            if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
-                ball_detections = ball_frame_data['ball_detections']
-                if ball_detections and isinstance(ball_detections[0], dict):
-                    ball_info = ball_detections[0]
+                # Use the same ball data access pattern as phase detection
+                ball_info = None
+                ball_frame_data = self.ball_data[i]
+                if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
+                    ball_detections = ball_frame_data['ball_detections']
+                    if ball_detections and isinstance(ball_detections[0], dict):
+                        ball_info = ball_detections[0]
             
-            if ball_info:
-                ball_detected_frames += 1
-            if pose:
-                pose_detected_frames += 1
+                if ball_info:
+                    ball_detected_frames += 1
+                if pose:
+                    pose_detected_frames += 1
             
-            if not ball_info or not pose:
-                continue
+                if not ball_info or not pose:
+                    continue
             
-            # Get ball position from original data
-            ball_x = ball_info.get('center_x', 0)
-            ball_y = ball_info.get('center_y', 0)
+                # Get ball position from original data
+                ball_x = ball_info.get('center_x', 0)
+                ball_y = ball_info.get('center_y', 0)
 
-            # Check left hand
-            left_wrist = pose.get('left_wrist')
-            left_elbow = pose.get('left_elbow')
-            if left_wrist:
-                left_wrist_x = left_wrist.get('x', 0)
-                left_wrist_y = left_wrist.get('y', 0)
-                left_distance = ((ball_x - left_wrist_x)**2 + (ball_y - left_wrist_y)**2)**0.5
+                # Check left hand
+                left_wrist = pose.get('left_wrist')
+                left_elbow = pose.get('left_elbow')
+                if left_wrist:
+                    left_wrist_x = left_wrist.get('x', 0)
+                    left_wrist_y = left_wrist.get('y', 0)
+                    left_distance = ((ball_x - left_wrist_x)**2 + (ball_y - left_wrist_y)**2)**0.5
 
-                if left_distance < original_threshold:
-                    left_hand_stats["close_frames"] += 1
-                    # Stability calculated only from frames where ball was close
-                    if left_wrist and isinstance(left_wrist, dict) and 'x' in left_wrist and 'y' in left_wrist:
-                        left_hand_stats["wrist_detected"] += 1
-                    if left_elbow and isinstance(left_elbow, dict) and 'x' in left_elbow and 'y' in left_elbow:
-                        left_hand_stats["elbow_detected"] += 1
-                left_hand_stats["total_detected"] += 1
+                    if left_distance < original_threshold:
+                        left_hand_stats["close_frames"] += 1
+                        # Stability calculated only from frames where ball was close
+                        if left_wrist and isinstance(left_wrist, dict) and 'x' in left_wrist and 'y' in left_wrist:
+                            left_hand_stats["wrist_detected"] += 1
+                        if left_elbow and isinstance(left_elbow, dict) and 'x' in left_elbow and 'y' in left_elbow:
+                            left_hand_stats["elbow_detected"] += 1
+                    left_hand_stats["total_detected"] += 1
 
-            # Check right hand
-            right_wrist = pose.get('right_wrist')
-            right_elbow = pose.get('right_elbow')
-            if right_wrist:
-                right_wrist_x = right_wrist.get('x', 0)
-                right_wrist_y = right_wrist.get('y', 0)
-                right_distance = ((ball_x - right_wrist_x)**2 + (ball_y - right_wrist_y)**2)**0.5
+                # Check right hand
+                right_wrist = pose.get('right_wrist')
+                right_elbow = pose.get('right_elbow')
+                if right_wrist:
+                    right_wrist_x = right_wrist.get('x', 0)
+                    right_wrist_y = right_wrist.get('y', 0)
+                    right_distance = ((ball_x - right_wrist_x)**2 + (ball_y - right_wrist_y)**2)**0.5
 
-                if right_distance < original_threshold:
-                    right_hand_stats["close_frames"] += 1
-                    # Stability calculated only from frames where ball was close
-                    if right_wrist and isinstance(right_wrist, dict) and 'x' in right_wrist and 'y' in right_wrist:
-                        right_hand_stats["wrist_detected"] += 1
-                    if right_elbow and isinstance(right_elbow, dict) and 'x' in right_elbow and 'y' in right_elbow:
-                        right_hand_stats["elbow_detected"] += 1
-                right_hand_stats["total_detected"] += 1
+                    if right_distance < original_threshold:
+                        right_hand_stats["close_frames"] += 1
+                        # Stability calculated only from frames where ball was close
+                        if right_wrist and isinstance(right_wrist, dict) and 'x' in right_wrist and 'y' in right_wrist:
+                            right_hand_stats["wrist_detected"] += 1
+                        if right_elbow and isinstance(right_elbow, dict) and 'x' in right_elbow and 'y' in right_elbow:
+                            right_hand_stats["elbow_detected"] += 1
+                    right_hand_stats["total_detected"] += 1
 
         # Calculate proximity ratios
         left_proximity_ratio = 0.0
@@ -3038,6 +2817,40 @@ class BasketballShootingAnalyzer:
         
         return selected_hand, confidence
 
+    def _collect_hand_stats_from_arrays(self, threshold: float) -> Tuple[Dict, Dict]:
+        """
+        Array version of the per-frame hand statistics loop in select_primary_hand_from_original_data
+        (pose_data is a PoseSequence): same counts, computed per hand over all frames at once.
+        """
+        num_frames = min(len(self.pose_data), len(self.ball_data))
+        ball_xy = np.full((num_frames, 2), np.nan)
+        for i in range(num_frames):
+            ball_frame_data = self.ball_data[i]
+            if isinstance(ball_frame_data, dict) and ball_frame_data.get('ball_detections'):
+                ball_detections = ball_frame_data['ball_detections']
+                if ball_detections and isinstance(ball_detections[0], dict):
+                    ball_xy[i] = (ball_detections[0].get('center_x', 0), ball_detections[0].get('center_y', 0))
+        
+        keypoints = self.pose_data.keypoints[:num_frames]
+        has_pose = ~np.all(np.isnan(keypoints[:, :, 2]), axis=1)
+        usable = has_pose & ~np.isnan(ball_xy[:, 0])
+        
+        hand_stats = []
+        for hand in ('left', 'right'):
+            _, elbow, wrist = self.pose_data.selected_hand_keypoints(hand)
+            wrist_present = usable & ~np.isnan(wrist[:num_frames, 2])
+            elbow_present = ~np.isnan(elbow[:num_frames, 2])
+            distance = ((ball_xy[:, 0] - wrist[:num_frames, 0])**2 + (ball_xy[:, 1] - wrist[:num_frames, 1])**2)**0.5
+            with np.errstate(invalid='ignore'):
+                close = wrist_present & (distance < threshold)
+            hand_stats.append({
+                "close_frames": int(np.sum(close)),
+                "total_detected": int(np.sum(wrist_present)),
+                "wrist_detected": int(np.sum(close)),
+                "elbow_detected": int(np.sum(close & elbow_present))
+            })
+        return hand_stats[0], hand_stats[1]
+
     def get_selected_hand_keypoints(self, pose: Dict) -> Tuple[Dict, Dict, Dict]:
         """
         Get keypoints for the selected hand.
@@ -3203,54 +3016,54 @@ class BasketballShootingAnalyzer:
             print(f"📹 Video information: {width}x{height}, {fps}fps")
             print(f"🎬 Output size: {width}x{height}")
             
-            # Initialize video writer with mp4v codec
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            # Initialize video writer (H.264 via ffmpeg when available, mp4v otherwise)
+            out = open_video_writer(output_path, fps, (width, height))
             
             if not out.isOpened():
                 print("❌ Failed to initialize video writer")
                 return False
             
-            print("✅ Video writer initialized successfully")
-            
-            frame_count = 0
-            total_frames = 0
-            
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            try:
+                print("✅ Video writer initialized successfully")
                 
-                total_frames += 1
+                frame_count = 0
+                total_frames = 0
                 
-                # Draw normalized data on frame
-                if frame_count < len(self.normalized_data):
-                    normalized_frame_data = self.normalized_data[frame_count]
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
                     
-                    # Draw normalized pose skeleton
-                    if 'normalized_pose' in normalized_frame_data:
-                        frame = self._draw_normalized_pose_skeleton(frame, frame_count, self.normalized_data)
+                    total_frames += 1
                     
-                    # Draw normalized ball
-                    if 'normalized_ball' in normalized_frame_data:
-                        frame = self._draw_normalized_ball(frame, frame_count, self.normalized_data)
-                
-                # Draw phase label
-                if self.phases and frame_count < len(self.phases):
-                    frame = self._draw_phase_label(frame, frame_count, "Normalized", self.phases)
-                
-                # Add selected hand label
-                frame = self._draw_selected_hand_label(frame, self.selected_hand, self.selected_hand_confidence, frame_count)
-                
-                # Add scaling factor information
-                if frame_count < len(self.normalized_data):
-                    frame = self._draw_scaling_info_label(frame, frame_count)
-                
-                out.write(frame)
-                frame_count += 1
-            
-            cap.release()
-            out.release()
+                    # Draw normalized data on frame
+                    if frame_count < len(self.normalized_data):
+                        normalized_frame_data = self.normalized_data[frame_count]
+                        
+                        # Draw normalized pose skeleton
+                        if 'normalized_pose' in normalized_frame_data:
+                            frame = self._draw_normalized_pose_skeleton(frame, frame_count, self.normalized_data)
+                        
+                        # Draw normalized ball
+                        if 'normalized_ball' in normalized_frame_data:
+                            frame = self._draw_normalized_ball(frame, frame_count, self.normalized_data)
+                    
+                    # Draw phase label
+                    if self.phases and frame_count < len(self.phases):
+                        frame = self._draw_phase_label(frame, frame_count, "Normalized", self.phases)
+                    
+                    # Add selected hand label
+                    frame = self._draw_selected_hand_label(frame, self.selected_hand, self.selected_hand_confidence, frame_count)
+                    
+                    # Add scaling factor information
+                    if frame_count < len(self.normalized_data):
+                        frame = self._draw_scaling_info_label(frame, frame_count)
+                    
+                    out.write(frame)
+                    frame_count += 1
+            finally:
+                cap.release()
+                out.release()
             
             print(f"✅ Normalized data visualization video generated: {output_path}")
             print(f"📊 Total processed frames: {frame_count}")
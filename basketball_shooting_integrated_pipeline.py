@@ -5,12 +5,15 @@ Integrated pipeline for extraction, normalization, and visualization from video
 
 import os
 import glob
+import json
+import time
+import argparse
+import multiprocessing
+import concurrent.futures
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import cv2 # Added for FPS extraction
 import traceback
-# import threading
-# import concurrent.futures
 import shutil
 
 # Import existing analysis pipeline
@@ -18,14 +21,53 @@ from basketball_shooting_analyzer import BasketballShootingAnalyzer
 # Import extraction pipeline
 from pose_extraction.pose_extraction_pipeline import PoseExtractionPipeline
 from ball_extraction.ball_extraction_pipeline import BallExtractionPipeline
+from analysis_logging import get_logger, log_progress
+from extraction_cache import extraction_cache
+
+logger = get_logger(__name__)
+
+# Extraction parameters (part of the extraction cache key)
+POSE_CONFIDENCE_THRESHOLD = 0.3
+BALL_CONF_THRESHOLD = 0.15
+BALL_MIN_CONFIDENCE = 0.3
+MIN_BALL_SIZE = 0.01
 
 class BasketballShootingIntegratedPipeline:
-    def __init__(self):
+    def __init__(self, fused_extraction: bool = True, ball_batch_size: int = 1,
+                 export_json: bool = False,
+                 pose_pipeline: Optional[PoseExtractionPipeline] = None,
+                 ball_pipeline: Optional[BallExtractionPipeline] = None,
+                 use_extraction_cache: bool = True, stream_hand: Optional[str] = None,
+                 shot_callback: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            fused_extraction: Decode each frame once and run both MoveNet and YOLO on it
+                              (False runs the pose and ball pipelines as two separate passes)
+            ball_batch_size: Number of frames per YOLO forward pass (1 = per-frame inference)
+            export_json: Also write original extraction data as JSON (columnar .npz is always written);
+                         applies to the pose/ball pipelines created here
+            pose_pipeline: Already-loaded pose pipeline to reuse (MoveNet is loaded if None)
+            ball_pipeline: Already-loaded ball pipeline to reuse (YOLO is loaded if None)
+            use_extraction_cache: Reuse extraction results for identical video content, models
+                                  and parameters (see extraction_cache)
+            stream_hand: Shooting hand ("left"/"right") for live phase segmentation during fused
+                         extraction: frames are pushed into a PhaseStream as soon as both models
+                         have processed them (None = off; cached extractions are not streamed)
+            shot_callback: Called with each shot the live segmentation completes, mid-extraction
+        """
+        self.fused_extraction = fused_extraction
+        self.ball_batch_size = max(1, int(ball_batch_size))
+        self.use_extraction_cache = use_extraction_cache
+        self.stream_hand = stream_hand
+        self.shot_callback = shot_callback
+        self.streamed_shots: List[Dict] = []  # Shots found by live segmentation in the last fused extraction
         self.references_dir = "data"
         self.video_dir = os.path.join(self.references_dir, "video")
         self.extracted_data_dir = os.path.join(self.references_dir, "extracted_data")
-        self.pose_pipeline = PoseExtractionPipeline(output_dir=self.extracted_data_dir)
-        self.ball_pipeline = BallExtractionPipeline(output_dir=self.extracted_data_dir)
+        self.pose_pipeline = pose_pipeline or PoseExtractionPipeline(output_dir=self.extracted_data_dir,
+                                                                      export_json=export_json)
+        self.ball_pipeline = ball_pipeline or BallExtractionPipeline(output_dir=self.extracted_data_dir,
+                                                                      export_json=export_json)
         
         # Create analyzer instance
         self.analyzer = BasketballShootingAnalyzer()
@@ -33,12 +75,20 @@ class BasketballShootingIntegratedPipeline:
         print("🏀 Basketball Shooting Integrated Pipeline Initialized")
         print("=" * 50)
 
+    def reset_run_state(self):
+        """
+        Drop per-video state so the loaded models can be reused for the next video.
+        The analyzer's phase/shot state is not reset between runs, so it is recreated.
+        """
+        self.analyzer = BasketballShootingAnalyzer()
+        self.pose_pipeline.model_layer.reset_crop_region()
+
     def prompt_extraction_mode(self) -> Optional[bool]:
         """Choose whether to use existing extraction data or extract new data"""
         print("\n⚙️ Extraction data mode selection")
         print("-" * 30)
         print("[1] Use existing extraction data (fast, for experiment repetition)")
-        print("[2] New extraction (model re-execution)")
+        print("[2] New extraction (model re-execution; identical runs come from the extraction cache)")
         print("[3] Cancel")
         while True:
             choice = input("\nSelection (1/2/3): ").strip()
@@ -51,16 +101,22 @@ class BasketballShootingIntegratedPipeline:
             else:
                 print("❌ Please enter a valid number (1, 2, 3)")
 
-    def run_full_pipeline(self, video_path: str, overwrite_mode: bool = False, use_existing_extraction: bool = True) -> bool:
+    def run_full_pipeline(self, video_path: str, overwrite_mode: bool = False, use_existing_extraction: bool = True,
+                          progress_callback: Optional[Callable[[str], None]] = None) -> bool:
         """
         Run the full pipeline: extraction → normalization → visualization
         Args:
             video_path: Path to the video file
             overwrite_mode: Overwrite mode
             use_existing_extraction: Whether to use existing extraction data
+            progress_callback: Called with the stage name ("extract", "segment", "normalize") as each stage starts
         Returns:
             Success status
         """
+        def report_stage(stage: str):
+            if progress_callback is not None:
+                progress_callback(stage)
+        
         print(f"🎬 Starting Full Pipeline: {os.path.basename(video_path)}")
         print("=" * 50)
         try:
@@ -68,6 +124,7 @@ class BasketballShootingIntegratedPipeline:
             # STEP 1: Extract original data
             print("\n🔍 STEP 1: Extract original data")
             print("-" * 30)
+            report_stage("extract")
             if not self._extract_original_data(video_path, overwrite_mode, use_existing_extraction):
                 print("❌ Failed to extract original data")
                 return False
@@ -83,6 +140,7 @@ class BasketballShootingIntegratedPipeline:
             # STEP 3: Segment shooting phases
             print("\n🎯 STEP 3: Segment shooting phases")
             print("-" * 30)
+            report_stage("segment")
             print("  - Dynamic torso measurement from first transition")
             print("  - FPS-adjusted thresholds")
             
@@ -92,6 +150,7 @@ class BasketballShootingIntegratedPipeline:
             # STEP 4: Normalize and save data
             print("\n🔄 STEP 4: Normalize and save data")
             print("-" * 30)
+            report_stage("normalize")
             print("  - Using torso measurement from first phase transition")
             print("  - Direction normalization and coordinate standardization")
             
@@ -128,7 +187,7 @@ class BasketballShootingIntegratedPipeline:
         print("🔍 Extracting pose data with coordinate transformation...")
         print("  - MoveNet crop coordinates → Full frame coordinates")
         print("  - Aspect ratio correction applied to x-axis")
-        pose_file = self.pose_pipeline.extract_poses(video_path, confidence_threshold=0.3)
+        pose_file = self.pose_pipeline.extract_poses(video_path, confidence_threshold=POSE_CONFIDENCE_THRESHOLD)
         print(f"✅ Pose extraction completed: {os.path.basename(pose_file)}")
         return pose_file
     
@@ -137,46 +196,221 @@ class BasketballShootingIntegratedPipeline:
         print("  - YOLO using 0~1 normalized coordinates")
         print("  - Aspect ratio correction applied to x-axis")
         ball_file = self.ball_pipeline.extract_ball_trajectory(
-            video_path, conf_threshold=0.15, min_confidence=0.3, min_ball_size=0.01
+            video_path, conf_threshold=BALL_CONF_THRESHOLD, min_confidence=BALL_MIN_CONFIDENCE,
+            min_ball_size=MIN_BALL_SIZE, batch_size=self.ball_batch_size
         )
         print(f"✅ Ball extraction completed: {os.path.basename(ball_file)}")
         return ball_file
     
+    def _extract_fused(self, video_path: str) -> Tuple[str, str]:
+        """
+        Single-decode extraction: each frame is read once and handed to both
+        MoveNet and YOLO, instead of decoding the whole video once per model.
+        Produces the same pose/ball/rim files as _extract_pose + _extract_ball.
+        """
+        print("🔍 Extracting pose and ball data in a single decode pass...")
+        print("  - MoveNet crop coordinates → Full frame coordinates")
+        print("  - YOLO using 0~1 normalized coordinates")
+        print("  - Aspect ratio correction applied to x-axis")
+        
+        pose_layer = self.pose_pipeline.model_layer
+        ball_layer = self.ball_pipeline.detection_layer
+        
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+        
+        fps = int(cap.get(cv2.CAP_PROP_FPS))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        print(f"Video information: {total_frames} frames, {fps} fps")
+        
+        # Crop tracking must not leak in from a previously processed video
+        pose_layer.reset_crop_region()
+        
+        raw_pose_data = []
+        raw_ball_trajectory = []
+        rim_info = []
+        output_images = []
+        frame_count = 0
+        # Frames waiting for the next batched YOLO forward pass
+        pending_frames = []
+        
+        # Live phase segmentation on a separate analyzer, so self.analyzer's shot state stays clean
+        phase_stream = None
+        self.streamed_shots = []
+        if self.stream_hand:
+            stream_analyzer = BasketballShootingAnalyzer()
+            stream_analyzer.video_fps = fps
+            phase_stream = stream_analyzer.create_phase_stream("hybrid_fps", self.stream_hand)
+        
+        def push_ready_frames():
+            # Frames both models have processed, filtered the way the saved files are
+            ready_frames = min(len(raw_pose_data), len(raw_ball_trajectory))
+            for frame_idx in range(len(phase_stream.phases), ready_frames):
+                pose_frame = self.pose_pipeline._filter_low_confidence_poses(
+                    [raw_pose_data[frame_idx]], POSE_CONFIDENCE_THRESHOLD
+                )[0]
+                ball_frame = ball_layer.filter_ball_frame(
+                    raw_ball_trajectory[frame_idx], BALL_MIN_CONFIDENCE, MIN_BALL_SIZE
+                )
+                _, completed_shot = phase_stream.push(pose_frame, ball_frame)
+                if completed_shot is not None:
+                    print(f"🏀 Shot {completed_shot['shot_id']} detected during extraction: "
+                          f"frames {completed_shot['start_frame']}-{completed_shot['end_frame']}")
+                    if self.shot_callback is not None:
+                        self.shot_callback(completed_shot)
+        
+        def flush_ball_batch():
+            batch_detections = ball_layer._detect_ball_and_rim_in_frames(
+                pending_frames, conf_threshold=BALL_CONF_THRESHOLD, classes=[0, 1, 2], iou_threshold=0.1
+            )
+            for ball_detections, rim_detections in batch_detections:
+                ball_frame_number = len(raw_ball_trajectory) + 1
+                raw_ball_trajectory.append({
+                    "frame_number": ball_frame_number,
+                    "timestamp": ball_frame_number / fps,
+                    "ball_detections": ball_detections,
+                    "ball_count": len(ball_detections)
+                })
+                rim_info.append({
+                    "frame_number": ball_frame_number,
+                    "timestamp": ball_frame_number / fps,
+                    "rim_detections": rim_detections,
+                    "rim_count": len(rim_detections)
+                })
+            pending_frames.clear()
+        
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frame_count += 1
+                
+                log_progress(logger, "Processing frame", frame_count, total_frames)
+                
+                pose = pose_layer.detect_pose(frame, output_images)
+                raw_pose_data.append({
+                    "frame_number": frame_count,
+                    "timestamp": frame_count / fps,
+                    "pose": pose
+                })
+                
+                pending_frames.append(frame)
+                if len(pending_frames) >= self.ball_batch_size:
+                    flush_ball_batch()
+                
+                if phase_stream is not None:
+                    push_ready_frames()
+            
+            if pending_frames:
+                flush_ball_batch()
+        finally:
+            cap.release()
+        
+        print(f"\nTotal {frame_count} frames extracted in a single pass")
+        if phase_stream is not None:
+            push_ready_frames()
+            self.streamed_shots = phase_stream.close()
+            print(f"🏀 Live segmentation: {len(self.streamed_shots)} shots ({self.stream_hand} hand)")
+        
+        pose_file = self.pose_pipeline.save_extracted_poses(video_path, raw_pose_data,
+                                                            confidence_threshold=POSE_CONFIDENCE_THRESHOLD)
+        print(f"✅ Pose extraction completed: {os.path.basename(pose_file)}")
+        ball_file = self.ball_pipeline.save_extracted_ball_data(
+            video_path, raw_ball_trajectory, rim_info, min_confidence=BALL_MIN_CONFIDENCE, min_ball_size=MIN_BALL_SIZE
+        )
+        print(f"✅ Ball extraction completed: {os.path.basename(ball_file)}")
+        return pose_file, ball_file
+    
     def _extract_original_data(self, video_path: str, overwrite_mode: bool = False, use_existing_extraction: bool = True) -> bool:
         """Extract original data sequentially for Cloud Run stability"""
         base_name = os.path.splitext(os.path.basename(video_path))[0]
         
-        pose_original_file = os.path.join(self.extracted_data_dir, f"{base_name}_pose_original.json")
-        ball_original_file = os.path.join(self.extracted_data_dir, f"{base_name}_ball_original.json")
+        # Columnar .npz is the primary format; a JSON-only extraction (older runs) also counts
+        pose_original_file = next((path for path in (
+            os.path.join(self.extracted_data_dir, f"{base_name}_pose_original.npz"),
+            os.path.join(self.extracted_data_dir, f"{base_name}_pose_original.json")
+        ) if os.path.exists(path)), None)
+        ball_original_file = next((path for path in (
+            os.path.join(self.extracted_data_dir, f"{base_name}_ball_original.npz"),
+            os.path.join(self.extracted_data_dir, f"{base_name}_ball_original.json")
+        ) if os.path.exists(path)), None)
         
-        if use_existing_extraction and (os.path.exists(pose_original_file) or os.path.exists(ball_original_file)):
+        if use_existing_extraction and (pose_original_file or ball_original_file):
             print(f"⚠️ Using existing extraction data:")
-            if os.path.exists(pose_original_file):
+            if pose_original_file:
                 print(f"  - Pose data: {os.path.basename(pose_original_file)}")
-            if os.path.exists(ball_original_file):
+            if ball_original_file:
                 print(f"  - Ball data: {os.path.basename(ball_original_file)}")
             return True
         
         # Remove interactive prompt for Cloud Run
-        if not use_existing_extraction and not overwrite_mode and (os.path.exists(pose_original_file) or os.path.exists(ball_original_file)):
+        if not use_existing_extraction and not overwrite_mode and (pose_original_file or ball_original_file):
             print("⚠️ Using existing data (non-interactive mode for Cloud Run)")
             return True
         
-        try:
-            # ✅ SEQUENTIAL EXECUTION - Fixes GPU/CPU conflicts
-            print("🔍 Starting pose extraction...")
-            pose_file = self._extract_pose(video_path)
-            
-            print("🔍 Starting ball extraction...")
-            ball_file = self._extract_ball(video_path)
-            
-            print("✅ Both extractions completed sequentially")
+        # Same video content, models and parameters as an earlier run: skip MoveNet and YOLO
+        cache_key = self._extraction_cache_key(video_path)
+        if cache_key is not None and extraction_cache.restore(cache_key, self.extracted_data_dir, base_name):
+            # Only the .npz artifacts are cached; the optional JSON exports are rebuilt from them
+            try:
+                if self.pose_pipeline.export_json:
+                    self.pose_pipeline.export_original_json(video_path)
+                if self.ball_pipeline.export_json:
+                    self.ball_pipeline.export_original_json(video_path)
+            except Exception as e:
+                print(f"❌ Failed to export cached extraction data as JSON: {e}")
+                traceback.print_exc()
+                return False
             return True
+        
+        try:
+            if self.fused_extraction:
+                self._extract_fused(video_path)
+                print("✅ Fused extraction completed")
+            else:
+                # ✅ SEQUENTIAL EXECUTION - Fixes GPU/CPU conflicts
+                print("🔍 Starting pose extraction...")
+                pose_file = self._extract_pose(video_path)
+                
+                print("🔍 Starting ball extraction...")
+                ball_file = self._extract_ball(video_path)
+                
+                print("✅ Both extractions completed sequentially")
 
         except Exception as e:
             print(f"❌ Failed to extract data: {e}")
             traceback.print_exc()
             return False
+        
+        if cache_key is not None:
+            extraction_cache.store(cache_key, self.extracted_data_dir, base_name)
+        return True
+    
+    def _extraction_cache_key(self, video_path: str) -> Optional[str]:
+        """Extraction cache key for the video, or None if caching is off or the key cannot be computed"""
+        if not (self.use_extraction_cache and extraction_cache.enabled):
+            return None
+        try:
+            return extraction_cache.make_key(
+                video_path,
+                models={
+                    "movenet": self.pose_pipeline.model_layer.model_path,
+                    "yolo": self.ball_pipeline.detection_layer.model_path
+                },
+                params={
+                    "pose_confidence_threshold": POSE_CONFIDENCE_THRESHOLD,
+                    "ball_conf_threshold": BALL_CONF_THRESHOLD,
+                    "ball_min_confidence": BALL_MIN_CONFIDENCE,
+                    "min_ball_size": MIN_BALL_SIZE,
+                    # Batched YOLO is kept separate to be safe
+                    "ball_batch_size": self.ball_batch_size
+                }
+            )
+        except OSError as e:
+            print(f"⚠️ Extraction cache unavailable: {e}")
+            return None
 
     def get_folder_name_from_path(self, video_path: str) -> str:
         # Extract folder name from video_path
@@ -510,12 +744,201 @@ class BasketballShootingIntegratedPipeline:
             else:
                 print("❌ Invalid selection. Please choose 1, 2, or 3.")
 
-def main():
+# Pipeline owned by a batch worker process (models are loaded once per worker)
+_worker_pipeline = None
+
+def _init_batch_worker(ball_batch_size: int, export_json: bool = False, use_extraction_cache: bool = True):
+    """Process pool initializer: load MoveNet/YOLO once for this worker"""
+    global _worker_pipeline
+    _worker_pipeline = BasketballShootingIntegratedPipeline(ball_batch_size=ball_batch_size,
+                                                            export_json=export_json,
+                                                            use_extraction_cache=use_extraction_cache)
+
+def _process_batch_video(video_path: str, use_existing_extraction: bool) -> Dict:
+    """Run the full pipeline for one video inside a batch worker and report status/timing"""
+    start_time = time.perf_counter()
+    error = None
+    try:
+        _worker_pipeline.reset_run_state()
+        success = _worker_pipeline.run_full_pipeline(
+            video_path, overwrite_mode=True, use_existing_extraction=use_existing_extraction
+        )
+    except Exception as e:
+        success = False
+        error = str(e)
+        traceback.print_exc()
+    
+    return {
+        "video_path": video_path,
+        "status": "success" if success else "failed",
+        "error": error,
+        "duration_seconds": round(time.perf_counter() - start_time, 3),
+        "worker_pid": os.getpid()
+    }
+
+def collect_batch_videos(source: str) -> List[str]:
+    """
+    Resolve a directory or glob pattern to a sorted list of video files
+    
+    Raises:
+        ValueError: Two videos share a base name (recursive globs, or e.g. a.mp4 and a.mov).
+            Extraction data, results and visualizations are named after the base name,
+            so their outputs would overwrite each other.
+    """
+    video_extensions = ['.mp4', '.mov', '.avi', '.mkv']
+    videos = []
+    if os.path.isdir(source):
+        for ext in video_extensions:
+            videos.extend(glob.glob(os.path.join(source, f"*{ext}")))
+            videos.extend(glob.glob(os.path.join(source, f"*{ext.upper()}")))
+    else:
+        videos = [
+            path for path in glob.glob(source, recursive=True)
+            if os.path.splitext(path)[1].lower() in video_extensions
+        ]
+    videos = sorted(set(videos))
+    
+    videos_by_name = {}
+    for video in videos:
+        videos_by_name.setdefault(os.path.splitext(os.path.basename(video))[0], []).append(video)
+    duplicates = {name: paths for name, paths in videos_by_name.items() if len(paths) > 1}
+    if duplicates:
+        details = "; ".join(f"{name}: {', '.join(paths)}" for name, paths in sorted(duplicates.items()))
+        raise ValueError(f"Batch videos must have unique file names (outputs are named after them): {details}")
+    return videos
+
+def run_batch(source: str, workers: int = 2, manifest_path: Optional[str] = None,
+              use_existing_extraction: bool = False, ball_batch_size: int = 1,
+              export_json: bool = False, use_extraction_cache: bool = True) -> Dict:
+    """
+    Non-interactive batch mode: process every video matched by source in parallel
+    
+    Args:
+        source: Directory of videos or glob pattern (e.g. "data/video/**/*.mp4")
+        workers: Number of worker processes (each loads its own models once)
+        manifest_path: Where to write the JSON manifest (default: data/results/batch_manifest_<timestamp>.json)
+        use_existing_extraction: Reuse existing extraction files when present
+        ball_batch_size: Number of frames per YOLO forward pass
+        export_json: Also write original extraction data as JSON
+        use_extraction_cache: Reuse extraction results for identical video content, models and parameters
+    Returns:
+        Manifest dict with per-video status and timings
+    Raises:
+        ValueError: Matched videos share a base name (see collect_batch_videos)
+    """
+    videos = collect_batch_videos(source)
+    workers = max(1, min(int(workers), len(videos))) if videos else 1
+    
+    print(f"🏀 Batch processing {len(videos)} videos with {workers} workers")
+    print("=" * 50)
+    
+    started_at = datetime.now()
+    start_time = time.perf_counter()
+    results = {}
+    
+    if videos:
+        # spawn: TensorFlow/PyTorch state is not fork-safe
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(ball_batch_size, export_json, use_extraction_cache)
+        ) as executor:
+            futures = {
+                executor.submit(_process_batch_video, video, use_existing_extraction): video
+                for video in videos
+            }
+            for future in concurrent.futures.as_completed(futures):
+                video = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed or failed to load models)
+                    result = {
+                        "video_path": video,
+                        "status": "failed",
+                        "error": str(e),
+                        "duration_seconds": None,
+                        "worker_pid": None
+                    }
+                results[video] = result
+                status_icon = "✅" if result["status"] == "success" else "❌"
+                print(f"{status_icon} [{len(results)}/{len(videos)}] {os.path.basename(video)} ({result['duration_seconds']}s)")
+    
+    video_results = [results[video] for video in videos]
+    succeeded = sum(1 for result in video_results if result["status"] == "success")
+    manifest = {
+        "source": source,
+        "started_at": started_at.isoformat(),
+        "finished_at": datetime.now().isoformat(),
+        "workers": workers,
+        "ball_batch_size": ball_batch_size,
+        "export_json": export_json,
+        "use_existing_extraction": use_existing_extraction,
+        "use_extraction_cache": use_extraction_cache,
+        "total_videos": len(videos),
+        "succeeded": succeeded,
+        "failed": len(videos) - succeeded,
+        "total_duration_seconds": round(time.perf_counter() - start_time, 3),
+        "videos": video_results
+    }
+    
+    if manifest_path is None:
+        manifest_path = os.path.join("data", "results", f"batch_manifest_{started_at.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    
+    print(f"\n🎉 Batch processing completed: {succeeded}/{len(videos)} videos succeeded")
+    print(f"📁 Manifest saved to: {manifest_path}")
+    return manifest
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Basketball Shooting Integrated Pipeline")
+    parser.add_argument("--batch", metavar="PATH_OR_GLOB",
+                        help="Non-interactive batch mode: directory of videos or glob pattern")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Number of worker processes for batch mode (default: 2)")
+    parser.add_argument("--manifest", default=None,
+                        help="Output path for the batch manifest JSON")
+    parser.add_argument("--reuse-extraction", action="store_true",
+                        help="Reuse existing extraction data when available")
+    parser.add_argument("--ball-batch-size", type=int, default=1,
+                        help="Number of frames per YOLO forward pass (default: 1)")
+    parser.add_argument("--export-json", action="store_true",
+                        help="Also write original pose/ball/rim data as JSON (default: .npz only)")
+    parser.add_argument("--no-extraction-cache", dest="use_extraction_cache", action="store_false",
+                        help="Always run MoveNet/YOLO, even for videos already in the extraction cache")
+    parser.add_argument("--stream-hand", choices=["left", "right"], default=None,
+                        help="Segment phases live during extraction for this shooting hand and report "
+                             "shots as they complete (interactive mode, fused extraction only)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function"""
+    args = parse_args(argv)
+    if args.batch:
+        try:
+            run_batch(
+                args.batch,
+                workers=args.workers,
+                manifest_path=args.manifest,
+                use_existing_extraction=args.reuse_extraction,
+                ball_batch_size=args.ball_batch_size,
+                export_json=args.export_json,
+                use_extraction_cache=args.use_extraction_cache
+            )
+        except ValueError as e:
+            raise SystemExit(f"❌ {e}")
+        return
+    
     print("🏀 Basketball Shooting Integrated Pipeline")
     print("=" * 50)
     
-    pipeline = BasketballShootingIntegratedPipeline()
+    pipeline = BasketballShootingIntegratedPipeline(ball_batch_size=args.ball_batch_size,
+                                                    export_json=args.export_json,
+                                                    use_extraction_cache=args.use_extraction_cache,
+                                                    stream_hand=args.stream_hand)
     
     # Get video selection
     video_selections = pipeline.prompt_video_selection()
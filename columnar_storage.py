@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar storage
+Zero-copy loading and atomic saving of the .npz extraction artifacts (pose, ball/rim)
+
+np.savez stores every array uncompressed, so each array's bytes sit contiguously inside the
+.npz (zip) file. load_npz_arrays memory-maps them in place instead of reading copies: loading
+costs a few header reads, and only the frames an analysis touches are paged in.
+
+Mapped arrays are read-only views of the file. Files are therefore replaced atomically
+(save_npz_atomic / replace_file_atomic) and never rewritten in place: truncating a file that
+another reader still has mapped would crash that reader (SIGBUS) on its next access.
+"""
+
+import os
+import struct
+import threading
+import zipfile
+from typing import Dict
+
+import numpy as np
+
+# Fixed part of a zip local file header (signature ... extra field length)
+ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+def _array_offset(file, info: zipfile.ZipInfo):
+    """(shape, fortran_order, dtype, file offset of the data) of a stored .npy member, or None"""
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    file.seek(info.header_offset)
+    header = ZIP_LOCAL_HEADER.unpack(file.read(ZIP_LOCAL_HEADER.size))
+    if header[0] != ZIP_LOCAL_HEADER_SIGNATURE:
+        return None
+    name_length, extra_length = header[-2], header[-1]
+    file.seek(info.header_offset + ZIP_LOCAL_HEADER.size + name_length + extra_length)
+
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    else:
+        return None
+    return shape, fortran_order, dtype, file.tell()
+
+
+def load_npz_arrays(filepath: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Load every array of an .npz file.
+
+    Args:
+        filepath: .npz file (as written by np.savez / save_npz_atomic)
+        mmap: Memory-map the arrays instead of reading them
+
+    Returns:
+        Dict of array name -> array. With mmap, arrays are read-only np.memmap views of the
+        file; scalars, empty arrays and compressed members (np.savez_compressed) are read.
+    """
+    arrays = {}
+    with zipfile.ZipFile(filepath) as archive, open(filepath, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")] if info.filename.endswith(".npy") else info.filename
+            layout = _array_offset(file, info) if mmap else None
+            if layout is not None:
+                shape, fortran_order, dtype, offset = layout
+                if shape and int(np.prod(shape)) > 0 and not dtype.hasobject:
+                    arrays[name] = np.memmap(filepath, dtype=dtype, mode="r", offset=offset, shape=shape,
+                                             order="F" if fortran_order else "C")
+                    continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return arrays
+
+
+def replace_file_atomic(filepath: str, data: bytes):
+    """Write data to filepath through a temporary file and a rename (mapped readers keep the old file)"""
+    temp_path = f"{filepath}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def save_npz_atomic(filepath: str, **arrays):
+    """
+    np.savez to filepath through a temporary file and a rename.
+
+    Args:
+        filepath: Output .npz path (used as given; np.savez would append ".npz" to other names)
+        **arrays: Arrays to store (uncompressed, so load_npz_arrays can map them)
+    """
+    temp_path = f"{filepath}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
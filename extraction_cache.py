@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Extraction cache
+Content-addressed cache of pose/ball extraction artifacts, shared by the CLI and the backend
+
+An entry is keyed by the video's SHA-256, the identity of the models (MoveNet SavedModel and
+YOLO weights, hashed by content) and the extraction parameters, so re-analyzing the same clip
+(e.g. while tuning the phase detectors) skips MoveNet and YOLO no matter what the file is called.
+
+Two tiers:
+    memory  Per-process LRU of artifact bytes (EXTRACTION_CACHE_MEMORY_MB)
+    disk    One directory per key under EXTRACTION_CACHE_DIR, shared between processes;
+            least recently used entries are evicted above EXTRACTION_CACHE_MAX_MB
+
+Only the columnar .npz artifacts are cached (they hold pose, ball and rim data); the optional
+JSON exports are rebuilt from the restored .npz on a hit (see the extraction pipelines'
+export_original_json).
+
+Environment:
+    EXTRACTION_CACHE            "0" disables the cache
+    EXTRACTION_CACHE_DIR        Disk tier directory (data/extraction_cache)
+    EXTRACTION_CACHE_MAX_MB     Disk tier size limit (2048)
+    EXTRACTION_CACHE_MEMORY_MB  Memory tier size limit (256)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from columnar_storage import replace_file_atomic
+
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE", "1") != "0"
+EXTRACTION_CACHE_DIR = os.getenv("EXTRACTION_CACHE_DIR", "data/extraction_cache")
+EXTRACTION_CACHE_MAX_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "2048")) * 1024 * 1024
+EXTRACTION_CACHE_MEMORY_BYTES = int(os.getenv("EXTRACTION_CACHE_MEMORY_MB", "256")) * 1024 * 1024
+
+# Bump when extraction code changes its output for the same models and parameters
+EXTRACTION_VERSION = "1"
+
+# Cached artifact -> file suffix in the extracted data directory
+ARTIFACT_SUFFIXES = {
+    "pose": "_pose_original.npz",
+    "ball": "_ball_original.npz"
+}
+
+# Bytes read at a time when hashing videos and model files
+HASH_CHUNK_SIZE = 1024 * 1024
+# Number of file hashes remembered per process
+HASH_MEMO_SIZE = 256
+
+_hash_memo: "OrderedDict[str, Tuple[Tuple, str]]" = OrderedDict()
+_hash_memo_lock = threading.Lock()
+
+
+def _file_signature(path: str) -> Tuple:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def file_sha256(path: str) -> str:
+    """
+    SHA-256 of a file's contents (hex).
+
+    Hashes are remembered per path while the file's size and mtime are unchanged, so a video
+    hashed by the backend's result cache is not read again for the extraction cache.
+    """
+    path = os.path.abspath(path)
+    signature = _file_signature(path)
+    with _hash_memo_lock:
+        memo = _hash_memo.get(path)
+        if memo is not None and memo[0] == signature:
+            _hash_memo.move_to_end(path)
+            return memo[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    file_hash = digest.hexdigest()
+
+    with _hash_memo_lock:
+        _hash_memo[path] = (signature, file_hash)
+        _hash_memo.move_to_end(path)
+        while len(_hash_memo) > HASH_MEMO_SIZE:
+            _hash_memo.popitem(last=False)
+    return file_hash
+
+
+def model_fingerprint(path: str) -> str:
+    """
+    Content hash of a model file or directory (e.g. a TensorFlow SavedModel).
+
+    Args:
+        path: Model file or directory
+
+    Returns:
+        Hex hash; "name:<file name>" for models that are not local files (e.g. downloaded by name)
+    """
+    if os.path.isfile(path):
+        return file_sha256(path)
+    if not os.path.isdir(path):
+        return f"name:{os.path.basename(path)}"
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode("utf-8"))
+            digest.update(file_sha256(file_path).encode("ascii"))
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier (memory, disk) cache of extraction artifacts.
+
+    Lookups restore the artifacts into the extracted data directory under the video's base
+    name, where BasketballShootingAnalyzer.load_associated_data reads them.
+    """
+
+    def __init__(self, directory: str = EXTRACTION_CACHE_DIR, max_disk_bytes: int = EXTRACTION_CACHE_MAX_BYTES,
+                 max_memory_bytes: int = EXTRACTION_CACHE_MEMORY_BYTES, enabled: bool = EXTRACTION_CACHE_ENABLED):
+        """
+        Args:
+            directory: Disk tier directory
+            max_disk_bytes: Disk tier size limit (least recently used entries are evicted above it)
+            max_memory_bytes: Memory tier size limit (0 disables the memory tier)
+            enabled: False makes every lookup a miss and every store a no-op
+        """
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, Dict[str, bytes]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, video_path: str, models: Dict[str, str], params: Dict) -> str:
+        """
+        Cache key for a video, the models run on it and the extraction parameters.
+
+        Args:
+            video_path: Video file (hashed by content)
+            models: Model name -> model path (hashed by content)
+            params: Extraction parameters that change the output
+
+        Returns:
+            Hex key
+        """
+        key_data = json.dumps({
+            "video": file_sha256(video_path),
+            "models": {name: model_fingerprint(path) for name, path in models.items()},
+            "params": params,
+            "version": EXTRACTION_VERSION
+        }, sort_keys=True)
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def restore(self, key: str, extracted_data_dir: str, base_name: str) -> bool:
+        """
+        Write cached artifacts as <base_name>_pose_original.npz / _ball_original.npz.
+
+        Args:
+            key: Cache key (make_key)
+            extracted_data_dir: Directory the analyzer loads extraction data from
+            base_name: Video file name without extension
+
+        Returns:
+            True on a cache hit
+        """
+        if not self.enabled:
+            return False
+        artifacts = self._memory_get(key)
+        tier = "memory"
+        if artifacts is None:
+            artifacts = self._disk_get(key)
+            tier = "disk"
+            if artifacts is None:
+                return False
+            self._memory_put(key, artifacts)
+
+        os.makedirs(extracted_data_dir, exist_ok=True)
+        for name, data in artifacts.items():
+            # Replaced, not rewritten: an analysis may still have the previous file memory-mapped
+            replace_file_atomic(os.path.join(extracted_data_dir, f"{base_name}{ARTIFACT_SUFFIXES[name]}"), data)
+        print(f"⚡ Extraction cache hit ({tier}): {key[:12]}")
+        return True
+
+    def store(self, key: str, extracted_data_dir: str, base_name: str) -> bool:
+        """
+        Cache the artifacts a fresh extraction wrote for base_name.
+
+        Args:
+            key: Cache key (make_key)
+            extracted_data_dir: Directory the extraction wrote to
+            base_name: Video file name without extension
+
+        Returns:
+            True if the artifacts were cached
+        """
+        if not self.enabled:
+            return False
+        artifacts = {}
+        try:
+            for name, suffix in ARTIFACT_SUFFIXES.items():
+                with open(os.path.join(extracted_data_dir, f"{base_name}{suffix}"), "rb") as f:
+                    artifacts[name] = f.read()
+        except OSError as e:
+            print(f"⚠️ Extraction cache store skipped: {e}")
+            return False
+
+        self._memory_put(key, artifacts)
+        try:
+            self._disk_put(key, artifacts)
+            self._evict_disk()
+        except OSError as e:
+            print(f"⚠️ Extraction cache disk write failed: {e}")
+        return True
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[Dict[str, bytes]]:
+        with self._lock:
+            artifacts = self._memory.get(key)
+            if artifacts is not None:
+                self._memory.move_to_end(key)
+            return artifacts
+
+    def _memory_put(self, key: str, artifacts: Dict[str, bytes]):
+        size = sum(len(data) for data in artifacts.values())
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= sum(len(data) for data in previous.values())
+            self._memory[key] = artifacts
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= sum(len(data) for data in evicted.values())
+
+    # Disk tier
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, bytes]]:
+        entry_dir = self._entry_dir(key)
+        artifacts = {}
+        try:
+            for name in ARTIFACT_SUFFIXES:
+                with open(os.path.join(entry_dir, f"{name}.npz"), "rb") as f:
+                    artifacts[name] = f.read()
+            os.utime(entry_dir)  # Recency for LRU eviction
+        except OSError:
+            return None
+        return artifacts
+
+    def _disk_put(self, key: str, artifacts: Dict[str, bytes]):
+        entry_dir = self._entry_dir(key)
+        if os.path.isdir(entry_dir):
+            os.utime(entry_dir)
+            return
+        # Write into a temporary directory and rename it, so readers never see a partial entry
+        temp_dir = os.path.join(self.directory, f".tmp-{key}-{os.getpid()}-{threading.get_ident()}")
+        os.makedirs(temp_dir, exist_ok=True)
+        try:
+            for name, data in artifacts.items():
+                with open(os.path.join(temp_dir, f"{name}.npz"), "wb") as f:
+                    f.write(data)
+            os.rename(temp_dir, entry_dir)
+        except OSError:
+            if not os.path.isdir(entry_dir):
+                raise
+            # Another process stored the same entry first
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _evict_disk(self):
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.is_dir() or entry.name.startswith("."):
+                    continue
+                try:
+                    size = sum(os.path.getsize(os.path.join(entry.path, name)) for name in os.listdir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+                except OSError:
+                    continue  # Removed by another process
+                total_bytes += size
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_bytes -= size
+
+
+# Shared cache (the memory tier is per process, the disk tier is shared)
+extraction_cache = ExtractionCache()
@@ -9,11 +9,13 @@ from .ball_based_phase_detector import BallBasedPhaseDetector
 from .torso_based_phase_detector import TorsoBasedPhaseDetector
 from .resolution_based_phase_detector import ResolutionBasedPhaseDetector
 from .hybrid_fps_phase_detector import HybridFPSPhaseDetector
+from .phase_stream import PhaseStream
 
 __all__ = [
     'BasePhaseDetector',
     'BallBasedPhaseDetector', 
     'TorsoBasedPhaseDetector',
     'ResolutionBasedPhaseDetector',
-    'HybridFPSPhaseDetector'
+    'HybridFPSPhaseDetector',
+    'PhaseStream'
 ] 
\ No newline at end of file
@@ -33,11 +33,8 @@ class BallBasedPhaseDetector(BasePhaseDetector):
             Index of most recent valid frame, or None if no valid frame found
         """
         for i in range(frame_idx - 1, -1, -1):
-            pose = self.get_pose_info(i, pose_data)
-            ball_info = self.get_ball_info(i, ball_data)
-            
             # Simple check: if pose data exists and has at least one keypoint
-            if pose and len(pose) > 0:
+            if self.has_pose(i, pose_data):
                 return i
         
         return None
@@ -5,9 +5,12 @@ Abstract base class for all phase detection strategies.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+from pose_extraction.pose_sequence import PoseSequence
+
 
 class BasePhaseDetector(ABC):
     """
@@ -16,6 +19,9 @@ class BasePhaseDetector(ABC):
     All phase detectors must implement the check_phase_transition method.
     """
     
+    # Frames whose pose dicts get_pose_info keeps for a PoseSequence (current + previous)
+    POSE_MEMO_SIZE = 4
+    
     def __init__(self, min_phase_duration: int = 3, noise_threshold: int = 4):
         """
         Initialize the phase detector.
@@ -27,6 +33,12 @@ class BasePhaseDetector(ABC):
         self.min_phase_duration = min_phase_duration
         self.noise_threshold = noise_threshold
         self.phase_history = []
+        
+        # Lookups for the PoseSequence being segmented (see _bind_sequence)
+        self._sequence = None
+        self._pose_memo = OrderedDict()
+        self._arm_rows = {}
+        self._frame_has_pose = []
     
     @abstractmethod
     def check_phase_transition(self, 
@@ -41,7 +53,8 @@ class BasePhaseDetector(ABC):
         Args:
             current_phase: Current phase name
             frame_idx: Current frame index
-            pose_data: List of pose data for all frames
+            pose_data: List of pose data for all frames, or a PoseSequence
+                (read through get_pose_info / get_frame_hand_keypoints / get_frame_hand_position)
             ball_data: List of ball data for all frames
             **kwargs: Additional parameters
             
@@ -123,9 +136,111 @@ class BasePhaseDetector(ABC):
             Pose information dict
         """
         if frame_idx < len(pose_data):
+            if isinstance(pose_data, PoseSequence):
+                return self._sequence_pose(frame_idx, pose_data)
             return pose_data[frame_idx].get('pose', {})
         return {}
     
+    def _bind_sequence(self, pose_data: PoseSequence):
+        """Reset the per-sequence lookups when a different PoseSequence is passed in"""
+        if self._sequence is not pose_data:
+            self._sequence = pose_data
+            self._pose_memo.clear()
+            self._arm_rows = {}
+            # Frames with at least one detected keypoint (NaN confidence = missing)
+            self._frame_has_pose = (~np.isnan(pose_data.keypoints[:, :, 2])).any(axis=1).tolist()
+    
+    def _sequence_pose(self, frame_idx: int, pose_data: PoseSequence) -> Dict:
+        """
+        Pose dict of a PoseSequence frame, built from the keypoint row (no frame dict).
+        
+        A transition check reads the current and previous frame several times, so the
+        dicts of the last POSE_MEMO_SIZE frames are kept.
+        """
+        self._bind_sequence(pose_data)
+        pose = self._pose_memo.get(frame_idx)
+        if pose is None:
+            pose = pose_data.pose(frame_idx)
+            self._pose_memo[frame_idx] = pose
+            if len(self._pose_memo) > self.POSE_MEMO_SIZE:
+                self._pose_memo.popitem(last=False)
+        return pose
+    
+    def _sequence_arm(self, frame_idx: int, pose_data: PoseSequence, selected_hand: str) -> List[List[float]]:
+        """(shoulder, elbow, wrist) rows of [x, y, confidence] from pose_data.arm(), converted once per sequence"""
+        self._bind_sequence(pose_data)
+        arm_rows = self._arm_rows.get(selected_hand)
+        if arm_rows is None:
+            arm_rows = self._arm_rows[selected_hand] = pose_data.arm(selected_hand).tolist()
+        return arm_rows[frame_idx]
+    
+    def has_pose(self, frame_idx: int, pose_data: List[Dict]) -> bool:
+        """
+        Check if a frame has at least one detected keypoint.
+        
+        Args:
+            frame_idx: Frame index
+            pose_data: List of pose data or PoseSequence
+            
+        Returns:
+            True if the frame has pose data
+        """
+        if isinstance(pose_data, PoseSequence):
+            if frame_idx >= len(pose_data):
+                return False
+            self._bind_sequence(pose_data)
+            return self._frame_has_pose[frame_idx]
+        return bool(self.get_pose_info(frame_idx, pose_data))
+    
+    def get_frame_hand_keypoints(self, frame_idx: int, pose_data: List[Dict], selected_hand: str = "left") -> Tuple[Dict, Dict, Dict]:
+        """
+        Get keypoints for the selected hand of a frame.
+        
+        Same result as get_selected_hand_keypoints(get_pose_info(...)); a PoseSequence is
+        read from its arm() array without building the whole pose dict.
+        
+        Args:
+            frame_idx: Frame index
+            pose_data: List of pose data or PoseSequence
+            selected_hand: "left" or "right"
+            
+        Returns:
+            Tuple of (shoulder, elbow, wrist) for selected hand ({} when missing)
+        """
+        if isinstance(pose_data, PoseSequence):
+            if frame_idx >= len(pose_data):
+                return {}, {}, {}
+            shoulder, elbow, wrist = (
+                {'x': x, 'y': y, 'confidence': confidence} if confidence == confidence else {}  # NaN = missing
+                for x, y, confidence in self._sequence_arm(frame_idx, pose_data, selected_hand)
+            )
+            return shoulder, elbow, wrist
+        return self.get_selected_hand_keypoints(self.get_pose_info(frame_idx, pose_data), selected_hand)
+    
+    def get_frame_hand_position(self, frame_idx: int, pose_data: List[Dict], selected_hand: str = "left") -> Tuple[float, float]:
+        """
+        Get position of the selected hand of a frame.
+        
+        Same result as get_selected_hand_position(get_pose_info(...)); a PoseSequence is
+        read from the wrist row of its arm() array.
+        
+        Args:
+            frame_idx: Frame index
+            pose_data: List of pose data or PoseSequence
+            selected_hand: "left" or "right"
+            
+        Returns:
+            Tuple of (x, y) coordinates for selected hand wrist (0, 0 when missing)
+        """
+        if isinstance(pose_data, PoseSequence):
+            if frame_idx >= len(pose_data):
+                return 0, 0
+            wrist_x, wrist_y, confidence = self._sequence_arm(frame_idx, pose_data, selected_hand)[2]
+            if confidence != confidence:  # NaN = missing
+                return 0, 0
+            return wrist_x, wrist_y
+        return self.get_selected_hand_position(self.get_pose_info(frame_idx, pose_data), selected_hand)
+    
     def calculate_keypoint_averages(self, pose: Dict, keypoints: List[str]) -> Dict[str, float]:
         """
         Calculate average positions for keypoints.
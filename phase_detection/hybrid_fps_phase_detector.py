@@ -4,10 +4,15 @@ Hybrid FPS Phase Detector
 Uses original data with ball-size based Set-up detection and torso + FPS proportional thresholds
 """
 
+import logging
 import numpy as np
 from typing import Dict, List, Optional, Tuple
+
+from analysis_logging import get_logger
 from .base_phase_detector import BasePhaseDetector
 
+logger = get_logger(__name__)
+
 class HybridFPSPhaseDetector(BasePhaseDetector):
     """
     Hybrid FPS Phase Detector that combines torso-based and ball-size-based thresholds.
@@ -56,7 +61,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             fps: Actual video FPS
         """
         self.fps = fps
-        print(f"   📹 Phase detector FPS set to {fps}")
+        logger.debug("   📹 Phase detector FPS set to %s", fps)
         
         # Tracking variables for cancellation conditions
         self.ball_drop_frames = 0
@@ -90,7 +95,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         if self.shot_detector is not None:
             self.shot_detector.update_rolling_torso(frame_idx, pose)
         else:
-            print("⚠️ Warning: Shot detector not available for torso measurement")
+            logger.warning("⚠️ Warning: Shot detector not available for torso measurement")
     
     def reset_for_new_shot(self) -> None:
         """
@@ -115,7 +120,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         self.first_transition_frame = transition_frame
         
         # Torso finalization is now handled by shot detector
-        print(f"   📍 Phase detector: First transition frame set to {transition_frame}")
+        logger.debug("   📍 Phase detector: First transition frame set to %s", transition_frame)
         
     def calculate_torso_length(self, pose: Dict) -> float:
         """
@@ -169,10 +174,9 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             )
             if left_torso_length > 0:
                 valid_torso_lengths.append(left_torso_length)
-                # print(f"   Left torso: {left_torso_length:.4f} (conf: {left_avg_conf:.3f}) ✓")  # 로그 제거
+                logger.debug("   Left torso: %.4f (conf: %.3f) ✓", left_torso_length, left_avg_conf)
         else:
-            # print(f"   Left torso: excluded (conf: {left_avg_conf:.3f} < {confidence_threshold}) ✗")  # 로그 제거
-            pass
+            logger.debug("   Left torso: excluded (conf: %.3f < %s) ✗", left_avg_conf, confidence_threshold)
         
         # Check right side torso (right shoulder to right hip)
         right_shoulder_conf = right_shoulder.get('confidence', 1.0)
@@ -186,24 +190,23 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             )
             if right_torso_length > 0:
                 valid_torso_lengths.append(right_torso_length)
-                # print(f"   Right torso: {right_torso_length:.4f} (conf: {right_avg_conf:.3f}) ✓")  # 로그 제거
+                logger.debug("   Right torso: %.4f (conf: %.3f) ✓", right_torso_length, right_avg_conf)
         else:
-            # print(f"   Right torso: excluded (conf: {right_avg_conf:.3f} < {confidence_threshold}) ✗")  # 로그 제거
-            pass
+            logger.debug("   Right torso: excluded (conf: %.3f < %s) ✗", right_avg_conf, confidence_threshold)
         
         # Calculate final torso length
         if len(valid_torso_lengths) > 0:
             # Use average of valid measurements
             torso_length = np.mean(valid_torso_lengths)
-            # print(f"   Final torso: {torso_length:.4f} (average of {len(valid_torso_lengths)} measurements)")  # 로그 제거
+            logger.debug("   Final torso: %.4f (average of %s measurements)", torso_length, len(valid_torso_lengths))
         else:
             # No valid measurements, use last valid torso length
             if hasattr(self, 'torso_length') and self.torso_length > 0:
                 torso_length = self.torso_length
-                # print(f"   Final torso: {torso_length:.4f} (using last valid measurement)")  # 로그 제거
+                logger.debug("   Final torso: %.4f (using last valid measurement)", torso_length)
             else:
                 torso_length = 0.0
-                # print(f"   Final torso: 0.0 (no valid measurements available)")  # 로그 제거
+                logger.debug("   Final torso: 0.0 (no valid measurements available)")
         
         # Update stored torso length if valid
         if torso_length > 0:
@@ -226,7 +229,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             return self.shot_detector.get_shot_torso(pose)
         else:
             # Fallback if shot detector is not available (shouldn't happen in normal flow)
-            print("⚠️ Warning: Shot detector not available, using fallback torso calculation")
+            logger.warning("⚠️ Warning: Shot detector not available, using fallback torso calculation")
             return self._calculate_fallback_torso(pose)
     
     def _calculate_fallback_torso(self, pose: Dict) -> float:
@@ -365,11 +368,12 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         ball_distance_threshold = self.calculate_ball_wrist_threshold(pose, ball_info)
         
         # Get selected hand keypoints
-        selected_shoulder, selected_elbow, selected_wrist = self.get_selected_hand_keypoints(pose, selected_hand)
+        selected_shoulder, selected_elbow, selected_wrist = self.get_frame_hand_keypoints(frame_idx, pose_data, selected_hand)
        
         # Note: Individual phase transitions will validate their required keypoints
         
-        # print(selected_shoulder, selected_elbow, selected_wrist)
+        logger.debug("   Frame %s: %s arm keypoints %s %s %s", frame_idx, selected_hand,
+                     selected_shoulder, selected_elbow, selected_wrist)
         # Calculate shoulder position
         shoulder_y = selected_shoulder.get('y', 0)
         
@@ -389,7 +393,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             left_angle = 0  # Default value if invalid
         
         # Get selected hand position
-        wrist_x, wrist_y = self.get_selected_hand_position(pose, selected_hand)
+        wrist_x, wrist_y = self.get_frame_hand_position(frame_idx, pose_data, selected_hand)
         
         # Calculate movement changes
         d_wrist_y = 0
@@ -399,7 +403,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             prev_frame_idx = self._get_previous_valid_frame(frame_idx, pose_data, ball_data)
             if prev_frame_idx is not None:
                 prev_pose = self.get_pose_info(prev_frame_idx, pose_data)
-                prev_wrist_x, prev_wrist_y = self.get_selected_hand_position(prev_pose, selected_hand)
+                prev_wrist_x, prev_wrist_y = self.get_frame_hand_position(prev_frame_idx, pose_data, selected_hand)
                 
                 d_wrist_y = wrist_y - prev_wrist_y
                 
@@ -446,20 +450,23 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                 
                 distance = ((ball_x - wrist_x)**2 + (ball_y - wrist_y)**2)**0.5
                 
-                # Debug: Print General → Set-up detection info
-                if frame_idx % 30 == 0:  # Print every 30 frames to avoid spam
-                    print(f"   Frame {frame_idx}: Ball({ball_x:.2f},{ball_y:.2f}) Wrist({wrist_x:.2f},{wrist_y:.2f}) Dist={distance:.2f} Threshold={ball_distance_threshold:.2f}")
+                # Debug: General → Set-up detection info
+                if frame_idx % 30 == 0:  # Every 30 frames to avoid spam
+                    logger.debug("   Frame %s: Ball(%.2f,%.2f) Wrist(%.2f,%.2f) Dist=%.2f Threshold=%.2f",
+                                 frame_idx, ball_x, ball_y, wrist_x, wrist_y, distance, ball_distance_threshold)
                 
                 if distance < ball_distance_threshold:
-                    print(f"Frame {frame_idx}: General → Set-up (ball-wrist distance: {distance:.2f} < {ball_distance_threshold:.2f})")
+                    logger.debug("Frame %s: General → Set-up (ball-wrist distance: %.2f < %.2f)",
+                                 frame_idx, distance, ball_distance_threshold)
                     # Reset tracking variables when phase changes
                     self.ball_drop_frames = 0
                     self.shoulder_hip_rise_frames = 0
                     return "Set-up"
             else:
-                # Debug: Print why General → Set-up failed
-                if frame_idx % 30 == 0:  # Print every 30 frames to avoid spam
-                    print(f"   Frame {frame_idx}: General → Set-up blocked - Ball:{ball_info is not None}, Wrist:{selected_wrist is not None and 'x' in selected_wrist if selected_wrist else False}")
+                # Debug: why General → Set-up failed
+                if frame_idx % 30 == 0 and logger.isEnabledFor(logging.DEBUG):  # Every 30 frames to avoid spam
+                    logger.debug("   Frame %s: General → Set-up blocked - Ball:%s, Wrist:%s", frame_idx, ball_info is not None,
+                                 selected_wrist is not None and 'x' in selected_wrist if selected_wrist else False)
         
         # 2. Set-up → Loading: Hip AND shoulder moving downward
         if current_phase == "Set-up":
@@ -617,7 +624,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                         prev_pose = self.get_pose_info(prev_frame_idx, pose_data)
                         
                         # Get selected hand keypoints for previous frame
-                        prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_selected_hand_keypoints(prev_pose, selected_hand)
+                        prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_frame_hand_keypoints(prev_frame_idx, pose_data, selected_hand)
                         
                         # Calculate previous hip position
                         prev_left_hip = prev_pose.get('left_hip', {'y': None})
@@ -690,7 +697,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                     prev_pose = self.get_pose_info(prev_frame_idx, pose_data)
                     
                     # Get selected hand keypoints for previous frame
-                    prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_selected_hand_keypoints(prev_pose, selected_hand)
+                    prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_frame_hand_keypoints(prev_frame_idx, pose_data, selected_hand)
                     
                     # Use selected hand keypoints instead of averages
                     elbow_y = selected_elbow.get('y', 0)
@@ -976,7 +983,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                     self.recent_torso_values = []
                     self.recent_torso_frames = []
                     
-                    print(f"🔄 Follow-through → General: Reset fixed torso for new shot cycle")
+                    logger.debug("🔄 Follow-through → General: Reset fixed torso for new shot cycle")
                     
                     self.ball_drop_frames = 0
                     self.shoulder_hip_rise_frames = 0
@@ -999,11 +1006,8 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
             Index of most recent valid frame, or None if no valid frame found
         """
         for i in range(frame_idx - 1, -1, -1):
-            pose = self.get_pose_info(i, pose_data)
-            ball_info = self.get_ball_info(i, ball_data)
-            
             # Simple check: if pose data exists and has at least one keypoint
-            if pose and len(pose) > 0:
+            if self.has_pose(i, pose_data):
                 return i
         
         return None
@@ -1016,7 +1020,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         ball_info = self.get_ball_info(frame_idx, ball_data)
         
         # Get selected hand keypoints
-        selected_shoulder, selected_elbow, selected_wrist = self.get_selected_hand_keypoints(pose, selected_hand)
+        selected_shoulder, selected_elbow, selected_wrist = self.get_frame_hand_keypoints(frame_idx, pose_data, selected_hand)
         
         # Check if required keypoints exist
         if not all([selected_shoulder, selected_elbow, selected_wrist]):
@@ -1071,7 +1075,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         ball_info = self.get_ball_info(frame_idx, ball_data)
         
         # Get selected hand keypoints
-        selected_shoulder, selected_elbow, selected_wrist = self.get_selected_hand_keypoints(pose, selected_hand)
+        selected_shoulder, selected_elbow, selected_wrist = self.get_frame_hand_keypoints(frame_idx, pose_data, selected_hand)
         
         # Check if required keypoints exist
         if not all([selected_shoulder, selected_elbow, selected_wrist]):
@@ -1081,7 +1085,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         shoulder_y = selected_shoulder.get('y', 0)
         
         # Select closest wrist to ball
-        wrist_x, wrist_y = self.get_selected_hand_position(pose, selected_hand)
+        wrist_x, wrist_y = self.get_frame_hand_position(frame_idx, pose_data, selected_hand)
         
         # Calculate ball position
         ball_x = ball_info.get('center_x', 0) if ball_info else 0
@@ -1110,7 +1114,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                 isinstance(prev_right_hip, dict) and 'y' in prev_right_hip):
                 
                 # Get selected hand keypoints for previous frame
-                prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_selected_hand_keypoints(prev_pose, selected_hand)
+                prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_frame_hand_keypoints(frame_idx - 1, pose_data, selected_hand)
                 
                 # Check if required keypoints exist
                 if not all([prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist]):
@@ -1214,7 +1218,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         ball_info = self.get_ball_info(frame_idx, ball_data)
         
         # Get selected hand keypoints
-        selected_shoulder, selected_elbow, selected_wrist = self.get_selected_hand_keypoints(pose, selected_hand)
+        selected_shoulder, selected_elbow, selected_wrist = self.get_frame_hand_keypoints(frame_idx, pose_data, selected_hand)
         
         # Check if required keypoints exist
         if not all([selected_shoulder, selected_elbow, selected_wrist]):
@@ -1224,7 +1228,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
         shoulder_y = selected_shoulder.get('y', 0)
         
         # Select closest wrist to ball
-        wrist_x, wrist_y = self.get_selected_hand_position(pose, selected_hand)
+        wrist_x, wrist_y = self.get_frame_hand_position(frame_idx, pose_data, selected_hand)
         
         # Calculate ball position
         ball_x = ball_info.get('center_x', 0) if ball_info else 0
@@ -1318,7 +1322,7 @@ class HybridFPSPhaseDetector(BasePhaseDetector):
                     isinstance(prev_right_hip, dict) and 'y' in prev_right_hip):
                     
                     # Get selected hand keypoints for previous frame
-                    prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_selected_hand_keypoints(prev_pose, selected_hand)
+                    prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist = self.get_frame_hand_keypoints(frame_idx - 1, pose_data, selected_hand)
                     
                     # Check if required keypoints exist
                     if not all([prev_selected_shoulder, prev_selected_elbow, prev_selected_wrist]):
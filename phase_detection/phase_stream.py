@@ -0,0 +1,117 @@
+"""
+Phase Stream
+
+Incremental (frame-by-frame) phase segmentation and shot detection.
+
+Phase detectors only look at the current and earlier frames, and ShotDetector is an
+online state machine, so segmentation does not have to wait for extraction to finish:
+frames can be pushed as soon as pose and ball data are available, and each completed
+shot is reported on the frame its Follow-through → General transition fires.
+
+Usage:
+    stream = PhaseStream(detector, shot_detector, selected_hand="right", fps=30.0)
+    for pose_frame, ball_frame in frames:
+        phase, completed_shot = stream.push(pose_frame, ball_frame)
+        if completed_shot:
+            ...  # analyze frames completed_shot['start_frame']..completed_shot['end_frame']
+    shots = stream.close()
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class PhaseStream:
+    """
+    Online driver for a phase detector and a ShotDetector.
+
+    Produces the same per-frame phases and shots as running the detector over the whole
+    video (before the analyzer's post-processing such as cancellation filling). The shooting
+    hand must be known up front, since whole-video hand selection needs all frames.
+    """
+
+    def __init__(self, phase_detector, shot_detector, selected_hand: str = "right", fps: float = 30.0):
+        """
+        Args:
+            phase_detector: Phase detector (BasePhaseDetector subclass)
+            shot_detector: ShotDetector that tracks shots and torso for the detector
+            selected_hand: Shooting hand ("left" or "right")
+            fps: Video FPS (for FPS-proportional thresholds)
+        """
+        self.phase_detector = phase_detector
+        self.shot_detector = shot_detector
+        self.selected_hand = selected_hand
+        self.fps = fps
+
+        self.current_phase = "General"
+        self.phases: List[str] = []
+
+        # Frames received through push() (detectors look back at earlier frames)
+        self.pose_data: List[Dict] = []
+        self.ball_data: List[Dict] = []
+
+    def push(self, pose_frame: Dict, ball_frame: Optional[Dict] = None) -> Tuple[str, Optional[Dict]]:
+        """
+        Segment the next frame.
+
+        Args:
+            pose_frame: Pose data for the frame ({'pose': {...}, ...}, as produced by pose extraction)
+            ball_frame: Ball data for the frame ({'ball_detections': [...], ...}), None if not detected
+
+        Returns:
+            Tuple of (phase of this frame, completed shot info or None)
+        """
+        self.pose_data.append(pose_frame)
+        self.ball_data.append(ball_frame if ball_frame is not None else {})
+        return self.step(len(self.phases), self.pose_data, self.ball_data)
+
+    def step(self, frame_idx: int, pose_data, ball_data,
+             torso_length: Optional[float] = None) -> Tuple[str, Optional[Dict]]:
+        """
+        Segment frame_idx of externally held data (frames must be stepped in order).
+
+        Args:
+            frame_idx: Index of the frame to segment (== number of frames segmented so far)
+            pose_data: Pose data covering at least frames 0..frame_idx (List[Dict] or PoseSequence)
+            ball_data: Ball data covering frames 0..frame_idx (shorter lists are treated as no ball)
+            torso_length: Precomputed torso length of this frame (computed from the pose if None)
+
+        Returns:
+            Tuple of (phase of this frame, completed shot info or None)
+        """
+        # Seed this frame's torso measurement so the detector's own rolling torso update reuses it
+        if torso_length is not None:
+            self.shot_detector.measure_torso(frame_idx, None, torso_length=torso_length)
+
+        # Provide current torso to detector for threshold calculation
+        if hasattr(self.phase_detector, 'set_current_torso'):
+            self.phase_detector.set_current_torso(self.shot_detector.get_shot_torso())
+
+        next_phase = self.phase_detector.check_phase_transition(
+            self.current_phase, frame_idx, pose_data, ball_data,
+            fps=self.fps, selected_hand=self.selected_hand
+        )
+
+        # Update rolling torso tracking (delegated to ShotDetector)
+        if torso_length is not None:
+            self.shot_detector.update_rolling_torso(frame_idx, None, torso_length=torso_length)
+        else:
+            self.shot_detector.update_rolling_torso(frame_idx, self.phase_detector.get_pose_info(frame_idx, pose_data))
+
+        # Real-time shot detection - detect shot transitions
+        completed_shots = len(self.shot_detector.shots)
+        self.shot_detector.detect_shot_transitions(frame_idx, next_phase)
+        completed_shot = self.shot_detector.shots[-1] if len(self.shot_detector.shots) > completed_shots else None
+
+        self.current_phase = next_phase
+        self.phases.append(next_phase)
+        return next_phase, completed_shot
+
+    def close(self) -> List[Dict]:
+        """
+        Finish the stream: assign shot ids to all pushed frames.
+
+        Returns:
+            Completed shots (ShotDetector.shots)
+        """
+        self.shot_detector.finalize_frame_shots(len(self.phases))
+        return self.shot_detector.shots
@@ -7,11 +7,13 @@
 from .pose_model_layer import PoseModelLayer
 from .pose_storage_layer import PoseStorageLayer
 from .pose_extraction_pipeline import PoseExtractionPipeline
+from .pose_sequence import PoseSequence
 
 __all__ = [
     'PoseModelLayer',
     'PoseStorageLayer',
-    'PoseExtractionPipeline'
+    'PoseExtractionPipeline',
+    'PoseSequence'
 ]
 
 __version__ = "1.0.0" 
\ No newline at end of file
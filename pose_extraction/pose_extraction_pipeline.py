@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 Pose Extraction Integrated Pipeline
-Extracts only original absolute coordinates and saves as JSON
+Extracts only original absolute coordinates and saves them (columnar .npz, optional JSON export)
 """
 
 import os
@@ -10,13 +10,20 @@ from typing import Dict, List
 
 # Import layer modules
 from .pose_model_layer import PoseModelLayer
-from .pose_storage_layer import PoseStorageLayer
+from .pose_storage_layer import PoseStorageLayer, load_pose_original
 
 class PoseExtractionPipeline:
-    def __init__(self, output_dir: str = "data"):
-        """Initialize pose extraction pipeline"""
+    def __init__(self, output_dir: str = "data", export_json: bool = False):
+        """
+        Initialize pose extraction pipeline
+        
+        Args:
+            output_dir: Directory for extracted data
+            export_json: Also write the original data as JSON (the columnar .npz is always written)
+        """
         self.model_layer = PoseModelLayer()
         self.storage_layer = PoseStorageLayer(output_dir)
+        self.export_json = export_json
         
         print("Pose extraction pipeline initialized")
         print("=" * 50)
@@ -42,28 +49,64 @@ class PoseExtractionPipeline:
             raw_pose_data = self.model_layer.extract_poses_from_video(video_path)
             print(f"✅ Extraction complete: {len(raw_pose_data)} frames")
             
-            # Step 2: Confidence filtering (remove low-confidence keypoints)
-            print("\n🔄 Step 2: Filtering by confidence...")
-            filtered_data = self._filter_low_confidence_poses(raw_pose_data, confidence_threshold)
-            print(f"✅ Filtering complete: {len(filtered_data)} frames")
-            
-            # Step 3: Save original absolute coordinates as JSON
-            print("\n💾 Step 3: Saving original data...")
-            base_filename = f"{os.path.splitext(os.path.basename(video_path))[0]}_pose_original"
-            saved_file = self.storage_layer.save_original_as_json(filtered_data, f"{base_filename}.json")
-            
-            print("✅ Save complete")
-            print("=" * 50)
-            
-            # Print summary
-            self._print_summary(filtered_data, saved_file)
-            
-            return saved_file
+            return self.save_extracted_poses(video_path, raw_pose_data, confidence_threshold)
             
         except Exception as e:
             print(f"❌ Error occurred: {e}")
             raise
 
+    def save_extracted_poses(self, video_path: str, raw_pose_data: List[Dict],
+                             confidence_threshold: float = 0.3) -> str:
+        """
+        Filter and save raw per-frame pose data produced by the model layer
+        
+        Shared by extract_poses and the fused single-decode extraction in the
+        integrated pipeline, so both write identical files.
+        
+        Args:
+            video_path: Path to video file (used for the output filename)
+            raw_pose_data: Per-frame pose records from PoseModelLayer
+            confidence_threshold: Confidence threshold
+        
+        Returns:
+            Path to saved file
+        """
+        # Step 2: Confidence filtering (remove low-confidence keypoints)
+        print("\n🔄 Step 2: Filtering by confidence...")
+        filtered_data = self._filter_low_confidence_poses(raw_pose_data, confidence_threshold)
+        print(f"✅ Filtering complete: {len(filtered_data)} frames")
+        
+        # Step 3: Save original absolute coordinates (columnar .npz, JSON as optional export)
+        print("\n💾 Step 3: Saving original data...")
+        base_filename = f"{os.path.splitext(os.path.basename(video_path))[0]}_pose_original"
+        saved_file = self.storage_layer.save_original_as_npz(filtered_data, f"{base_filename}.npz")
+        if self.export_json:
+            self.storage_layer.save_original_as_json(filtered_data, f"{base_filename}.json")
+        
+        print("✅ Save complete")
+        print("=" * 50)
+        
+        # Print summary
+        self._print_summary(filtered_data, saved_file)
+        
+        return saved_file
+
+    def export_original_json(self, video_path: str) -> str:
+        """
+        Write the JSON export of an already saved columnar pose file
+        
+        Used when the .npz comes from the extraction cache instead of a fresh extraction.
+        
+        Args:
+            video_path: Path to video file (used for the filenames)
+        
+        Returns:
+            Path to the JSON file
+        """
+        base_filename = f"{os.path.splitext(os.path.basename(video_path))[0]}_pose_original"
+        pose_data = load_pose_original(os.path.join(self.storage_layer.output_dir, f"{base_filename}.npz"))
+        return self.storage_layer.save_original_as_json(pose_data, f"{base_filename}.json")
+
     def _filter_low_confidence_poses(self, pose_data: List[Dict], confidence_threshold: float) -> List[Dict]:
         """Filter out low-confidence keypoints"""
         filtered_data = []
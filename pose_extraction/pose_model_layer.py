@@ -9,6 +9,13 @@ import numpy as np
 import tensorflow as tf
 from typing import Dict, List, Tuple
 
+from analysis_logging import get_logger, log_progress
+
+logger = get_logger(__name__)
+
+# MoveNet Thunder SavedModel directory
+MOVENET_MODEL_PATH = "pose_extraction/models/movenet_singlepose_thunder"
+
 class PoseModelLayer:
 
     def __init__(self, model_name="lightning"):
@@ -20,6 +27,9 @@ class PoseModelLayer:
             "left_knee", "right_knee", "left_ankle", "right_ankle"
         ]
         self.model = None
+        self.model_path = MOVENET_MODEL_PATH
+        # MoveNet Thunder input resolution (square)
+        self.input_size = 256
          # Confidence score to determine whether a keypoint prediction is reliable.
         self.MIN_CROP_KEYPOINT_SCORE = 0.3
         self._load_model()
@@ -73,9 +83,28 @@ class PoseModelLayer:
         # self.movenet = hub.load(model_url)
         # self.model = self.movenet.signatures["serving_default"]
         # print("MoveNet model loading completed")
-        model_path = "pose_extraction/models/movenet_singlepose_thunder"        
-        self.movenet = tf.saved_model.load(model_path)
+        self.movenet = tf.saved_model.load(self.model_path)
         self.model = self.movenet.signatures["serving_default"]
+        self._inference_fn = self._build_inference_fn(self.model, [self.input_size, self.input_size])
+
+    def _build_inference_fn(self, model, crop_size):
+        """
+        Compile crop + resize + MoveNet into one graph with a fixed input signature.
+
+        The frame goes in as uint8 and only the crop is converted to int32, so the
+        full-resolution frame is never cast (a 1080p int32 copy is ~25 MB per frame).
+        """
+        @tf.function(input_signature=[
+            tf.TensorSpec(shape=[None, None, 3], dtype=tf.uint8),
+            tf.TensorSpec(shape=[1, 4], dtype=tf.float32)
+        ])
+        def inference(frame, boxes):
+            input_image = tf.image.crop_and_resize(
+                tf.expand_dims(frame, axis=0), boxes=boxes, box_indices=[0], crop_size=crop_size)
+            outputs = model(input=tf.cast(input_image, tf.int32))
+            return outputs["output_0"]
+
+        return inference
 
     def preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
         """Preprocess frame"""
@@ -131,16 +160,12 @@ class PoseModelLayer:
 
     def detect_pose(self, frame: np.ndarray, output_images: List[np.ndarray]) -> Dict:
         """Detect pose from single frame (return normalized coordinates with aspect ratio correction on x-axis)"""
-        input_frame = self.preprocess_frame(frame)
-        # results = self.model(input=input_frame)
-        # keypoints = results["output_0"].numpy()
-        # keypoints = keypoints[0, 0]
-
         # Original frame size
         h, w = frame.shape[:2]
         aspect_ratio = w / h  # Calculate aspect ratio
         self.crop_region = self.init_crop_region(h, w) if self.crop_region is None else self.crop_region
-        keypoints_with_scores = self.run_inference(self.model, frame, self.crop_region, crop_size=[256, 256])
+        keypoints_with_scores = self.run_inference(self.model, frame, self.crop_region,
+                                                   crop_size=[self.input_size, self.input_size])
         
         self.crop_region = self.determine_crop_region(keypoints_with_scores, h, w)
         # print("After determine crop region")
@@ -159,6 +184,10 @@ class PoseModelLayer:
             }
         return pose_data
 
+    def reset_crop_region(self):
+        """Forget the crop region tracked from the previous frame (call before starting a new video)"""
+        self.crop_region = None
+
     def detect_and_draw_rim(self, frame: np.ndarray) -> np.ndarray:
         """
         Detect basketball rim in the frame and draw a bounding box around it
@@ -224,6 +253,8 @@ class PoseModelLayer:
         
         print(f"Video information: {total_frames} frames, {fps} fps")
         
+        # Crop tracking must not carry over from a previous video when the layer is reused
+        self.reset_crop_region()
         pose_data = []
         output_images = []
         frame_count = 0
@@ -234,7 +265,7 @@ class PoseModelLayer:
                 break
             frame_count += 1
             
-            print(f"Processing frame: {frame_count}/{total_frames}", end="\r")
+            log_progress(logger, "Processing frame", frame_count, total_frames)
 
             # Detect rim if requested
             if detect_rim:
@@ -399,7 +430,6 @@ class PoseModelLayer:
         """Crops and resize the image to prepare for the model input."""
         boxes=[[crop_region['y_min'], crop_region['x_min'],
                 crop_region['y_max'], crop_region['x_max']]]
-        # Make sure the image is in the correct format (int32)
         output_image = tf.image.crop_and_resize(
             image, box_indices=[0], boxes=boxes, crop_size=crop_size)
         return output_image
@@ -411,25 +441,23 @@ class PoseModelLayer:
         model output to the original image coordinate system.
         """
         image_height, image_width, _ = image.shape
-        
-        # Convert the image to int32 before expanding dimensions
-        image_int32 = tf.cast(image, tf.int32)
-        input_image = self.crop_and_resize(
-            tf.expand_dims(image_int32, axis=0), crop_region, crop_size=crop_size)
-        
-        # Run model inference.
-        input_image = tf.cast(input_image, tf.int32)
-        outputs = model(input=input_image)
-        keypoints_with_scores = outputs["output_0"].numpy()
-        
-        # Update the coordinates.
-        for idx in range(17):
-            keypoints_with_scores[0, 0, idx, 0] = (
-                crop_region['y_min'] * image_height +
-                crop_region['height'] * image_height *
-                keypoints_with_scores[0, 0, idx, 0]) / image_height
-            keypoints_with_scores[0, 0, idx, 1] = (
-                crop_region['x_min'] * image_width +
-                crop_region['width'] * image_width *
-                keypoints_with_scores[0, 0, idx, 1]) / image_width
+        boxes = np.array([[crop_region['y_min'], crop_region['x_min'],
+                           crop_region['y_max'], crop_region['x_max']]], dtype=np.float32)
+
+        if model is self.model and list(crop_size) == [self.input_size, self.input_size]:
+            outputs = self._inference_fn(np.asarray(image, dtype=np.uint8), boxes)
+        else:
+            # Other models/crop sizes: same steps, uncompiled
+            input_image = self.crop_and_resize(tf.expand_dims(image, axis=0), crop_region, crop_size)
+            outputs = model(input=tf.cast(input_image, tf.int32))["output_0"]
+        keypoints_with_scores = outputs.numpy()
+
+        # Update the coordinates (crop-relative -> frame-relative) for all 17 keypoints at once.
+        keypoints = keypoints_with_scores[0, 0].astype(np.float64)
+        keypoints_with_scores[0, 0, :, 0] = (
+            crop_region['y_min'] * image_height +
+            crop_region['height'] * image_height * keypoints[:, 0]) / image_height
+        keypoints_with_scores[0, 0, :, 1] = (
+            crop_region['x_min'] * image_width +
+            crop_region['width'] * image_width * keypoints[:, 1]) / image_width
         return keypoints_with_scores
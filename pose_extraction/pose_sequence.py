@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Array-backed pose sequence
+Keeps a whole video's keypoints in one (frames, 17, 3) array instead of per-frame dicts
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from .pose_storage_layer import KEYPOINT_NAMES, load_pose_arrays, load_pose_original
+
+# Selected-hand arm keypoints, in (shoulder, elbow, wrist) order
+ARM_KEYPOINTS = {
+    'left': ('left_shoulder', 'left_elbow', 'left_wrist'),
+    'right': ('right_shoulder', 'right_elbow', 'right_wrist')
+}
+
+class PoseSequence:
+    """
+    Pose data for all frames of a video.
+
+    keypoints[frame, KEYPOINT_INDEX[name]] = (x, y, confidence); NaN marks a keypoint
+    that is missing from that frame (filtered out at extraction).
+
+    Behaves like the List[Dict] pose_data it replaces: len(), iteration and indexing
+    return {'frame_number', 'timestamp', 'pose'} dicts, built on demand from the
+    array (recently used frames are cached). Hot paths should use the array
+    accessors (xy, confidence, present, arm, torso_lengths) instead.
+    """
+
+    # Frame dicts kept around for repeated access to nearby frames (current/previous frame lookups)
+    FRAME_CACHE_SIZE = 32
+
+    def __init__(self, keypoints: np.ndarray, frame_numbers: np.ndarray, timestamps: np.ndarray,
+                 keypoint_names: Optional[List[str]] = None):
+        """
+        Args:
+            keypoints: (frames, keypoints, 3) array of x, y, confidence (NaN = missing)
+            frame_numbers: (frames,) frame numbers
+            timestamps: (frames,) timestamps in seconds
+            keypoint_names: Keypoint name per column (default: MoveNet order)
+        """
+        self.keypoints = np.asarray(keypoints, dtype=np.float64)
+        self.frame_numbers = np.asarray(frame_numbers)
+        self.timestamps = np.asarray(timestamps, dtype=np.float64)
+        self.keypoint_names = list(keypoint_names or KEYPOINT_NAMES)
+        self.keypoint_index = {name: i for i, name in enumerate(self.keypoint_names)}
+        self._frame_cache = OrderedDict()
+
+    @classmethod
+    def from_frames(cls, frames: List[Dict], keypoint_names: Optional[List[str]] = None) -> "PoseSequence":
+        """Build from per-frame pose dicts (JSON pose_data format)"""
+        keypoint_names = list(keypoint_names or KEYPOINT_NAMES)
+        keypoint_index = {name: i for i, name in enumerate(keypoint_names)}
+        keypoints = np.full((len(frames), len(keypoint_names), 3), np.nan)
+        for frame_idx, frame_data in enumerate(frames):
+            for kp_name, kp_data in frame_data.get('pose', {}).items():
+                keypoints[frame_idx, keypoint_index[kp_name]] = (
+                    kp_data['x'], kp_data['y'], kp_data.get('confidence', 0)
+                )
+        return cls(
+            keypoints,
+            np.array([frame.get('frame_number', i + 1) for i, frame in enumerate(frames)], dtype=np.int64),
+            np.array([frame.get('timestamp', 0.0) for frame in frames], dtype=np.float64),
+            keypoint_names
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "PoseSequence":
+        """Build from columnar arrays (see pose_storage_layer.load_pose_arrays) without copying"""
+        return cls(arrays["keypoints"], arrays["frame_number"], arrays["timestamp"],
+                   arrays["keypoint_names"].tolist())
+
+    # --- List[Dict] compatibility ---
+
+    def __len__(self) -> int:
+        return len(self.keypoints)
+
+    def __iter__(self):
+        for frame_idx in range(len(self)):
+            yield self[frame_idx]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("pose frame index out of range")
+
+        frame = self._frame_cache.get(index)
+        if frame is None:
+            frame = {
+                'frame_number': int(self.frame_numbers[index]),
+                'timestamp': float(self.timestamps[index]),
+                'pose': self.pose(index)
+            }
+            self._frame_cache[index] = frame
+            if len(self._frame_cache) > self.FRAME_CACHE_SIZE:
+                self._frame_cache.popitem(last=False)
+        else:
+            self._frame_cache.move_to_end(index)
+        return frame
+
+    def pose(self, frame_idx: int) -> Dict:
+        """Pose dict of one frame: {name: {'x', 'y', 'confidence'}} for present keypoints"""
+        return {
+            name: {'x': x, 'y': y, 'confidence': confidence}
+            for name, (x, y, confidence) in zip(self.keypoint_names, self.keypoints[frame_idx].tolist())
+            if confidence == confidence  # NaN = missing
+        }
+
+    def to_frames(self) -> List[Dict]:
+        """Convert back to per-frame pose dicts (JSON pose_data format)"""
+        return [
+            {'frame_number': int(frame_number), 'timestamp': float(timestamp), 'pose': self.pose(i)}
+            for i, (frame_number, timestamp) in enumerate(zip(self.frame_numbers, self.timestamps))
+        ]
+
+    # --- Array accessors ---
+
+    def xy(self, name: str) -> np.ndarray:
+        """(frames, 2) view of a keypoint's x, y (NaN where missing)"""
+        return self.keypoints[:, self.keypoint_index[name], :2]
+
+    def confidence(self, name: str) -> np.ndarray:
+        """(frames,) view of a keypoint's confidence (NaN where missing)"""
+        return self.keypoints[:, self.keypoint_index[name], 2]
+
+    def present(self, name: str) -> np.ndarray:
+        """(frames,) bool mask of frames where the keypoint was detected"""
+        return ~np.isnan(self.confidence(name))
+
+    def arm(self, hand: str) -> np.ndarray:
+        """
+        (frames, 3, 3) array of the selected hand's shoulder, elbow, wrist (x, y, confidence).
+        A view into keypoints for the MoveNet layout (left/right arm joints are evenly strided).
+        """
+        indices = [self.keypoint_index[name] for name in ARM_KEYPOINTS[hand]]
+        step = indices[1] - indices[0]
+        if step > 0 and indices[2] - indices[1] == step:
+            return self.keypoints[:, indices[0]:indices[2] + 1:step]
+        return self.keypoints[:, indices]
+
+    def selected_hand_keypoints(self, hand: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(shoulder, elbow, wrist) arrays of shape (frames, 3) for the selected hand"""
+        arm = self.arm(hand)
+        return arm[:, 0], arm[:, 1], arm[:, 2]
+
+    def torso_lengths(self, confidence_threshold: float = 0.2) -> np.ndarray:
+        """
+        Per-frame torso length (shoulder to hip), averaged over the sides whose shoulder and
+        hip both reach confidence_threshold; 0 when a torso keypoint is missing or no side
+        is confident. Same result as ShotDetector._calculate_torso_from_pose per frame.
+        """
+        names = ['left_shoulder', 'right_shoulder', 'left_hip', 'right_hip']
+        all_present = np.all([self.present(name) for name in names], axis=0)
+
+        side_lengths = []
+        side_valid = []
+        for side in ('left', 'right'):
+            shoulder = self.keypoints[:, self.keypoint_index[f'{side}_shoulder']]
+            hip = self.keypoints[:, self.keypoint_index[f'{side}_hip']]
+            delta = shoulder[:, :2] - hip[:, :2]
+            side_lengths.append(np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2))
+            with np.errstate(invalid='ignore'):
+                side_valid.append((shoulder[:, 2] >= confidence_threshold) & (hip[:, 2] >= confidence_threshold))
+
+        side_lengths = np.stack(side_lengths, axis=1)
+        side_valid = np.stack(side_valid, axis=1) & all_present[:, None]
+        valid_count = side_valid.sum(axis=1)
+        total = np.where(side_valid, side_lengths, 0.0).sum(axis=1)
+        return np.divide(total, valid_count, out=np.zeros(len(self)), where=valid_count > 0)
+
+
+def load_pose_sequence(filepath: str) -> PoseSequence:
+    """Load original pose data (.npz without per-frame dicts, or .json) as a PoseSequence"""
+    if filepath.endswith(".npz"):
+        return PoseSequence.from_arrays(load_pose_arrays(filepath))
+    return PoseSequence.from_frames(load_pose_original(filepath))
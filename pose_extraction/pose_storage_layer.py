@@ -11,6 +11,8 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from columnar_storage import load_npz_arrays, save_npz_atomic
+
 def convert_numpy_types(obj):
     """Convert numpy types to Python basic types"""
     if isinstance(obj, np.integer):
@@ -26,6 +28,56 @@ def convert_numpy_types(obj):
     else:
         return obj
 
+# Keypoint order of the columnar (.npz) format: keypoints[frame, KEYPOINT_NAMES.index(name)]
+KEYPOINT_NAMES = [
+    "nose", "left_eye", "right_eye", "left_ear", "right_ear",
+    "left_shoulder", "right_shoulder", "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist", "left_hip", "right_hip",
+    "left_knee", "right_knee", "left_ankle", "right_ankle"
+]
+
+def load_pose_arrays(filepath: str) -> Dict[str, np.ndarray]:
+    """
+    Load a columnar pose file written by PoseStorageLayer.save_original_as_npz
+    
+    The arrays are read-only memory maps into the file (see columnar_storage), so loading
+    copies nothing and PoseSequence.from_arrays keeps working on the mapped keypoints.
+    
+    Returns:
+        Dict with keypoints (frames, 17, 3) [x, y, confidence] (NaN = keypoint filtered out),
+        frame_number (frames,), timestamp (frames,), keypoint_names (17,) and metadata (JSON str)
+    """
+    return load_npz_arrays(filepath)
+
+def pose_arrays_to_frames(arrays: Dict[str, np.ndarray]) -> List[Dict]:
+    """Rebuild per-frame pose dicts (same structure as the original JSON pose_data)"""
+    keypoint_names = arrays["keypoint_names"].tolist()
+    keypoints = arrays["keypoints"].tolist()
+    present = (~np.isnan(arrays["keypoints"][:, :, 2])).tolist()
+    frames = []
+    for frame_number, timestamp, frame_keypoints, frame_present in zip(
+            arrays["frame_number"].tolist(), arrays["timestamp"].tolist(), keypoints, present):
+        frames.append({
+            'frame_number': frame_number,
+            'timestamp': timestamp,
+            'pose': {
+                name: {'x': x, 'y': y, 'confidence': confidence}
+                for name, (x, y, confidence), is_present in zip(keypoint_names, frame_keypoints, frame_present)
+                if is_present
+            }
+        })
+    return frames
+
+def load_pose_original(filepath: str) -> List[Dict]:
+    """Load original pose data from either the columnar .npz or the JSON export"""
+    if filepath.endswith(".npz"):
+        return pose_arrays_to_frames(load_pose_arrays(filepath))
+    with open(filepath, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "pose_data" in data:
+        return data["pose_data"]
+    return data
+
 class PoseStorageLayer:
     def __init__(self, output_dir: str = "data"):
         self.output_dir = output_dir
@@ -80,6 +132,44 @@ class PoseStorageLayer:
         print(f"Original JSON save complete: {filepath}")
         return filepath
 
+    def save_original_as_npz(self, pose_data: List[Dict], filename: Optional[str] = None) -> str:
+        """
+        Save original pose data in the columnar binary format (see load_pose_arrays)
+        
+        Same content as save_original_as_json, stored as arrays: no per-value
+        text encoding on save and no JSON parsing on load.
+        """
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"pose_original_{timestamp}.npz"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        
+        keypoints = np.full((len(pose_data), len(KEYPOINT_NAMES), 3), np.nan)
+        keypoint_index = {name: i for i, name in enumerate(KEYPOINT_NAMES)}
+        for frame_idx, frame_data in enumerate(pose_data):
+            for kp_name, kp_data in frame_data['pose'].items():
+                keypoints[frame_idx, keypoint_index[kp_name]] = (kp_data['x'], kp_data['y'], kp_data['confidence'])
+        
+        metadata = {
+            "total_frames": len(pose_data),
+            "extraction_time": datetime.now().isoformat(),
+            "keypoint_count": len(pose_data[0]['pose']) if pose_data else 0,
+            "coordinate_system": "relative_coordinates_with_aspect_ratio_correction"
+        }
+        
+        save_npz_atomic(
+            filepath,
+            keypoints=keypoints,
+            frame_number=np.array([frame['frame_number'] for frame in pose_data], dtype=np.int64),
+            timestamp=np.array([frame['timestamp'] for frame in pose_data], dtype=np.float64),
+            keypoint_names=np.array(KEYPOINT_NAMES),
+            metadata=np.array(json.dumps(metadata))
+        )
+        
+        print(f"Original NPZ save complete: {filepath}")
+        return filepath
+
     def save_as_json(self, pose_data: List[Dict], filename: Optional[str] = None) -> str:
         """Save pose data as JSON (includes both original and normalized coordinates)"""
         if filename is None:
@@ -228,17 +318,11 @@ class PoseStorageLayer:
         return saved_files
 
     def load_pose_data(self, filepath: str) -> List[Dict]:
-        """Load saved pose data"""
+        """Load saved pose data (.npz or .json)"""
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        if "pose_data" in data:
-            return data["pose_data"]
-        else:
-            return data  # If directly an array
+        return load_pose_original(filepath)
 
     def get_storage_info(self) -> Dict:
         """Return storage info"""
@@ -248,6 +332,7 @@ class PoseStorageLayer:
         files = os.listdir(self.output_dir)
         json_files = [f for f in files if f.endswith('.json')]
         csv_files = [f for f in files if f.endswith('.csv')]
+        npz_files = [f for f in files if f.endswith('.npz')]
         
         return {
             "output_dir": self.output_dir,
@@ -255,5 +340,6 @@ class PoseStorageLayer:
             "total_files": len(files),
             "json_files": len(json_files),
             "csv_files": len(csv_files),
+            "npz_files": len(npz_files),
             "file_list": files
         } 
\ No newline at end of file
@@ -34,10 +34,33 @@ class DTWAnalyzer:
         self.similarity_grades = SIMILARITY_GRADES.copy()
         self.confidence_thresholds = CONFIDENCE_THRESHOLDS.copy()
     
+    def extract_video_features(self, video_data: Dict, selected_hand: str) -> Dict:
+        """
+        Extract every per-video input of the DTW comparison once.
+        
+        The result only depends on one video, so it can be reused when the same
+        video is compared against several references.
+        
+        Args:
+            video_data: Video's normalized data
+            selected_hand: Selected shooting hand ('left' or 'right')
+            
+        Returns:
+            Dictionary with features, motion_data, loading_features and selected_hand
+        """
+        features = self.feature_extractor.extract_dtw_features(video_data, selected_hand)
+        return {
+            'selected_hand': selected_hand,
+            'features': features,
+            'motion_data': self._prepare_global_motion_data(video_data, features),
+            'loading_features': self.loading_dtw_extractor.extract_loading_dtw_features(video_data)
+        }
+    
     def analyze_shooting_similarity(self, video1_data: Dict, video2_data: Dict, 
                                   selected_hand: str, setup_analysis: Dict = None, 
                                   release_analysis: Dict = None, loading_analysis: Dict = None,
-                                  followthrough_analysis: Dict = None, rising_analysis: Dict = None) -> Dict:
+                                  followthrough_analysis: Dict = None, rising_analysis: Dict = None,
+                                  video1_features: Dict = None, video2_features: Dict = None) -> Dict:
         """
         Perform complete DTW analysis between two shooting motions.
         
@@ -45,6 +68,8 @@ class DTWAnalyzer:
             video1_data: First video's normalized data
             video2_data: Second video's normalized data
             selected_hand: Selected shooting hand ('left' or 'right')
+            video1_features: Precomputed extract_video_features() result for video 1
+            video2_features: Precomputed extract_video_features() result for video 2
             
         Returns:
             Comprehensive DTW analysis results
@@ -53,8 +78,12 @@ class DTWAnalyzer:
         
         # Extract DTW features from both videos
         print("Extracting DTW features...")
-        features1 = self.feature_extractor.extract_dtw_features(video1_data, selected_hand)
-        features2 = self.feature_extractor.extract_dtw_features(video2_data, selected_hand)
+        if video1_features is None or video1_features.get('selected_hand') != selected_hand:
+            video1_features = self.extract_video_features(video1_data, selected_hand)
+        if video2_features is None or video2_features.get('selected_hand') != selected_hand:
+            video2_features = self.extract_video_features(video2_data, selected_hand)
+        features1 = video1_features['features']
+        features2 = video2_features['features']
         
         if 'error' in features1:
             return {'error': f'Video 1 feature extraction failed: {features1["error"]}'}
@@ -71,8 +100,8 @@ class DTWAnalyzer:
         #     'ball_wrist_trajectory', 'shooting_arm_kinematics', 
         #     'lower_body_stability', 'phase_timing_patterns', 'body_alignment'
         # ]
-        user_motion_data = self._prepare_global_motion_data(video1_data, features1)
-        ref_motion_data = self._prepare_global_motion_data(video2_data, features2)
+        user_motion_data = video1_features['motion_data']
+        ref_motion_data = video2_features['motion_data']
         # for feature_name in feature_categories:
         #     if feature_name in features1 and feature_name in features2:
         #         print(f"   Analyzing {feature_name}...")
@@ -105,7 +134,8 @@ class DTWAnalyzer:
         # Calculate phase-specific similarities
         print("Calculating phase-specific similarities...")
         phase_similarities = self._calculate_phase_specific_similarities(
-            features1, features2, video1_data, video2_data, setup_analysis, release_analysis, loading_analysis, followthrough_analysis, rising_analysis
+            features1, features2, video1_data, video2_data, setup_analysis, release_analysis, loading_analysis, followthrough_analysis, rising_analysis,
+            video1_features['loading_features'], video2_features['loading_features']
         )
         
         # Calculate overall similarity score (feature-based + phase-based)
@@ -146,7 +176,8 @@ class DTWAnalyzer:
     def _calculate_phase_specific_similarities(self, features1: Dict, features2: Dict,
                                              video1_data: Dict, video2_data: Dict, setup_analysis: Dict = None, 
                                              release_analysis: Dict = None, loading_analysis: Dict = None,
-                                             followthrough_analysis: Dict = None, rising_analysis: Dict = None) -> Dict:
+                                             followthrough_analysis: Dict = None, rising_analysis: Dict = None,
+                                             loading_features1: Dict = None, loading_features2: Dict = None) -> Dict:
         """
         Calculate phase-specific DTW similarities.
         
@@ -155,6 +186,8 @@ class DTWAnalyzer:
             features2: Second video's DTW features
             video1_data: First video's raw data
             video2_data: Second video's raw data
+            loading_features1: First video's Loading DTW features (extracted if None)
+            loading_features2: Second video's Loading DTW features (extracted if None)
             
         Returns:
             Dictionary of phase-specific similarities
@@ -239,8 +272,10 @@ class DTWAnalyzer:
                 print(f"   🔸 Loading phase: Using integrated DTW + static analysis")
                 
                 # Extract Loading-specific DTW features
-                loading_features1 = self.loading_dtw_extractor.extract_loading_dtw_features(video1_data)
-                loading_features2 = self.loading_dtw_extractor.extract_loading_dtw_features(video2_data)
+                if loading_features1 is None:
+                    loading_features1 = self.loading_dtw_extractor.extract_loading_dtw_features(video1_data)
+                if loading_features2 is None:
+                    loading_features2 = self.loading_dtw_extractor.extract_loading_dtw_features(video2_data)
                 
                 if 'error' in loading_features1 or 'error' in loading_features2:
                     print(f"   ⚠️ Loading DTW feature extraction failed")
@@ -0,0 +1,214 @@
+"""
+DTW Kernel
+
+Native-speed DTW engine shared by the similarity calculator and the visualizer.
+
+Semantics follow dtaidistance's dtw.distance so existing similarity thresholds keep
+their meaning:
+- local cost is the squared (multivariate: squared Euclidean) difference and the
+  returned distance is the square root of the accumulated cost
+- window: Sakoe-Chiba band (None/0 = unconstrained), widened by the length difference
+- max_step: cells whose pointwise distance exceeds it are not allowed
+- max_dist: early abandon; returns inf as soon as every cell of a row exceeds it
+
+Uses Numba when available, otherwise a row-vectorized NumPy recurrence.
+"""
+from typing import List, Optional, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _as_sequence(series) -> np.ndarray:
+    """Convert a 1D series or a list of points to a (length, dims) float array"""
+    arr = np.asarray(series, dtype=np.float64)
+    if arr.ndim == 1:
+        arr = arr[:, None]
+    return np.ascontiguousarray(arr)
+
+
+def _limits(window: Optional[int], max_dist: Optional[float], max_step: Optional[float],
+            squared: bool) -> Tuple[int, float, float]:
+    # 0/None disables a constraint (same convention as dtaidistance)
+    window = int(window) if window else 0
+    max_dist = float(max_dist) if max_dist else np.inf
+    max_step = float(max_step) if max_step else np.inf
+    if squared:
+        max_dist, max_step = max_dist ** 2, max_step ** 2
+    return window, max_dist, max_step
+
+
+def _cost_matrix_numpy(s1: np.ndarray, s2: np.ndarray, window: int, max_dist: float,
+                       max_step: float, squared: bool) -> Optional[np.ndarray]:
+    n, m = len(s1), len(s2)
+    acc = np.full((n + 1, m + 1), np.inf)
+    acc[0, 0] = 0.0
+
+    for i in range(1, n + 1):
+        if window:
+            lo = max(0, i - 1 - max(0, n - m) - window + 1)
+            hi = min(m, i - 1 + max(0, m - n) + window)
+        else:
+            lo, hi = 0, m
+        if lo >= hi:
+            continue
+
+        diff = s2[lo:hi] - s1[i - 1]
+        cost = np.einsum('ij,ij->i', diff, diff)
+        if not squared:
+            cost = np.sqrt(cost)
+
+        # Vertical/diagonal predecessors are vectorized; the horizontal dependency is a
+        # min-plus scan: acc[j] = C[j] + min_{k<=j}(best[k] - C[k]) with C = cumsum(cost)
+        best = cost + np.minimum(acc[i - 1, lo:hi], acc[i - 1, lo + 1:hi + 1])
+        blocked = cost > max_step
+        best[blocked] = np.inf
+        row = np.full(hi - lo, np.inf)
+        start = 0
+        for stop in list(np.flatnonzero(blocked)) + [hi - lo]:
+            if stop > start:
+                cumulative = np.cumsum(cost[start:stop])
+                row[start:stop] = cumulative + np.minimum.accumulate(best[start:stop] - cumulative)
+            start = stop + 1
+        acc[i, lo + 1:hi + 1] = row
+
+        if max_dist != np.inf and not np.any(row <= max_dist):
+            return None
+
+    if acc[n, m] > max_dist:
+        return None
+    return acc
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _cost_matrix_numba(s1, s2, window, max_dist, max_step, squared):
+        n, m = s1.shape[0], s2.shape[0]
+        dims = s1.shape[1]
+        acc = np.full((n + 1, m + 1), np.inf)
+        acc[0, 0] = 0.0
+
+        for i in range(1, n + 1):
+            if window > 0:
+                lo = max(0, i - 1 - max(0, n - m) - window + 1)
+                hi = min(m, i - 1 + max(0, m - n) + window)
+            else:
+                lo, hi = 0, m
+            row_ok = False
+            for j in range(lo, hi):
+                cost = 0.0
+                for d in range(dims):
+                    delta = s1[i - 1, d] - s2[j, d]
+                    cost += delta * delta
+                if not squared:
+                    cost = np.sqrt(cost)
+                if cost > max_step:
+                    continue
+                best = min(acc[i - 1, j], acc[i - 1, j + 1], acc[i, j])
+                acc[i, j + 1] = cost + best
+                if acc[i, j + 1] <= max_dist:
+                    row_ok = True
+            if max_dist != np.inf and not row_ok:
+                return acc, False
+
+        return acc, acc[n, m] <= max_dist
+
+
+def _cost_matrix(s1: np.ndarray, s2: np.ndarray, window: int, max_dist: float,
+                 max_step: float, squared: bool) -> Optional[np.ndarray]:
+    """Accumulated cost matrix of shape (n+1, m+1), or None when abandoned"""
+    if s1.shape[1] != s2.shape[1]:
+        raise ValueError(f"Sequences have different dimensions: {s1.shape[1]} vs {s2.shape[1]}")
+    if NUMBA_AVAILABLE:
+        acc, within_limit = _cost_matrix_numba(s1, s2, window, max_dist, max_step, squared)
+        return acc if within_limit else None
+    return _cost_matrix_numpy(s1, s2, window, max_dist, max_step, squared)
+
+
+def _final_distance(acc: Optional[np.ndarray], squared: bool) -> float:
+    if acc is None:
+        return float('inf')
+    total = acc[-1, -1]
+    return float(np.sqrt(total)) if squared else float(total)
+
+
+def _backtrack(acc: np.ndarray) -> np.ndarray:
+    # Diagonal preferred on ties, then vertical, then horizontal (same as dtaidistance.best_path)
+    i, j = acc.shape[0] - 1, acc.shape[1] - 1
+    path = np.empty((i + j, 2), dtype=np.int64)
+    length = 0
+    path[length, 0], path[length, 1] = i - 1, j - 1
+    length += 1
+    while i > 1 or j > 1:
+        diagonal, up, left = acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1]
+        if diagonal <= up and diagonal <= left:
+            i, j = i - 1, j - 1
+        elif up <= left:
+            i -= 1
+        else:
+            j -= 1
+        path[length, 0], path[length, 1] = i - 1, j - 1
+        length += 1
+    return path[:length][::-1]
+
+
+if NUMBA_AVAILABLE:
+    _backtrack_numba = njit(cache=True)(_backtrack)
+
+
+def _best_path(acc: np.ndarray) -> List[Tuple[int, int]]:
+    """Backtrack the warping path from an accumulated cost matrix"""
+    if not np.isfinite(acc[-1, -1]):
+        return []
+    path = _backtrack_numba(acc) if NUMBA_AVAILABLE else _backtrack(acc)
+    return [(int(i), int(j)) for i, j in path]
+
+
+def dtw_distance(series1, series2, window: Optional[int] = None, max_dist: Optional[float] = None,
+                 max_step: Optional[float] = None, squared: bool = True) -> float:
+    """
+    DTW distance between two 1D series or two point sequences (e.g. (x, y) trajectories).
+
+    Args:
+        series1: First sequence, shape (n,) or (n, dims)
+        series2: Second sequence, shape (m,) or (m, dims)
+        window: Sakoe-Chiba band width (None/0 = unconstrained)
+        max_dist: Abandon and return inf once the distance must exceed this
+        max_step: Disallow cells whose pointwise distance exceeds this
+        squared: Squared Euclidean local cost with sqrt of the total (dtaidistance);
+                 False accumulates plain Euclidean costs
+
+    Returns:
+        DTW distance (inf if abandoned or no path exists)
+    """
+    s1, s2 = _as_sequence(series1), _as_sequence(series2)
+    if len(s1) == 0 or len(s2) == 0:
+        return float('inf')
+    acc = _cost_matrix(s1, s2, *_limits(window, max_dist, max_step, squared), squared)
+    return _final_distance(acc, squared)
+
+
+def dtw_distance_and_path(series1, series2, window: Optional[int] = None,
+                          max_dist: Optional[float] = None, max_step: Optional[float] = None,
+                          squared: bool = True) -> Tuple[float, List[Tuple[int, int]]]:
+    """
+    DTW distance and warping path from a single cost-matrix computation.
+
+    Args:
+        Same as dtw_distance
+
+    Returns:
+        Tuple of (distance, warping path as [(index1, index2), ...]); the path is empty
+        when the distance is inf
+    """
+    s1, s2 = _as_sequence(series1), _as_sequence(series2)
+    if len(s1) == 0 or len(s2) == 0:
+        return float('inf'), []
+    acc = _cost_matrix(s1, s2, *_limits(window, max_dist, max_step, squared), squared)
+    if acc is None:
+        return float('inf'), []
+    return _final_distance(acc, squared), _best_path(acc)
@@ -3,13 +3,12 @@ DTW Similarity Calculator
 
 Performs DTW analysis between two sets of shooting features and calculates similarity scores.
 """
+import logging
 import numpy as np
 from typing import Dict, List, Optional
 import warnings
 warnings.filterwarnings("ignore")
 
-from dtaidistance import dtw
-DTW_AVAILABLE = True
 # Set random seed for deterministic results
 import random
 import numpy as np
@@ -20,7 +19,11 @@ from scipy import signal
 SCIPY_AVAILABLE = True
 
 from .dtw_config import DTW_CONSTRAINTS, SIMILARITY_CONVERSION, SUBFEATURE_WEIGHTS
+from .dtw_kernel import dtw_distance, dtw_distance_and_path
 from shooting_comparison.config import *
+from analysis_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class DTWSimilarityCalculator:
@@ -34,7 +37,6 @@ class DTWSimilarityCalculator:
         self.dtw_constraints = DTW_CONSTRAINTS.copy()
         self.similarity_conversion = SIMILARITY_CONVERSION.copy()
         self.subfeature_weights = SUBFEATURE_WEIGHTS.copy()
-        self.dtw_available = DTW_AVAILABLE
         
     def calculate_feature_similarity(self, feature1: Dict, feature2: Dict, feature_name: str) -> Dict:
         """
@@ -69,19 +71,19 @@ class DTWSimilarityCalculator:
         
         # Debugging: feature_type
         if feature_name == 'ball_wrist_trajectory':
-            print(f"         Debug: ball_wrist_trajectory feature_type = {feature_type}")
-            print(f"         Debug: Using constraints = {constraints}")
+            logger.debug("         Debug: ball_wrist_trajectory feature_type = %s", feature_type)
+            logger.debug("         Debug: Using constraints = %s", constraints)
         
         # Handle new Rising DTW features
         if feature_name in ['rising_windup_kinematics', 'rising_jump_dynamics', 'rising_timing_patterns']:
             return self._calculate_rising_dtw_similarity(feature1, feature2, feature_name, constraints)
 
         if feature_name == 'timing_patterns':
-            print("         Debug: timing_patterns feature comparison")
-            print(f"         Debug: feature1 keys = {list(feature1.keys())}")
-            print(f"         Debug: feature2 keys = {list(feature2.keys())}")
+            logger.debug("         Debug: timing_patterns feature comparison")
+            logger.debug("         Debug: feature1 keys = %s", list(feature1.keys()))
+            logger.debug("         Debug: feature2 keys = %s", list(feature2.keys()))
             sim_result = self._calculate_timing_pattern_similarity(feature1, feature2, constraints)
-            print(f"         Debug: timing_patterns similarity = {sim_result}")
+            logger.debug("         Debug: timing_patterns similarity = %s", sim_result)
             return sim_result
 
         similarities = {}
@@ -132,10 +134,10 @@ class DTWSimilarityCalculator:
             
             # Detailed debugging for each subfeature of ball_wrist_trajectory
             if feature_name == 'ball_wrist_trajectory':
-                print(f"         🔍 Debug: {key} - series1 length: {len(series1) if series1 else 0}, series2 length: {len(series2) if series2 else 0}")
-                print(f"         🔍 Debug: {key} - similarity: {sim_result['similarity']:.1f}%, dtw_info: {sim_result['dtw_info']}")
+                logger.debug("         🔍 Debug: %s - series1 length: %s, series2 length: %s", key, len(series1) if series1 else 0, len(series2) if series2 else 0)
+                logger.debug("         🔍 Debug: %s - similarity: %.1f%%, dtw_info: %s", key, sim_result['similarity'], sim_result['dtw_info'])
                 if sim_result['similarity'] == 0.0:
-                    print(f"         Warning: {key} returned 0.0% - checking dtw_info for error...")
+                    logger.debug("         Warning: %s returned 0.0%% - checking dtw_info for error...", key)
         
         # Calculate weighted average similarity for this feature
         if weights and similarities:
@@ -154,15 +156,15 @@ class DTWSimilarityCalculator:
             overall_similarity = np.mean(list(similarities.values())) if similarities else 0
         
         # Debugging: Output ball_wrist_trajectory subfeature similarities
-        if feature_name == 'ball_wrist_trajectory':
-            print(f"         🔍 Debug: ball_wrist_trajectory subfeature similarities = {similarities}")
-            print(f"         🔍 Debug: ball_wrist_trajectory overall_similarity = {overall_similarity}")
+        if feature_name == 'ball_wrist_trajectory' and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("         🔍 Debug: ball_wrist_trajectory subfeature similarities = %s", similarities)
+            logger.debug("         🔍 Debug: ball_wrist_trajectory overall_similarity = %s", overall_similarity)
             
             # Output detailed information for each subfeature
             for subfeature_name, similarity in similarities.items():
-                print(f"         🔍 Debug: {subfeature_name} = {similarity:.1f}%")
+                logger.debug("         🔍 Debug: %s = %.1f%%", subfeature_name, similarity)
                 if similarity == 0.0:
-                    print(f"         Warning: {subfeature_name} is 0.0% - investigating...")
+                    logger.debug("         Warning: %s is 0.0%% - investigating...", subfeature_name)
         
         return {
             'overall_similarity': float(overall_similarity),
@@ -205,55 +207,40 @@ class DTWSimilarityCalculator:
         valid_traj2 = [(x, y) for x, y in traj2 if is_valid_point(x, y)]
         
         # ball_wrist_trajectory related debugging
-        print(f"         🔍 Debug: 2D trajectory - original lengths: {len(traj1)}, {len(traj2)}")
-        print(f"         🔍 Debug: 2D trajectory - valid lengths: {len(valid_traj1)}, {len(valid_traj2)}")
+        logger.debug("         🔍 Debug: 2D trajectory - original lengths: %s, %s", len(traj1), len(traj2))
+        logger.debug("         🔍 Debug: 2D trajectory - valid lengths: %s, %s", len(valid_traj1), len(valid_traj2))
         if len(valid_traj1) < 3 or len(valid_traj2) < 3:
-            print(f"         Warning: 2D trajectory - insufficient valid data after NaN filtering")
-            print(f"         🔍 Debug: Sample traj1 data: {traj1[:3] if traj1 else 'empty'}")
-            print(f"         🔍 Debug: Sample traj2 data: {traj2[:3] if traj2 else 'empty'}")
-            print(f"         🔍 Debug: Sample valid_traj1 data: {valid_traj1[:3] if valid_traj1 else 'empty'}")
-            print(f"         🔍 Debug: Sample valid_traj2 data: {valid_traj2[:3] if valid_traj2 else 'empty'}")
+            logger.warning("         Warning: 2D trajectory - insufficient valid data after NaN filtering")
+            logger.debug("         🔍 Debug: Sample traj1 data: %s", traj1[:3] if traj1 else 'empty')
+            logger.debug("         🔍 Debug: Sample traj2 data: %s", traj2[:3] if traj2 else 'empty')
+            logger.debug("         🔍 Debug: Sample valid_traj1 data: %s", valid_traj1[:3] if valid_traj1 else 'empty')
+            logger.debug("         🔍 Debug: Sample valid_traj2 data: %s", valid_traj2[:3] if valid_traj2 else 'empty')
         
         if len(valid_traj1) < 3 or len(valid_traj2) < 3:
             return {'similarity': 0.0, 'dtw_info': {'error': 'insufficient_data'}}
         
-        # Separate X and Y components
-        x1 = [x for x, _ in valid_traj1]
-        y1 = [y for _, y in valid_traj1]
-        x2 = [x for x, _ in valid_traj2]
-        y2 = [y for _, y in valid_traj2]
+        points1 = np.array(valid_traj1, dtype=float)
+        points2 = np.array(valid_traj2, dtype=float)
         
         try:
-            if self.dtw_available:
-                # Use dtaidistance library
-                distance_x = dtw.distance(
-                    x1, x2,
-                    window=int(len(x1) * constraints['window']),
-                    max_dist=constraints['max_dist'],
-                    max_step=constraints['max_step']
-                )
-                
-                distance_y = dtw.distance(
-                    y1, y2,
-                    window=int(len(y1) * constraints['window']),
-                    max_dist=constraints['max_dist'],
-                    max_step=constraints['max_step']
-                )
-                
-                # Get warping path for additional analysis
-                try:
-                    _, path_x = dtw.warping_paths(x1, x2, window=int(len(x1) * constraints['window']))
-                    warping_ratio = len(path_x) / max(len(x1), len(x2)) if path_x is not None and len(path_x) > 0 and max(len(x1), len(x2)) > 0 else 1.0
-                except:
-                    warping_ratio = 1.0
-            else:
-                # Fallback implementation
-                distance_x = self._fallback_dtw_distance(x1, x2)
-                distance_y = self._fallback_dtw_distance(y1, y2)
-                warping_ratio = 1.0
+            # Multivariate DTW: x and y share one alignment. Per-axis limits are scaled
+            # by sqrt(2) so they bound the joint (Euclidean) distance the same way.
+            distance, path = dtw_distance_and_path(
+                points1, points2,
+                window=int(len(points1) * constraints['window']),
+                max_dist=constraints['max_dist'] * np.sqrt(2) if constraints['max_dist'] else None,
+                max_step=constraints['max_step'] * np.sqrt(2) if constraints['max_step'] else None
+            )
+            warping_ratio = len(path) / max(len(points1), len(points2)) if path else 1.0
             
-            # Combine X and Y distances
-            combined_distance = np.sqrt(distance_x**2 + distance_y**2) / 2.0
+            # Per-axis contributions along the shared path (distance_x² + distance_y² = distance²)
+            if path:
+                index1, index2 = np.array(path).T
+                deltas = points1[index1] - points2[index2]
+                distance_x, distance_y = np.sqrt(np.sum(deltas ** 2, axis=0))
+            else:
+                distance_x = distance_y = float('inf')
+            combined_distance = distance / 2.0
             
             # Convert to similarity score (0-100)
             similarity = self._distance_to_similarity(combined_distance, feature_type)
@@ -287,41 +274,26 @@ class DTWSimilarityCalculator:
         valid_series2 = [x for x in series2 if is_valid_value(x)]
         
         # ball_wrist_distance related debugging
-        print(f"         Debug: 1D series - original lengths: {len(series1)}, {len(series2)}")
-        print(f"         Debug: 1D series - valid lengths: {len(valid_series1)}, {len(valid_series2)}")
+        logger.debug("         Debug: 1D series - original lengths: %s, %s", len(series1), len(series2))
+        logger.debug("         Debug: 1D series - valid lengths: %s, %s", len(valid_series1), len(valid_series2))
         if len(valid_series1) < 2 or len(valid_series2) < 2:
-            print(f"         Warning: 1D series - insufficient valid data after NaN filtering")
-            print(f"         Debug: Sample series1 data: {series1[:3] if series1 else 'empty'}")
-            print(f"         Debug: Sample series2 data: {series2[:3] if series2 else 'empty'}")
-            print(f"         Debug: Sample valid_series1 data: {valid_series1[:3] if valid_series1 else 'empty'}")
-            print(f"         Debug: Sample valid_series2 data: {valid_series2[:3] if valid_series2 else 'empty'}")
+            logger.warning("         Warning: 1D series - insufficient valid data after NaN filtering")
+            logger.debug("         Debug: Sample series1 data: %s", series1[:3] if series1 else 'empty')
+            logger.debug("         Debug: Sample series2 data: %s", series2[:3] if series2 else 'empty')
+            logger.debug("         Debug: Sample valid_series1 data: %s", valid_series1[:3] if valid_series1 else 'empty')
+            logger.debug("         Debug: Sample valid_series2 data: %s", valid_series2[:3] if valid_series2 else 'empty')
         
         if len(valid_series1) < 2 or len(valid_series2) < 2:
             return {'similarity': 0.0, 'dtw_info': {'error': 'insufficient_data'}}
         
         try:
-            if self.dtw_available:
-                # Use dtaidistance library
-                distance = dtw.distance(
-                    valid_series1, valid_series2,
-                    window=int(len(valid_series1) * constraints['window']),
-                    max_dist=constraints['max_dist'],
-                    max_step=constraints['max_step']
-                )
-                
-                # Get warping path for additional analysis
-                try:
-                    _, path = dtw.warping_paths(
-                        valid_series1, valid_series2, 
-                        window=int(len(valid_series1) * constraints['window'])
-                    )
-                    warping_ratio = len(path) / max(len(valid_series1), len(valid_series2)) if path is not None and len(path) > 0 and max(len(valid_series1), len(valid_series2)) > 0 else 1.0
-                except:
-                    warping_ratio = 1.0
-            else:
-                # Fallback implementation
-                distance = self._fallback_dtw_distance(valid_series1, valid_series2)
-                warping_ratio = 1.0
+            distance, path = dtw_distance_and_path(
+                valid_series1, valid_series2,
+                window=int(len(valid_series1) * constraints['window']),
+                max_dist=constraints['max_dist'],
+                max_step=constraints['max_step']
+            )
+            warping_ratio = len(path) / max(len(valid_series1), len(valid_series2)) if path else 1.0
             
             # Convert to similarity score
             similarity = self._distance_to_similarity(distance, feature_type)
@@ -372,34 +344,12 @@ class DTWSimilarityCalculator:
         
         # Output debugging information (always output for ball_wrist_special type)
         if feature_type == 'ball_wrist_special' or distance > 1.0:
-            print(f"   🔍 DTW Debug - Feature: {feature_type}, Distance: {distance:.3f}, "
-                  f"Normalized: {normalized_distance:.3f}, Similarity: {final_similarity:.1f}")
-            print(f"   🔍 DTW Debug - Params: max_dist={max_expected_dist}, scaling={scaling_factor}")
+            logger.debug("   🔍 DTW Debug - Feature: %s, Distance: %.3f, Normalized: %.3f, Similarity: %.1f",
+                         feature_type, distance, normalized_distance, final_similarity)
+            logger.debug("   🔍 DTW Debug - Params: max_dist=%s, scaling=%s", max_expected_dist, scaling_factor)
         
         return final_similarity
 
-    def _fallback_dtw_distance(self, series1: List[float], series2: List[float]) -> float:
-        """
-        Fallback DTW implementation when dtaidistance is not available.
-        Simple implementation - not as efficient as dtaidistance.
-        """
-        n, m = len(series1), len(series2)
-        
-        # Create distance matrix
-        dtw_matrix = np.full((n + 1, m + 1), np.inf)
-        dtw_matrix[0, 0] = 0
-        
-        for i in range(1, n + 1):
-            for j in range(1, m + 1):
-                cost = abs(series1[i-1] - series2[j-1])
-                dtw_matrix[i, j] = cost + min(
-                    dtw_matrix[i-1, j],      # insertion
-                    dtw_matrix[i, j-1],      # deletion
-                    dtw_matrix[i-1, j-1]     # match
-                )
-        
-        return dtw_matrix[n, m] / max(n, m)  # Normalized by sequence length
-    
     def _calculate_rising_dtw_similarity(self, feature1: Dict, feature2: Dict, 
                                        feature_name: str, constraints: Dict) -> Dict:
         """
@@ -417,7 +367,7 @@ class DTWSimilarityCalculator:
         similarities = {}
         dtw_results = {}
         
-        print(f"         🔄 Calculating Rising DTW similarity for {feature_name}")
+        logger.debug("         🔄 Calculating Rising DTW similarity for %s", feature_name)
         
         # Define feature-specific weights and processing methods
         if feature_name == 'rising_windup_kinematics':
@@ -470,7 +420,7 @@ class DTWSimilarityCalculator:
             similarities[key] = sim_result['similarity']
             dtw_results[key] = sim_result['dtw_info']
             
-            print(f"         🔸 {key}: {sim_result['similarity']:.1f}%")
+            logger.debug("         🔸 %s: %.1f%%", key, sim_result['similarity'])
         
         # Calculate weighted average similarity
         if weights and similarities:
@@ -487,7 +437,7 @@ class DTWSimilarityCalculator:
             # Equal weights fallback
             overall_similarity = np.mean(list(similarities.values())) if similarities else 0
         
-        print(f"         ✅ {feature_name} overall similarity: {overall_similarity:.1f}%")
+        logger.debug("         ✅ %s overall similarity: %.1f%%", feature_name, overall_similarity)
         
         return {
             'overall_similarity': float(overall_similarity),
@@ -539,24 +489,14 @@ class DTWSimilarityCalculator:
                 dim1_series = arr1[:, dim].tolist()
                 dim2_series = arr2[:, dim].tolist()
                 
-                if self.dtw_available:
-                    try:
-                        distance = dtw.distance(
-                            dim1_series, dim2_series,
-                            window=int(len(dim1_series) * constraints.get('window', 0.5)),
-                            max_dist=constraints.get('max_dist', 1.0),
-                            max_step=constraints.get('max_step', 2)
-                        )
-                        total_distance += distance
-                        valid_dimensions += 1
-                    except:
-                        distance = self._fallback_dtw_distance(dim1_series, dim2_series)
-                        total_distance += distance
-                        valid_dimensions += 1
-                else:
-                    distance = self._fallback_dtw_distance(dim1_series, dim2_series)
-                    total_distance += distance
-                    valid_dimensions += 1
+                distance = dtw_distance(
+                    dim1_series, dim2_series,
+                    window=int(len(dim1_series) * constraints.get('window', 0.5)),
+                    max_dist=constraints.get('max_dist', 1.0),
+                    max_step=constraints.get('max_step', 2)
+                )
+                total_distance += distance
+                valid_dimensions += 1
             
             if valid_dimensions > 0:
                 avg_distance = total_distance / valid_dimensions
@@ -606,7 +546,7 @@ class DTWSimilarityCalculator:
             if not phase1_frames or not phase2_frames:
                 # Special handling for Loading phase when no frames are detected
                 if phase == 'Loading':
-                    print(f"         🔍 Special handling for Loading phase with no frames")
+                    logger.debug("         🔍 Special handling for Loading phase with no frames")
                     # Give a default similarity for Loading phase when not detected
                     # This could indicate a direct transition from Setup to Rising
                     loading_similarity = 75.0  # Default similarity for missing Loading phase
@@ -629,7 +569,7 @@ class DTWSimilarityCalculator:
             # Special handling for Follow-through phase using static comparison
 
             if phase == 'Follow-through' and followthrough1 and followthrough2:
-                print(f"      🔍 Using static comparison for Follow-through phase...")
+                logger.debug("      🔍 Using static comparison for Follow-through phase...")
                 followthrough_result = self.calculate_followthrough_static_similarity(
                     followthrough1, followthrough2
                 )
@@ -657,21 +597,21 @@ class DTWSimilarityCalculator:
                                          phase: str) -> Dict:
         """Extract and compare features for specific phase"""
         try:
-            print(f"      🔍 Analyzing {phase} phase...")
-            print(f"         Frame counts: Video1={len(phase1_frames)}, Video2={len(phase2_frames)}")
+            logger.debug("      🔍 Analyzing %s phase...", phase)
+            logger.debug("         Frame counts: Video1=%s, Video2=%s", len(phase1_frames), len(phase2_frames))
             
             # Extract phase-specific trajectories and features
             phase_features1 = self._extract_phase_features(features1, phase1_frames, phase)
             phase_features2 = self._extract_phase_features(features2, phase2_frames, phase)
             
-            print(f"         Extracted features: Video1={len(phase_features1)}, Video2={len(phase_features2)}")
+            logger.debug("         Extracted features: Video1=%s, Video2=%s", len(phase_features1), len(phase_features2))
             
             # Check minimum frame requirements (lowered for phase-specific analysis)
             min_frames = 1  # Lowered from 2 to 1 for phase-specific analysis to handle Setup phase
             
             # Special handling for any phase with very few frames (1-3 frames)
             if len(phase1_frames) <= 3 or len(phase2_frames) <= 3:
-                print(f"         🔍 Special handling for {phase} phase with few frames")
+                logger.debug("         🔍 Special handling for %s phase with few frames", phase)
                 # Calculate simple similarity for single frame comparison
                 phase_similarity = self._calculate_single_frame_similarity(
                     phase_features1, phase_features2
@@ -685,7 +625,7 @@ class DTWSimilarityCalculator:
                 }
             
             if not phase_features1 or not phase_features2:
-                print(f"         Warning: No features extracted for {phase}")
+                logger.warning("         Warning: No features extracted for %s", phase)
                 return {
                     'similarity': 0.0,
                     'frame_count_1': len(phase1_frames),
@@ -709,10 +649,10 @@ class DTWSimilarityCalculator:
                         if isinstance(subvalue, list):
                             total_features2 += len(subvalue)
             
-            print(f"         Feature data: Video1={total_features1}, Video2={total_features2}")
+            logger.debug("         Feature data: Video1=%s, Video2=%s", total_features1, total_features2)
             
             if total_features1 < min_frames or total_features2 < min_frames:
-                print(f"         Warning: Insufficient data for {phase} (min {min_frames} required)")
+                logger.warning("         Warning: Insufficient data for %s (min %s required)", phase, min_frames)
                 return {
                     'similarity': 0.0,
                     'frame_count_1': len(phase1_frames),
@@ -728,22 +668,22 @@ class DTWSimilarityCalculator:
             for feature_name in ['ball_wrist_trajectory', 'shooting_arm_kinematics', 
                                'lower_body_stability', 'body_alignment']:
                 if feature_name in phase_features1 and feature_name in phase_features2:
-                    print(f"         🔸 Comparing {feature_name}...")
+                    logger.debug("         🔸 Comparing %s...", feature_name)
                     feature_sim = self._calculate_phase_feature_similarity(
                         phase_features1[feature_name], 
                         phase_features2[feature_name], 
                         feature_name
                     )
-                    print(f"         ✅ {feature_name}: {feature_sim:.1f}%")
+                    logger.debug("         ✅ %s: %.1f%%", feature_name, feature_sim)
                     total_similarity += feature_sim
                     feature_count += 1
                 else:
-                    print(f"         Warning: {feature_name}: Missing in one or both videos")
+                    logger.debug("         Warning: %s: Missing in one or both videos", feature_name)
             
             # Average similarity for this phase
             phase_similarity = total_similarity / feature_count if feature_count > 0 else 0.0
             
-            print(f"         🎯 {phase} similarity: {phase_similarity:.1f}% (from {feature_count} features)")
+            logger.debug("         🎯 %s similarity: %.1f%% (from %s features)", phase, phase_similarity, feature_count)
             
             return {
                 'similarity': phase_similarity,
@@ -754,7 +694,7 @@ class DTWSimilarityCalculator:
             }
             
         except Exception as e:
-            print(f"         ❌ Error in {phase} analysis: {e}")
+            logger.warning("         ❌ Error in %s analysis: %s", phase, e)
             return {
                 'similarity': 0.0,
                 'frame_count_1': len(phase1_frames),
@@ -782,7 +722,7 @@ class DTWSimilarityCalculator:
         if not frame_indices:
             frame_indices = list(range(len(phase_frames)))
         
-        print(f"         Frame indices for {phase}: {frame_indices[:5]}...{frame_indices[-5:] if len(frame_indices) > 10 else ''}")
+        logger.debug("         Frame indices for %s: %s...%s", phase, frame_indices[:5], frame_indices[-5:] if len(frame_indices) > 10 else '')
         
         # Convert absolute frame indices to relative indices (0-based)
         # Frame indices from phase detection are absolute, but DTW features are 0-based
@@ -792,9 +732,9 @@ class DTWSimilarityCalculator:
             
             # Convert to relative indices (0-based) by subtracting the minimum index
             relative_indices = [idx - min_idx for idx in frame_indices]
-            print(f"         Warning: Converting absolute indices to relative indices")
-            print(f"         Original range: {min_idx} to {max_idx}")
-            print(f"         Relative indices: {relative_indices[:5]}...{relative_indices[-5:] if len(relative_indices) > 10 else ''}")
+            logger.debug("         Warning: Converting absolute indices to relative indices")
+            logger.debug("         Original range: %s to %s", min_idx, max_idx)
+            logger.debug("         Relative indices: %s...%s", relative_indices[:5], relative_indices[-5:] if len(relative_indices) > 10 else '')
             frame_indices = relative_indices
         
         # Extract phase-specific portions of each feature
@@ -829,16 +769,16 @@ class DTWSimilarityCalculator:
                         if 0 <= frame_idx < len(value):
                             extracted_values.append(value[frame_idx])
                         else:
-                            print(f"         Warning: Frame index {frame_idx} out of bounds for {key} (max: {len(value)-1})")
+                            logger.debug("         Warning: Frame index %s out of bounds for %s (max: %s)", frame_idx, key, len(value)-1)
                     
-                    print(f"         Extracting {key}: {len(frame_indices)} frames from {len(value)} total")
+                    logger.debug("         Extracting %s: %s frames from %s total", key, len(frame_indices), len(value))
                     
                     if extracted_values:
                         phase_portion[key] = extracted_values
-                        print(f"         ✅ {key}: extracted {len(phase_portion[key])} values")
+                        logger.debug("         ✅ %s: extracted %s values", key, len(phase_portion[key]))
                     else:
                         phase_portion[key] = []
-                        print(f"         Warning: {key}: no valid frames extracted, using empty list")
+                        logger.debug("         Warning: %s: no valid frames extracted, using empty list", key)
                 else:
                     phase_portion[key] = []
             else:
@@ -854,7 +794,7 @@ class DTWSimilarityCalculator:
             similarity_result = self.calculate_feature_similarity(feature1, feature2, feature_name)
             return similarity_result.get('overall_similarity', 0.0)
         except Exception as e:
-            print(f"Warning: Error calculating phase feature similarity for {feature_name}: {e}")
+            logger.warning("Warning: Error calculating phase feature similarity for %s: %s", feature_name, e)
             return 0.0
 
     def calculate_followthrough_static_similarity(self, followthrough1: Dict, followthrough2: Dict) -> Dict:
@@ -873,7 +813,7 @@ class DTWSimilarityCalculator:
         Returns:
             Dictionary containing follow-through static similarity results
         """
-        print("      🔄 Calculating Follow-through static similarity...")
+        logger.debug("      🔄 Calculating Follow-through static similarity...")
         
         if not followthrough1 or not followthrough2:
             return {
@@ -895,7 +835,7 @@ class DTWSimilarityCalculator:
             followthrough2.get('max_elbow_angle_analysis', {})
         )
         components['max_elbow_pose_comparison']['similarity'] = max_elbow_sim
-        print(f"         🔸 Max elbow pose similarity: {max_elbow_sim:.1f}%")
+        logger.debug("         🔸 Max elbow pose similarity: %.1f%%", max_elbow_sim)
         
         # 2. Stability duration comparison (30% weight) 
         stability_sim = self._compare_stability_duration(
@@ -903,14 +843,14 @@ class DTWSimilarityCalculator:
             followthrough2.get('stability_analysis', {})
         )
         components['stability_duration_comparison']['similarity'] = stability_sim
-        print(f"         🔸 Stability duration similarity: {stability_sim:.1f}%")
+        logger.debug("         🔸 Stability duration similarity: %.1f%%", stability_sim)
         
         # 3. Angle standard deviation comparison (30% weight)
         angle_std_sim = self._compare_angle_standard_deviation(
             followthrough1, followthrough2
         )
         components['angle_std_comparison']['similarity'] = angle_std_sim
-        print(f"         🔸 Angle std deviation similarity: {angle_std_sim:.1f}%")
+        logger.debug("         🔸 Angle std deviation similarity: %.1f%%", angle_std_sim)
         
         # Calculate weighted overall similarity
         total_weighted_score = 0.0
@@ -924,7 +864,7 @@ class DTWSimilarityCalculator:
         
         overall_similarity = total_weighted_score / total_weight if total_weight > 0 else 0.0
         
-        print(f"         ✅ Follow-through overall similarity: {overall_similarity:.1f}%")
+        logger.debug("         ✅ Follow-through overall similarity: %.1f%%", overall_similarity)
         
         return {
             'overall_similarity': float(overall_similarity),
@@ -1016,7 +956,7 @@ class DTWSimilarityCalculator:
                 return 0.0
                 
         except Exception as e:
-            print(f"         Warning: Error in max elbow pose comparison: {e}")
+            logger.warning("         Warning: Error in max elbow pose comparison: %s", e)
             return 0.0
     
     def _compare_stability_duration(self, stability1: Dict, stability2: Dict) -> float:
@@ -1074,7 +1014,7 @@ class DTWSimilarityCalculator:
                 return 0.0
                 
         except Exception as e:
-            print(f"         Warning: Error in stability duration comparison: {e}")
+            logger.warning("         Warning: Error in stability duration comparison: %s", e)
             return 0.0
     
     def _compare_angle_standard_deviation(self, followthrough1: Dict, followthrough2: Dict) -> float:
@@ -1161,7 +1101,7 @@ class DTWSimilarityCalculator:
                 return 0.0
                 
         except Exception as e:
-            print(f"         Warning: Error in angle std comparison: {e}")
+            logger.warning("         Warning: Error in angle std comparison: %s", e)
             return 0.0
 
     def calculate_loading_integrated_similarity(self, dtw_similarity: float, loading_analysis1: Dict, 
@@ -1177,7 +1117,7 @@ class DTWSimilarityCalculator:
         Returns:
             Dictionary containing integrated Loading similarity results
         """
-        print("      🔄 Calculating Loading integrated similarity (DTW + Static)...")
+        logger.debug("      🔄 Calculating Loading integrated similarity (DTW + Static)...")
         
         if not loading_analysis1 or not loading_analysis2:
             return {
@@ -1201,7 +1141,7 @@ class DTWSimilarityCalculator:
             loading_analysis2.get('max_leg_angles', {})
         )
         static_components['max_leg_angles']['similarity'] = leg_sim
-        print(f"         🔸 Max leg angles similarity: {leg_sim:.1f}%")
+        logger.debug("         🔸 Max leg angles similarity: %.1f%%", leg_sim)
         
         # 2. Compare max upper body tilt
         tilt_sim = self._compare_loading_upper_body_tilt(
@@ -1209,7 +1149,7 @@ class DTWSimilarityCalculator:
             loading_analysis2.get('max_upper_body_tilt', {})
         )
         static_components['max_upper_body_tilt']['similarity'] = tilt_sim
-        print(f"         🔸 Max upper body tilt similarity: {tilt_sim:.1f}%")
+        logger.debug("         🔸 Max upper body tilt similarity: %.1f%%", tilt_sim)
         
         # 3. Compare loading duration
         duration_sim = self._compare_loading_duration(
@@ -1217,7 +1157,7 @@ class DTWSimilarityCalculator:
             loading_analysis2.get('total_loading_time', 0)
         )
         static_components['loading_duration']['similarity'] = duration_sim
-        print(f"         🔸 Loading duration similarity: {duration_sim:.1f}%")
+        logger.debug("         🔸 Loading duration similarity: %.1f%%", duration_sim)
         
         # Calculate static analysis overall score
         static_total_weighted = 0.0
@@ -1237,7 +1177,7 @@ class DTWSimilarityCalculator:
         
         integrated_similarity = (dtw_weight * dtw_similarity) + (static_weight * static_overall)
         
-        print(f"         ✅ Loading integrated similarity: {integrated_similarity:.1f}% (DTW: {dtw_similarity:.1f}%, Static: {static_overall:.1f}%)")
+        logger.debug("         ✅ Loading integrated similarity: %.1f%% (DTW: %.1f%%, Static: %.1f%%)", integrated_similarity, dtw_similarity, static_overall)
         
         return {
             'overall_similarity': float(integrated_similarity),
@@ -1263,7 +1203,7 @@ class DTWSimilarityCalculator:
         Returns:
             Dictionary containing integrated Rising similarity results
         """
-        print("      🔄 Calculating Rising integrated similarity (DTW + Static)...")
+        logger.debug("      🔄 Calculating Rising integrated similarity (DTW + Static)...")
         
         if not rising_analysis1 or not rising_analysis2:
             return {
@@ -1289,7 +1229,7 @@ class DTWSimilarityCalculator:
             rising_analysis2.get('windup_trajectory', {})
         )
         static_components['trajectory_curvature']['similarity'] = curvature_sim
-        print(f"         🔸 Trajectory curvature similarity: {curvature_sim:.1f}%")
+        logger.debug("         🔸 Trajectory curvature similarity: %.1f%%", curvature_sim)
         
         # 2. Compare trajectory path length
         path_sim = self._compare_trajectory_path_length(
@@ -1297,7 +1237,7 @@ class DTWSimilarityCalculator:
             rising_analysis2.get('windup_trajectory', {})
         )
         static_components['trajectory_path_length']['similarity'] = path_sim
-        print(f"         🔸 Trajectory path length similarity: {path_sim:.1f}%")
+        logger.debug("         🔸 Trajectory path length similarity: %.1f%%", path_sim)
         
         # 3. Compare jump height
         jump_sim = self._compare_jump_height(
@@ -1305,7 +1245,7 @@ class DTWSimilarityCalculator:
             rising_analysis2.get('jump_analysis', {})
         )
         static_components['jump_height']['similarity'] = jump_sim
-        print(f"         🔸 Jump height similarity: {jump_sim:.1f}%")
+        logger.debug("         🔸 Jump height similarity: %.1f%%", jump_sim)
         
         # 4. Compare dip point angles
         dip_sim = self._compare_dip_point_angles(
@@ -1313,7 +1253,7 @@ class DTWSimilarityCalculator:
             rising_analysis2.get('dip_point_analysis', {})
         ) 
         static_components['dip_point_angles']['similarity'] = dip_sim
-        print(f"         🔸 Dip point angles similarity: {dip_sim:.1f}%")
+        logger.debug("         🔸 Dip point angles similarity: %.1f%%", dip_sim)
         
         # 5. Compare setup point angles
         setup_sim = self._compare_setup_point_angles(
@@ -1321,7 +1261,7 @@ class DTWSimilarityCalculator:
             rising_analysis2.get('setup_point_analysis', {})
         )
         static_components['setup_point_angles']['similarity'] = setup_sim
-        print(f"         🔸 Setup point angles similarity: {setup_sim:.1f}%")
+        logger.debug("         🔸 Setup point angles similarity: %.1f%%", setup_sim)
         
         # Calculate static analysis overall score
         static_total_weighted = 0.0
@@ -1341,7 +1281,7 @@ class DTWSimilarityCalculator:
         
         integrated_similarity = (dtw_weight * dtw_similarity) + (static_weight * static_overall)
         
-        print(f"         ✅ Rising integrated similarity: {integrated_similarity:.1f}% (DTW: {dtw_similarity:.1f}%, Static: {static_overall:.1f}%)")
+        logger.debug("         ✅ Rising integrated similarity: %.1f%% (DTW: %.1f%%, Static: %.1f%%)", integrated_similarity, dtw_similarity, static_overall)
         
         return {
             'overall_similarity': float(integrated_similarity),
@@ -1370,7 +1310,7 @@ class DTWSimilarityCalculator:
                 angle_diff = abs(float(left_max1) - float(left_max2))
                 left_sim = self._calculate_angle_similarity(angle_diff, LOADING_DEPTH_DIFF_LOW, LOADING_DEPTH_DIFF_MEDIUM, LOADING_DEPTH_DIFF_HIGH)
                 similarities.append(left_sim)
-                print(f"           Left leg angle diff: {angle_diff:.1f}° -> {left_sim:.1f}% similarity")
+                logger.debug("           Left leg angle diff: %.1f° -> %.1f%% similarity", angle_diff, left_sim)
             
             # Compare right leg max angle
             right_max1 = leg_angles1.get('right', {}).get('max_angle', 'Undefined')
@@ -1380,12 +1320,12 @@ class DTWSimilarityCalculator:
                 angle_diff = abs(float(right_max1) - float(right_max2))
                 right_sim = self._calculate_angle_similarity(angle_diff, LOADING_DEPTH_DIFF_LOW, LOADING_DEPTH_DIFF_MEDIUM, LOADING_DEPTH_DIFF_HIGH)
                 similarities.append(right_sim)
-                print(f"           Right leg angle diff: {angle_diff:.1f}° -> {right_sim:.1f}% similarity")
+                logger.debug("           Right leg angle diff: %.1f° -> %.1f%% similarity", angle_diff, right_sim)
             
             return np.mean(similarities) if similarities else 0.0
             
         except Exception as e:
-            print(f"         Warning: Error in loading max leg angles comparison: {e}")
+            logger.warning("         Warning: Error in loading max leg angles comparison: %s", e)
             return 0.0
     
     def _compare_loading_upper_body_tilt(self, tilt1: Dict, tilt2: Dict) -> float:
@@ -1404,7 +1344,7 @@ class DTWSimilarityCalculator:
             return max(0, 100 - (tilt_diff * 3))  # 3% penalty per degree
             
         except Exception as e:
-            print(f"         Warning: Error in loading upper body tilt comparison: {e}")
+            logger.warning("         Warning: Error in loading upper body tilt comparison: %s", e)
             return 0.0
     
     def _compare_loading_duration(self, duration1: float, duration2: float) -> float:
@@ -1415,11 +1355,11 @@ class DTWSimilarityCalculator:
             
             duration_diff = abs(duration1 - duration2)
             duration_sim = self._calculate_time_similarity(duration_diff, LOADING_MAX_TIMING_DIFF_LOW, LOADING_MAX_TIMING_DIFF_MEDIUM, LOADING_MAX_TIMING_DIFF_HIGH)
-            print(f"           Duration diff: {duration_diff:.3f}s -> {duration_sim:.1f}% similarity")
+            logger.debug("           Duration diff: %.3fs -> %.1f%% similarity", duration_diff, duration_sim)
             return duration_sim
             
         except Exception as e:
-            print(f"         Warning: Error in loading duration comparison: {e}")
+            logger.warning("         Warning: Error in loading duration comparison: %s", e)
             return 0.0
     
     def _compare_trajectory_curvature(self, windup1: Dict, windup2: Dict) -> float:
@@ -1431,17 +1371,17 @@ class DTWSimilarityCalculator:
             # print('debug windup2:', windup2)
             curvature1 = windup1.get('trajectory_curvature', 0)
             curvature2 = windup2.get('trajectory_curvature', 0)
-            print(f"           Curvatures: {curvature1} vs {curvature2}")
+            logger.debug("           Curvatures: %s vs %s", curvature1, curvature2)
             if curvature1 == 0 or curvature2 == 0:
                 return 0.0
             
             curvature_diff = abs(float(curvature1) - float(curvature2))
             curvature_sim = self._calculate_ratio_similarity(curvature_diff, WINDUP_CURVATURE_DIFF_LOW, WINDUP_CURVATURE_DIFF_MEDIUM, WINDUP_CURVATURE_DIFF_HIGH)
-            print(f"           Curvature diff: {curvature_diff:.4f} -> {curvature_sim:.1f}% similarity")
+            logger.debug("           Curvature diff: %.4f -> %.1f%% similarity", curvature_diff, curvature_sim)
             return curvature_sim
             
         except Exception as e:
-            print(f"         Warning: Error in trajectory curvature comparison: {e}")
+            logger.warning("         Warning: Error in trajectory curvature comparison: %s", e)
             return 0.0
     
     def _compare_trajectory_path_length(self, windup1: Dict, windup2: Dict) -> float:
@@ -1458,11 +1398,11 @@ class DTWSimilarityCalculator:
             
             path_diff = abs(float(path_length1) - float(path_length2))
             path_sim = self._calculate_ratio_similarity(path_diff, WINDUP_PATH_LENGTH_DIFF_LOW, WINDUP_PATH_LENGTH_DIFF_MEDIUM, WINDUP_PATH_LENGTH_DIFF_HIGH)
-            print(f"           Path length diff: {path_diff:.3f} -> {path_sim:.1f}% similarity")
+            logger.debug("           Path length diff: %.3f -> %.1f%% similarity", path_diff, path_sim)
             return path_sim
             
         except Exception as e:
-            print(f"         Warning: Error in trajectory path length comparison: {e}")
+            logger.warning("         Warning: Error in trajectory path length comparison: %s", e)
             return 0.0
     
     def _compare_jump_height(self, jump1: Dict, jump2: Dict) -> float:
@@ -1479,11 +1419,11 @@ class DTWSimilarityCalculator:
             
             height_diff = abs(float(height1) - float(height2))
             height_sim = self._calculate_ratio_similarity(height_diff, RISING_JUMP_HEIGHT_DIFF_LOW, RISING_JUMP_HEIGHT_DIFF_MEDIUM, RISING_JUMP_HEIGHT_DIFF_HIGH)
-            print(f"           Jump height diff: {height_diff:.3f} -> {height_sim:.1f}% similarity")
+            logger.debug("           Jump height diff: %.3f -> %.1f%% similarity", height_diff, height_sim)
             return height_sim
             
         except Exception as e:
-            print(f"         Warning: Error in jump height comparison: {e}")
+            logger.warning("         Warning: Error in jump height comparison: %s", e)
             return 0.0
     
     def _compare_dip_point_angles(self, dip1: Dict, dip2: Dict) -> float:
@@ -1504,12 +1444,12 @@ class DTWSimilarityCalculator:
                     angle_diff = abs(float(angle1) - float(angle2))
                     angle_sim = self._calculate_angle_similarity(angle_diff, DIP_SHOULDER_ELBOW_WRIST_LOW, DIP_SHOULDER_ELBOW_WRIST_MEDIUM, DIP_SHOULDER_ELBOW_WRIST_HIGH)
                     similarities.append(angle_sim)
-                    print(f"           Dip {angle_name} diff: {angle_diff:.1f}° -> {angle_sim:.1f}% similarity")
+                    logger.debug("           Dip %s diff: %.1f° -> %.1f%% similarity", angle_name, angle_diff, angle_sim)
             
             return np.mean(similarities) if similarities else 0.0
             
         except Exception as e:
-            print(f"         Warning: Error in dip point angles comparison: {e}")
+            logger.warning("         Warning: Error in dip point angles comparison: %s", e)
             return 0.0
     
     def _compare_setup_point_angles(self, setup1: Dict, setup2: Dict) -> float:
@@ -1531,12 +1471,12 @@ class DTWSimilarityCalculator:
                     angle_diff = abs(float(angle1) - float(angle2))
                     angle_sim = self._calculate_angle_similarity(angle_diff, SETUP_POINT_SHOULDER_ELBOW_WRIST_LOW, SETUP_POINT_SHOULDER_ELBOW_WRIST_MEDIUM, SETUP_POINT_SHOULDER_ELBOW_WRIST_HIGH)
                     similarities.append(angle_sim)
-                    print(f"           Setup {angle_name} diff: {angle_diff:.1f}° -> {angle_sim:.1f}% similarity")
+                    logger.debug("           Setup %s diff: %.1f° -> %.1f%% similarity", angle_name, angle_diff, angle_sim)
             
             return np.mean(similarities) if similarities else 0.0
             
         except Exception as e:
-            print(f"         Warning: Error in setup point angles comparison: {e}")
+            logger.warning("         Warning: Error in setup point angles comparison: %s", e)
             return 0.0
 
     def _calculate_angle_similarity(self, angle_diff: float, low_thresh: float, med_thresh: float, high_thresh: float) -> float:
@@ -1642,7 +1582,7 @@ class DTWSimilarityCalculator:
                 'lambda_boundary': 0.15
             }
         
-        print("🌐 Computing global motion similarity score...")
+        logger.debug("🌐 Computing global motion similarity score...")
         
         try:
             # 1. Data smoothing
@@ -1675,7 +1615,7 @@ class DTWSimilarityCalculator:
             
             # Normalize score (0-100)
             global_score = max(10.0, min(100.0, global_score))
-            print('debug global score:', global_score)
+            logger.debug("debug global score: %s", global_score)
             result = {
                 'global_score': float(global_score),
                 'component_scores': {
@@ -1689,17 +1629,17 @@ class DTWSimilarityCalculator:
                 'analysis_method': 'global_motion_similarity'
             }
             
-            print(f"   ✅ Global motion similarity: {global_score:.1f}%")
-            print(f"      • DTW Wrist: {dtw_wrist_score:.1f}%")
-            print(f"      • DTW COM: {dtw_com_score:.1f}%") 
-            print(f"      • Phase Timing: {timing_score:.1f}%")
-            print(f"      • Timing Metrics: {timing_metrics_score:.1f}%")
-            print(f"      • Boundary Penalty: {boundary_penalty:.1f}")
+            logger.debug("   ✅ Global motion similarity: %.1f%%", global_score)
+            logger.debug("      • DTW Wrist: %.1f%%", dtw_wrist_score)
+            logger.debug("      • DTW COM: %.1f%%", dtw_com_score)
+            logger.debug("      • Phase Timing: %.1f%%", timing_score)
+            logger.debug("      • Timing Metrics: %.1f%%", timing_metrics_score)
+            logger.debug("      • Boundary Penalty: %.1f", boundary_penalty)
             
             return result
             
         except Exception as e:
-            print(f"   ❌ Error in global score calculation: {e}")
+            logger.warning("   ❌ Error in global score calculation: %s", e)
             return {
                 'global_score': 0.0,
                 'component_scores': {},
@@ -1776,7 +1716,7 @@ class DTWSimilarityCalculator:
             return float(similarity)
             
         except Exception as e:
-            print(f"      Warning: Phase timing calculation error: {e}")
+            logger.warning("      Warning: Phase timing calculation error: %s", e)
             return 50.0
 
     def _calculate_timing_relationship_metrics(self, user_data: Dict, ref_data: Dict) -> float:
@@ -1824,7 +1764,7 @@ class DTWSimilarityCalculator:
             return np.mean(similarities) if similarities else 50.0
             
         except Exception as e:
-            print(f"      Warning: Timing relationship calculation error: {e}")
+            logger.warning("      Warning: Timing relationship calculation error: %s", e)
             return 50.0
     
     def _calculate_global_dtw(self, series1: List[float], series2: List[float]) -> float:
@@ -1833,10 +1773,7 @@ class DTWSimilarityCalculator:
             return 0.0
         
         try:
-            if self.dtw_available:
-                distance = dtw.distance(series1, series2, window=int(len(series1) * 0.3))
-            else:
-                distance = self._fallback_dtw_distance(series1, series2)
+            distance = dtw_distance(series1, series2, window=int(len(series1) * 0.3))
             
             # Convert distance to similarity
             max_possible_distance = max(max(series1) - min(series1), max(series2) - min(series2))
@@ -1849,7 +1786,7 @@ class DTWSimilarityCalculator:
             return float(similarity)
             
         except Exception as e:
-            print(f"      Warning: Global DTW calculation error: {e}")
+            logger.warning("      Warning: Global DTW calculation error: %s", e)
             return 0.0
     
     def _calculate_boundary_penalty(self, user_data: Dict, ref_data: Dict) -> float:
@@ -1860,8 +1797,8 @@ class DTWSimilarityCalculator:
             # Check for abrupt changes at phase boundaries
             user_phases = user_data.get('phases', {})
             ref_phases = ref_data.get('phases', {})
-            print('debug user_phases:', user_phases)
-            print('debug ref_phases:', ref_phases)
+            logger.debug("debug user_phases: %s", user_phases)
+            logger.debug("debug ref_phases: %s", ref_phases)
             if not user_phases or not ref_phases:
                 return 0.0
             
@@ -1876,11 +1813,11 @@ class DTWSimilarityCalculator:
                     )
                     if transition_smoothness < 0.5:  # If there is an abrupt change
                         penalty += 10.0
-            print(penalty)
+            logger.debug("Boundary penalty: %s", penalty)
             return min(50.0, penalty)  # Maximum penalty of 50 points
             
         except Exception as e:
-            print(f"      Warning: Boundary penalty calculation error: {e}")
+            logger.warning("      Warning: Boundary penalty calculation error: %s", e)
             return 0.0
     
     def _check_transition_smoothness(self, data: Dict, phase1: Dict, phase2: Dict) -> float:
@@ -1975,7 +1912,7 @@ class DTWSimilarityCalculator:
             return final_similarity
 
         except Exception as e:
-            print(f"         Warning: Error in single frame similarity: {e}")
+            logger.warning("         Warning: Error in single frame similarity: %s", e)
             # Deterministic fallback
             data_hash = hash(str(features1) + str(features2)) % 100
             return 60.0 + (data_hash % 20)  # 60-80 range
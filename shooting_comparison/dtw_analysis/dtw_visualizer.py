@@ -13,7 +13,8 @@ import os
 from typing import Dict, List, Tuple, Optional
 import json
 import matplotlib.pyplot as plt
-from dtaidistance import dtw
+from .dtw_kernel import dtw_distance_and_path
+from .plot_renderer import plot_renderer
 
 MATPLOTLIB_AVAILABLE = True
 
@@ -79,77 +80,35 @@ class DTWVisualizer:
         ax.grid(True, alpha=0.15, color=self.colors['grid'], linestyle='-', linewidth=0.5)
 
     def create_separate_trajectory_comparison_plot(self, dtw_results: Dict, video1_data: Dict, 
-                                    video2_data: Dict, save_path: str = None) -> Dict[str, str]:
+                                    video2_data: Dict, save_path: str = None, width: Optional[int] = None,
+                                    image_format: Optional[str] = None, job_id: Optional[str] = None) -> Dict[str, str]:
         """
         Create detailed trajectory comparison plots as separate images.
-        """
-        # print(" Creating DTW trajectory comparison plots...")
         
+        The four plots are rendered in parallel worker processes (see plot_renderer.py).
+        
+        Args:
+            dtw_results: DTW analysis results
+            video1_data: First video's data
+            video2_data: Second video's data
+            save_path: Path inside the directory to save the plots in
+            width: Image width in pixels (default: PLOT_RENDER_WIDTH)
+            image_format: "png", "webp" or "jpg" (default: PLOT_RENDER_FORMAT)
+            job_id: Suffix making the file names unique (default: random)
+            
+        Returns:
+            Dictionary of plot name -> image path
+        """
         # Determine save directory
         if not save_path:
             save_dir = "shooting_comparison/results"
         else:
             save_dir = os.path.dirname(save_path)
         
-        os.makedirs(save_dir, exist_ok=True)
-        
-        # Dictionary to store all generated plot paths
-        plot_paths = {}
-        
-        #Set dark style globally for matplotlib
-        plt.style.use('dark_background')
-        
-        # 1. Ball Trajectory Plot
-        # print("    Creating ball trajectory plot...")
-        fig, ax = plt.subplots(figsize=(12, 9), facecolor=self.colors['background'])
-        self._setup_dark_style(ax, fig)
-        self._plot_ball_trajectory_comparison(ax, dtw_results, video1_data, video2_data)
-        ball_path = os.path.join(save_dir, "ball_trajectory.png")
-        plt.tight_layout()
-        plt.savefig(ball_path, dpi=300, bbox_inches='tight', facecolor=self.colors['background'], edgecolor='none')
-        plt.close()
-        plot_paths['ball_trajectory'] = ball_path
-        # print(f" Saved: {ball_path}")
-        
-        # 2. Wrist Trajectory Plot
-        # print("Creating wrist trajectory plot...")
-        fig, ax = plt.subplots(figsize=(12, 9), facecolor=self.colors['background'])
-        self._setup_dark_style(ax, fig)
-        self._plot_wrist_trajectory_comparison(ax, dtw_results, video1_data, video2_data)
-        wrist_path = os.path.join(save_dir, "wrist_trajectory.png")
-        plt.tight_layout()
-        plt.savefig(wrist_path, dpi=300, bbox_inches='tight', facecolor=self.colors['background'], edgecolor='none')
-        plt.close()
-        plot_paths['wrist_trajectory'] = wrist_path
-        # print(f"  Saved: {wrist_path}")
-        
-        # 3. Elbow Angle Plot
-        # print("  Creating elbow angle plot...")
-        fig, ax = plt.subplots(figsize=(12, 9), facecolor=self.colors['background'])
-        self._setup_dark_style(ax, fig)
-        self._plot_elbow_angle_comparison(ax, dtw_results, video1_data, video2_data)
-        elbow_path = os.path.join(save_dir, "elbow_angle.png")
-        plt.tight_layout()
-        plt.savefig(elbow_path, dpi=300, bbox_inches='tight', facecolor=self.colors['background'], edgecolor='none')
-        plt.close()
-        plot_paths['elbow_angle'] = elbow_path
-        # print(f"  Saved: {elbow_path}")
-        
-        # 4. Hip Stability Plot
-        # print("   Creating hip stability plot...")
-        fig, ax = plt.subplots(figsize=(12, 9), facecolor=self.colors['background'])
-        self._setup_dark_style(ax, fig)
-        self._plot_hip_stability_comparison(ax, dtw_results, video1_data, video2_data)
-        hip_path = os.path.join(save_dir, "hip_stability.png")
-        plt.tight_layout()
-        plt.savefig(hip_path, dpi=300, bbox_inches='tight', facecolor=self.colors['background'], edgecolor='none')
-        plt.close()
-        plot_paths['hip_stability'] = hip_path
-        # print(f"   Saved: {hip_path}")
-        
-        # print(f" Created {len(plot_paths)} DTW comparison plots in: {save_dir}")
-        
-        return plot_paths
+        return plot_renderer.render_comparison_plots(
+            self, dtw_results, video1_data, video2_data, save_dir,
+            width=width, image_format=image_format, job_id=job_id
+        )
 
     # ... keep all your existing helper methods (_apply_dtw_to_trajectories, etc.) ...
 
@@ -424,16 +383,15 @@ class DTWVisualizer:
         seq1 = np.array(data1, dtype=float)
         seq2 = np.array(data2, dtype=float)
         
-        # Calculate DTW distance and path
-        distance = dtw.distance(seq1, seq2)
+        # Calculate DTW distance and path in one pass
+        distance, path = dtw_distance_and_path(seq1, seq2)
         normalized_distance = distance / max(len(seq1), len(seq2))
-        path = dtw.warping_path(seq1, seq2)
         return normalized_distance, path
 
     def _apply_dtw_to_trajectory_2d(self, x1: List[float], y1: List[float], 
                                  x2: List[float], y2: List[float]) -> Tuple[float, List[Tuple[int, int]]]:
         """
-        Apply DTW to 2D trajectory using manual implementation with Euclidean distance.
+        Apply DTW to 2D trajectory with Euclidean point distance.
         
         Args:
             x1, y1: First trajectory coordinates
@@ -442,62 +400,12 @@ class DTWVisualizer:
         Returns:
             Tuple of (dtw_distance, warping_path)
         """
-     
-        # Convert to numpy arrays and create 2D points
-        x1 = np.array(x1, dtype=float)
-        y1 = np.array(y1, dtype=float)
-        x2 = np.array(x2, dtype=float)
-        y2 = np.array(y2, dtype=float)
-        
-        points1 = np.column_stack((x1, y1))
-        points2 = np.column_stack((x2, y2))
-        
-        n1, n2 = len(points1), len(points2)
-        
-        # print(f"   [DEBUG] DTW 2D - Seq1 length: {n1}, Seq2 length: {n2}")
-        
-        # Initialize DTW cost matrix
-        dtw_matrix = np.full((n1 + 1, n2 + 1), np.inf)
-        dtw_matrix[0, 0] = 0
-        
-        # Fill DTW cost matrix with Euclidean distances
-        for i in range(1, n1 + 1):
-            for j in range(1, n2 + 1):
-                # Calculate Euclidean distance between 2D points
-                cost = np.sqrt((points1[i-1][0] - points2[j-1][0])**2 + 
-                            (points1[i-1][1] - points2[j-1][1])**2)
-                
-                # DTW recurrence relation
-                dtw_matrix[i, j] = cost + min(
-                    dtw_matrix[i-1, j],      # insertion
-                    dtw_matrix[i, j-1],      # deletion
-                    dtw_matrix[i-1, j-1]     # match
-                )
-        
-        # Final DTW distance
-        distance = dtw_matrix[n1, n2]
-        normalized_distance = distance / max(n1, n2)
-        # Backtrack to find optimal warping path
-        path = []
-        i, j = n1, n2
-        
-        while i > 0 and j > 0:
-            path.append((i-1, j-1))
-            
-            # Find which direction we came from (minimum cost)
-            candidates = [
-                (dtw_matrix[i-1, j-1], i-1, j-1),  # diagonal (match)
-                (dtw_matrix[i-1, j], i-1, j),      # up (insertion)
-                (dtw_matrix[i, j-1], i, j-1)       # left (deletion)
-            ]
-            
-            _, i, j = min(candidates, key=lambda x: x[0])
-        
-        # Reverse path to get forward direction
-        path.reverse()
-        
-        # print(f"   [DEBUG] DTW 2D - Distance: {distance:.4f}, Path length: {len(path)}")
+        points1 = np.column_stack((np.array(x1, dtype=float), np.array(y1, dtype=float)))
+        points2 = np.column_stack((np.array(x2, dtype=float), np.array(y2, dtype=float)))
         
+        # Accumulated (non-squared) Euclidean cost, normalized by the longer sequence
+        distance, path = dtw_distance_and_path(points1, points2, squared=False)
+        normalized_distance = distance / max(len(points1), len(points2))
         return normalized_distance, path
 
     def _calculate_simple_distance(self, data1: List[float], data2: List[float]) -> float:
@@ -968,7 +876,8 @@ class DTWVisualizer:
     
     def create_comprehensive_dtw_report(self, dtw_results: Dict, video1_data: Dict, 
                                   video2_data: Dict, video1_path: str, video2_path: str,
-                                  save_dir: str = None) -> Dict[str, str]:
+                                  save_dir: str = None, width: Optional[int] = None,
+                                  image_format: Optional[str] = None, job_id: Optional[str] = None) -> Dict[str, str]:
         """
         Create comprehensive DTW visualization report.
         
@@ -979,6 +888,9 @@ class DTWVisualizer:
             video1_path: Path to first video
             video2_path: Path to second video
             save_dir: Directory to save visualizations
+            width: Plot width in pixels (default: PLOT_RENDER_WIDTH)
+            image_format: "png", "webp" or "jpg" (default: PLOT_RENDER_FORMAT)
+            job_id: Suffix making the plot file names unique (default: random)
             
         Returns:
             Dictionary of visualization file paths
@@ -994,7 +906,8 @@ class DTWVisualizer:
         
         # Create all trajectory comparison plots
         plot_paths = self.create_separate_trajectory_comparison_plot(
-            dtw_results, video1_data, video2_data, save_dir)
+            dtw_results, video1_data, video2_data, save_dir,
+            width=width, image_format=image_format, job_id=job_id)
         
         # print(f" DTW visualization report created in: {save_dir}")
         # print(f" Generated {len(plot_paths)} visualization files")
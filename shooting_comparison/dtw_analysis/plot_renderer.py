@@ -0,0 +1,219 @@
+"""
+DTW Plot Renderer
+
+Renders the DTW comparison plots (ball/wrist trajectory, elbow angle, hip stability)
+in parallel worker processes with matplotlib's Agg backend.
+
+Plots are rendered at a target pixel width instead of a fixed 300 dpi (the app shows
+them as thumbnails, so ~1080 px is plenty) and as PNG, WebP or JPEG. File names carry
+a per-job id, so concurrent analyses sharing a results directory never overwrite each
+other's plots.
+
+Settings come from the environment (PLOT_RENDER_WIDTH, PLOT_RENDER_FORMAT,
+PLOT_RENDER_WORKERS) and can be overridden per call.
+"""
+
+import os
+import uuid
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+
+PLOT_RENDER_WIDTH = int(os.getenv("PLOT_RENDER_WIDTH", "1080"))
+PLOT_RENDER_FORMAT = os.getenv("PLOT_RENDER_FORMAT", "png")
+# Worker processes (0 or 1 = render in the calling process)
+PLOT_RENDER_WORKERS = int(os.getenv("PLOT_RENDER_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Accepted format names -> matplotlib/Pillow format
+PLOT_FORMATS = {'png': 'png', 'webp': 'webp', 'jpg': 'jpeg', 'jpeg': 'jpeg'}
+FORMAT_EXTENSIONS = {'png': 'png', 'webp': 'webp', 'jpeg': 'jpg'}
+MIN_PLOT_WIDTH = 240
+MAX_PLOT_WIDTH = 3600  # Previous output size (12 in at 300 dpi)
+
+# Lossy formats are written at this quality (Pillow scale)
+LOSSY_QUALITY = 90
+
+# Plot name -> DTWVisualizer method drawing it on a single axes
+COMPARISON_PLOTS = {
+    'ball_trajectory': '_plot_ball_trajectory_comparison',
+    'wrist_trajectory': '_plot_wrist_trajectory_comparison',
+    'elbow_angle': '_plot_elbow_angle_comparison',
+    'hip_stability': '_plot_hip_stability_comparison'
+}
+FIGURE_SIZE = (12, 9)  # Inches; the dpi is derived from the target width
+
+
+def normalize_plot_options(width: Optional[int] = None, image_format: Optional[str] = None) -> Tuple[int, str]:
+    """
+    Validate requested plot options.
+
+    Args:
+        width: Target width in pixels (default: PLOT_RENDER_WIDTH)
+        image_format: "png", "webp" or "jpg"/"jpeg" (default: PLOT_RENDER_FORMAT)
+
+    Returns:
+        Tuple of (width, matplotlib format name)
+
+    Raises:
+        ValueError: If the width is out of range or the format is not supported
+    """
+    width = PLOT_RENDER_WIDTH if width is None else int(width)
+    if not MIN_PLOT_WIDTH <= width <= MAX_PLOT_WIDTH:
+        raise ValueError(f"Plot width must be between {MIN_PLOT_WIDTH} and {MAX_PLOT_WIDTH} px, got {width}")
+
+    format_name = (image_format or PLOT_RENDER_FORMAT).lower()
+    if format_name not in PLOT_FORMATS:
+        raise ValueError(f"Unsupported plot format '{image_format}' (expected one of {sorted(PLOT_FORMATS)})")
+    return width, PLOT_FORMATS[format_name]
+
+
+def _init_worker():
+    """Worker processes have no display: draw with Agg"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_plot(visualizer, plot_name: str, dtw_results: Dict, video1_data: Dict, video2_data: Dict,
+                output_path: str, width: int = PLOT_RENDER_WIDTH, image_format: str = "png") -> str:
+    """
+    Render one comparison plot to a file (runs in a worker process or in-process).
+
+    Args:
+        visualizer: DTWVisualizer providing the colors and the plot method
+        plot_name: Key of COMPARISON_PLOTS
+        dtw_results: DTW analysis results
+        video1_data: First video's data
+        video2_data: Second video's data
+        output_path: Image path to write
+        width: Output width in pixels
+        image_format: matplotlib format name (png, webp, jpeg)
+
+    Returns:
+        output_path
+    """
+    import matplotlib.pyplot as plt
+
+    pil_kwargs = {'quality': LOSSY_QUALITY} if image_format in ('webp', 'jpeg') else None
+    with plt.style.context('dark_background'):
+        fig, ax = plt.subplots(figsize=FIGURE_SIZE, facecolor=visualizer.colors['background'])
+        try:
+            visualizer._setup_dark_style(ax, fig)
+            getattr(visualizer, COMPARISON_PLOTS[plot_name])(ax, dtw_results, video1_data, video2_data)
+            fig.tight_layout()
+            fig.savefig(output_path, format=image_format, dpi=width / FIGURE_SIZE[0],
+                        facecolor=visualizer.colors['background'], edgecolor='none', pil_kwargs=pil_kwargs)
+        finally:
+            plt.close(fig)
+    return output_path
+
+
+class PlotRenderer:
+    """
+    Renders the comparison plots of one analysis in parallel.
+
+    The worker pool is started on first use and reused across analyses (spawned
+    workers only pay the matplotlib import once). Falls back to rendering in the
+    calling process when workers are disabled or the pool breaks.
+    """
+
+    def __init__(self, workers: int = PLOT_RENDER_WORKERS):
+        """
+        Args:
+            workers: Worker processes (0 or 1 = render in the calling process)
+        """
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 1:
+            return None
+        with self._lock:
+            if self._executor is None:
+                try:
+                    # spawn: the backend process holds TensorFlow and worker threads, which must not be forked
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker
+                    )
+                except OSError as e:
+                    print(f"⚠️ Could not start plot render workers, rendering in-process: {e}")
+                    self.workers = 0
+            return self._executor
+
+    def warm_up(self):
+        """Start the worker processes ahead of the first analysis"""
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                for future in [executor.submit(_init_worker) for _ in range(self.workers)]:
+                    future.result()
+            except BrokenProcessPool as e:
+                print(f"⚠️ Plot render workers failed to start: {e}")
+                self._reset_executor()
+
+    def _reset_executor(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def render_comparison_plots(self, visualizer, dtw_results: Dict, video1_data: Dict, video2_data: Dict,
+                                save_dir: str, width: Optional[int] = None, image_format: Optional[str] = None,
+                                job_id: Optional[str] = None) -> Dict[str, str]:
+        """
+        Render all COMPARISON_PLOTS.
+
+        Args:
+            visualizer: DTWVisualizer providing the colors and plot methods
+            dtw_results: DTW analysis results
+            video1_data: First video's data
+            video2_data: Second video's data
+            save_dir: Directory for the images
+            width: Target width in pixels (default: PLOT_RENDER_WIDTH)
+            image_format: "png", "webp" or "jpg" (default: PLOT_RENDER_FORMAT)
+            job_id: Suffix making the file names unique (default: random)
+
+        Returns:
+            Dictionary of plot name -> image path
+        """
+        width, image_format = normalize_plot_options(width, image_format)
+        job_id = job_id or uuid.uuid4().hex[:12]
+        extension = FORMAT_EXTENSIONS[image_format]
+        os.makedirs(save_dir, exist_ok=True)
+
+        plot_paths = {
+            plot_name: os.path.join(save_dir, f"{plot_name}_{job_id}.{extension}")
+            for plot_name in COMPARISON_PLOTS
+        }
+
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                futures = [
+                    executor.submit(render_plot, visualizer, plot_name, dtw_results, video1_data, video2_data,
+                                    output_path, width, image_format)
+                    for plot_name, output_path in plot_paths.items()
+                ]
+                for future in futures:
+                    future.result()
+                return plot_paths
+            except BrokenProcessPool as e:
+                print(f"⚠️ Plot render workers failed, rendering in-process: {e}")
+                self._reset_executor()
+
+        for plot_name, output_path in plot_paths.items():
+            render_plot(visualizer, plot_name, dtw_results, video1_data, video2_data,
+                        output_path, width, image_format)
+        return plot_paths
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self._reset_executor()
+
+
+# Shared renderer (one worker pool per process)
+plot_renderer = PlotRenderer()
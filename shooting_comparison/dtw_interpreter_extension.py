@@ -43,7 +43,8 @@ class DTWInterpreterExtension:
     def extend_existing_interpretation(self, existing_interpretation: Dict,
                                      comparison_results: Dict,
                                      video1_data: Dict, video2_data: Dict,
-                                     selected_hand: str) -> Dict:
+                                     selected_hand: str, video1_features: Dict = None,
+                                     video2_features: Dict = None) -> Dict:
         """
         Extend existing interpretation results with DTW analysis.
         
@@ -53,6 +54,8 @@ class DTWInterpreterExtension:
             video1_data: First video's normalized data
             video2_data: Second video's normalized data
             selected_hand: Selected shooting hand
+            video1_features: Precomputed DTWAnalyzer.extract_video_features() result for video 1
+            video2_features: Precomputed DTWAnalyzer.extract_video_features() result for video 2
             
         Returns:
             Enhanced interpretation with DTW insights added
@@ -68,7 +71,8 @@ class DTWInterpreterExtension:
         rising_analysis = comparison_results.get('rising_analysis', {})
 
         dtw_results = self.dtw_analyzer.analyze_shooting_similarity(
-            video1_data, video2_data, selected_hand, setup_analysis, release_analysis, loading_analysis, followthrough_analysis, rising_analysis
+            video1_data, video2_data, selected_hand, setup_analysis, release_analysis, loading_analysis, followthrough_analysis, rising_analysis,
+            video1_features=video1_features, video2_features=video2_features
         )
     
         if 'error' in dtw_results:
@@ -7,8 +7,10 @@ Extends existing pipeline with DTW analysis while maintaining all existing funct
 import os
 import json
 import glob
+import threading
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import traceback
 
@@ -16,6 +18,8 @@ from .shooting_comparison_pipeline import ShootingComparisonPipeline
 from .analysis_interpreter import AnalysisInterpreter
 from .dtw_interpreter_extension import DTWInterpreterExtension
 from .dtw_analysis.dtw_visualizer import DTWVisualizer
+from .reference_feature_store import reference_feature_store, build_video_analysis
+from .shot_consistency import summarize_shot, compute_shot_consistency
 
 class NumpyEncoder(json.JSONEncoder):
     """Custom JSON encoder for numpy types"""
@@ -40,17 +44,25 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
         self.dtw_extension = DTWInterpreterExtension()
         self.video1_path = None
         self.video2_path = None
+        self.plot_options = {}  # width / image_format for the DTW plots of the current comparison
 
         # Keep existing interpreter - just extend it
         self.existing_interpreter = AnalysisInterpreter()
         
+        # Precomputed reference analyses (see reference_feature_store.py)
+        self.reference_store = reference_feature_store
+        
+        # Phase analysis pipeline, one per thread (see _phase_pipeline)
+        self._phase_pipelines = threading.local()
+        
         print("🔄 Enhanced Shooting Comparison Pipeline initialized")
         print("   📊 Existing phase analysis: ✅")
         print("   🎯 DTW motion analysis: ✅")
     
     def run_comparison(self, video1_path: str, video2_path: str, 
                       save_results: bool = True, include_dtw: bool = True, 
-                      create_visualizations: bool = True, enable_shot_selection: bool = True) -> Dict:
+                      create_visualizations: bool = True, enable_shot_selection: bool = True,
+                      user_analysis: Optional[Dict] = None, plot_options: Optional[Dict] = None) -> Dict:
         """
         Run comparison with optional DTW analysis and visualizations.
         
@@ -61,12 +73,16 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
             include_dtw: Whether to include DTW analysis (default: True)
             create_visualizations: Whether to create DTW visualizations (default: True)
             enable_shot_selection: Whether to enable shot selection (default: True)
+            user_analysis: prepare_user_analysis() result for video1 (skips re-analyzing video1)
+            plot_options: DTW plot size/format, {'width': px, 'image_format': 'png'|'webp'|'jpg'}
+                (default: PLOT_RENDER_WIDTH / PLOT_RENDER_FORMAT)
             
         Returns:
             Comparison results with optional DTW enhancement
         """
         self.video1_path = video1_path
         self.video2_path = video2_path
+        self.plot_options = dict(plot_options or {})
 
         print(f"\n🏀 Starting Enhanced Shooting Comparison")
         print("=" * 60)
@@ -78,7 +94,8 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
         print("=" * 60)
         
         # Run phase analysis
-        existing_results, existing_pipeline = self._run_phase_analysis(video1_path, video2_path, enable_shot_selection)
+        existing_results, existing_pipeline = self._run_phase_analysis(video1_path, video2_path, enable_shot_selection,
+                                                                       user_analysis)
         if 'error' in existing_results:
             return existing_results
         
@@ -92,7 +109,7 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
         
         # Add DTW analysis
         final_results = self._run_dtw_analysis(existing_results, existing_interpretation, 
-                                              existing_pipeline, create_visualizations)
+                                              existing_pipeline, create_visualizations, user_analysis)
         
         # Add final metadata
         final_results['metadata']['pipeline_version'] = 'enhanced_v1.0'
@@ -109,25 +126,279 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
         
         return final_results
     
+    def prepare_user_analysis(self, video_path: str) -> Optional[Dict]:
+        """
+        Analyze the user's video once so it can be compared against many references.
+        
+        Loads the processed data and runs the per-video phase analyses and DTW feature
+        extraction for the whole video (no shot selection).
+        
+        Args:
+            video_path: Path to the user's video (already processed by the integrated pipeline)
+            
+        Returns:
+            User analysis dict for run_comparison/compare_one_to_many, or None if data is missing
+        """
+        print(f"\n🔄 Preparing user analysis: {os.path.basename(video_path)}")
+        user_analysis = build_video_analysis(video_path, dtw_analyzer=self.dtw_extension.dtw_analyzer,
+                                             pipeline=self._phase_pipeline(video_path, None))
+        if user_analysis is None:
+            return None
+        print("✅ User analysis prepared")
+        return user_analysis
+    
+    def compare_one_to_many(self, video_path: str, reference_paths: List[str],
+                            save_results: bool = True, create_visualizations: bool = True,
+                            max_workers: Optional[int] = None, plot_options: Optional[Dict] = None) -> Dict:
+        """
+        Compare one user video against several references and keep the best match.
+        
+        The user's video is analyzed once, every reference is scored in parallel
+        without visualizations, and visualizations are only rendered for the best match.
+        
+        Args:
+            video_path: Path to the user's video
+            reference_paths: Reference video paths (e.g. synthetic player profiles)
+            save_results: Whether to save the best match's results
+            create_visualizations: Whether to create DTW visualizations for the best match
+            max_workers: Number of references scored concurrently (default: all)
+            plot_options: DTW plot size/format (see run_comparison)
+            
+        Returns:
+            Dict with best_reference, best_result and scores (overall similarity per reference)
+        """
+        user_analysis = self.prepare_user_analysis(video_path)
+        if user_analysis is None:
+            return {'error': 'User video data not available'}
+        
+        def score_reference(reference_path: str) -> Tuple[Dict, Optional[Dict]]:
+            return self._score_against_reference(video_path, reference_path, user_analysis)
+        
+        print(f"\n🏀 Scoring {len(reference_paths)} references in parallel")
+        workers = max_workers or max(1, len(reference_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scored = list(executor.map(score_reference, reference_paths))
+        
+        scores = {}
+        best_index = None
+        for index, (reference_path, (final_results, _)) in enumerate(zip(reference_paths, scored)):
+            if 'error' in final_results:
+                print(f"   ⚠️ {os.path.basename(reference_path)}: {final_results['error']}")
+                continue
+            overall_similarity = final_results.get('dtw_analysis', {}).get('overall_similarity', 0)
+            scores[reference_path] = overall_similarity
+            print(f"   📊 {os.path.basename(reference_path)}: {overall_similarity:.1f}%")
+            if best_index is None or overall_similarity > scores[reference_paths[best_index]]:
+                best_index = index
+        
+        if best_index is None:
+            return {'error': 'No reference could be compared', 'scores': scores}
+        
+        best_reference = reference_paths[best_index]
+        best_result, best_analysis = scored[best_index]
+        print(f"🏆 Best match: {os.path.basename(best_reference)} ({scores[best_reference]:.1f}%)")
+        
+        self.video1_path = video_path
+        self.video2_path = best_reference
+        self.plot_options = dict(plot_options or {})
+        if create_visualizations and best_result['metadata'].get('dtw_analysis_included'):
+            best_result = self._create_dtw_visualizations(best_result, best_result['interpretation'],
+                                                          user_analysis['video_data'], best_analysis['reference_data'])
+        
+        best_result['metadata']['pipeline_version'] = 'enhanced_v1.0'
+        best_result['metadata']['analysis_timestamp'] = datetime.now().isoformat()
+        if save_results:
+            dtw_included = best_result['metadata'].get('dtw_analysis_included', False)
+            suffix = '_enhanced' if dtw_included else '_standard'
+            self._save_results(best_result, video_path, best_reference, suffix)
+        
+        self._print_analysis_summary(best_result)
+        
+        return {
+            'best_reference': best_reference,
+            'best_result': best_result,
+            'scores': scores
+        }
+    
+    def list_shots(self, video_data: Dict) -> List[Tuple[str, Dict]]:
+        """
+        Shots detected in a video, as (shot key, shot info) pairs.
+        
+        Keys are the ones _filter_data_by_shot accepts ("shot1", "shot2", ... for list-format shots).
+        """
+        shots = video_data.get('metadata', {}).get('shots', [])
+        if isinstance(shots, dict):
+            return list(shots.items())
+        return [(f"shot{index + 1}", shot_info if isinstance(shot_info, dict) else {})
+                for index, shot_info in enumerate(shots)]
+    
+    def _shot_video_data(self, video_data: Dict, shot_id: str, shot_info: Dict) -> Optional[Dict]:
+        """
+        One shot's frames as stand-alone video data (metadata lists only that shot,
+        so the analyses treat the shot as the whole video).
+        """
+        shot_data = self._filter_data_by_shot(video_data, shot_id)
+        if shot_data is None:
+            return None
+        shots = video_data.get('metadata', {}).get('shots', [])
+        metadata = dict(shot_data.get('metadata', {}))
+        metadata['shots'] = {shot_id: shot_info} if isinstance(shots, dict) else [shot_info]
+        return {**shot_data, 'metadata': metadata}
+    
+    def compare_shots(self, video_path: str, reference_path: str,
+                      save_results: bool = True, create_visualizations: bool = True,
+                      max_workers: Optional[int] = None, plot_options: Optional[Dict] = None) -> Dict:
+        """
+        Compare every shot of a multi-shot clip against one reference.
+        
+        Each shot is analyzed on its own (phase analyzers and DTW features), all shots are
+        scored against the reference in parallel, and visualizations are only rendered for
+        the best shot. Shot-to-shot consistency metrics are computed from the per-shot scores.
+        
+        Args:
+            video_path: Path to the user's video (already processed by the integrated pipeline)
+            reference_path: Reference video path (e.g. synthetic player profile)
+            save_results: Whether to save the best shot's results
+            create_visualizations: Whether to create DTW visualizations for the best shot
+            max_workers: Number of shots compared concurrently (default: all)
+            plot_options: DTW plot size/format (see run_comparison)
+            
+        Returns:
+            Dict with shots (per-shot summaries), consistency (see compute_shot_consistency),
+            best_shot and best_result (full comparison results of the best shot)
+        """
+        video_data = self.process_video_data(video_path)
+        if not video_data:
+            return {'error': 'User video data not available'}
+        
+        shots = self.list_shots(video_data)
+        if len(shots) <= 1:
+            # Nothing to split: compare the whole video once
+            print("🎯 Single shot detected - comparing the whole video")
+            user_analysis = build_video_analysis(video_path, dtw_analyzer=self.dtw_extension.dtw_analyzer,
+                                                 video_data=video_data,
+                                                 pipeline=self._phase_pipeline(video_path, None))
+            shot_results = [self._score_against_reference(video_path, reference_path, user_analysis)]
+            shots = shots or [('shot1', {})]
+        else:
+            def compare_shot(shot: Tuple[str, Dict]) -> Tuple[Dict, Optional[Dict]]:
+                shot_id, shot_info = shot
+                shot_data = self._shot_video_data(video_data, shot_id, shot_info)
+                if shot_data is None:
+                    return {'error': f'No frames found for {shot_id}'}, None
+                try:
+                    shot_analysis = build_video_analysis(video_path, dtw_analyzer=self.dtw_extension.dtw_analyzer,
+                                                         video_data=shot_data,
+                                                         pipeline=self._phase_pipeline(video_path, None))
+                except Exception as e:
+                    # e.g. a partial shot missing a phase; the other shots are still scored
+                    traceback.print_exc()
+                    return {'error': f'Analysis of {shot_id} failed: {str(e)}'}, None
+                return self._score_against_reference(video_path, reference_path, shot_analysis)
+            
+            print(f"\n🏀 Comparing {len(shots)} shots in parallel")
+            workers = max_workers or len(shots)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                shot_results = list(executor.map(compare_shot, shots))
+        
+        summaries = []
+        for (shot_id, shot_info), (final_results, _) in zip(shots, shot_results):
+            summary = summarize_shot(shot_id, shot_info, final_results)
+            summaries.append(summary)
+            if 'error' in summary:
+                print(f"   ⚠️ {shot_id}: {summary['error']}")
+            elif summary.get('overall_similarity') is not None:
+                print(f"   📊 {shot_id}: {summary['overall_similarity']:.1f}%")
+        consistency = compute_shot_consistency(summaries)
+        
+        best_shot = consistency.get('best_shot')
+        if best_shot is None:
+            return {'error': 'No shot could be compared', 'shots': summaries, 'consistency': consistency}
+        best_index = next(index for index, (shot_id, _) in enumerate(shots) if shot_id == best_shot)
+        best_result, best_analysis = shot_results[best_index]
+        print(f"🏆 Best shot: {best_shot} ({consistency['overall_similarity']['max']:.1f}%), "
+              f"consistency {consistency['consistency_score']:.1f}/100")
+        
+        self.video1_path = video_path
+        self.video2_path = reference_path
+        self.plot_options = dict(plot_options or {})
+        if create_visualizations and best_result['metadata'].get('dtw_analysis_included'):
+            best_result = self._create_dtw_visualizations(best_result, best_result['interpretation'],
+                                                          best_analysis['video_data'], best_analysis['reference_data'])
+        
+        best_result['metadata']['pipeline_version'] = 'enhanced_v1.0'
+        best_result['metadata']['analysis_timestamp'] = datetime.now().isoformat()
+        best_result['metadata']['best_shot'] = best_shot
+        best_result['shot_consistency'] = consistency
+        if save_results:
+            dtw_included = best_result['metadata'].get('dtw_analysis_included', False)
+            suffix = '_enhanced' if dtw_included else '_standard'
+            self._save_results(best_result, video_path, reference_path, f"{suffix}_{best_shot}")
+        
+        self._print_analysis_summary(best_result)
+        
+        return {
+            'shots': summaries,
+            'consistency': consistency,
+            'best_shot': best_shot,
+            'best_result': best_result
+        }
+    
+    def _score_against_reference(self, video_path: str, reference_path: str,
+                                 user_analysis: Optional[Dict]) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Phase analysis, interpretation and DTW (no visualizations) of a prepared user analysis
+        (whole video or one shot) against a reference.
+        
+        Returns:
+            Tuple of (final results, user analysis extended with the reference's video data)
+        """
+        if user_analysis is None:
+            return {'error': 'User video data not available'}, None
+        existing_results, existing_pipeline = self._run_phase_analysis(
+            video_path, reference_path, False, user_analysis
+        )
+        if 'error' in existing_results:
+            return existing_results, None
+        existing_interpretation = self._run_phase_interpretation(existing_results)
+        reference_data = existing_pipeline.video2_data
+        final_results = self._run_dtw_analysis(existing_results, existing_interpretation,
+                                               existing_pipeline, False, user_analysis)
+        return final_results, {**user_analysis, 'reference_data': reference_data}
+    
     def _run_phase_analysis(self, video1_path: str, video2_path: str, 
-                           enable_shot_selection: bool) -> Tuple[Dict, 'ShootingComparisonPipeline']:
+                           enable_shot_selection: bool,
+                           user_analysis: Optional[Dict] = None) -> Tuple[Dict, 'ShootingComparisonPipeline']:
         """
         Run phase-based comparison analysis.
         
+        Args:
+            user_analysis: prepare_user_analysis() result reused for video1
+        
         Returns:
             Tuple of (results dict, pipeline instance)
         """
         print("\n🔄 Phase 1: Running existing phase-based comparison analysis...")
         try:
             # Use existing pipeline to get phase analysis
-            existing_pipeline = ShootingComparisonPipeline()
-            existing_pipeline.video1_path = video1_path
-            existing_pipeline.video2_path = video2_path
+            existing_pipeline = self._phase_pipeline(video1_path, video2_path)
             
             # Process video data
             print("   📹 Processing video data...")
-            existing_pipeline.video1_data = existing_pipeline.process_video_data(video1_path)
-            existing_pipeline.video2_data = existing_pipeline.process_video_data(video2_path)
+            if user_analysis is not None:
+                existing_pipeline.video1_data = user_analysis['video_data']
+            else:
+                existing_pipeline.video1_data = existing_pipeline.process_video_data(video1_path)
+            # Reference analyses come from the feature store when the whole video is compared
+            reference_analysis = None
+            if not enable_shot_selection and existing_pipeline.video1_data:
+                selected_hand = existing_pipeline.video1_data.get('metadata', {}).get('hand', 'right')
+                reference_analysis = self.reference_store.load(video2_path, selected_hand)
+            if reference_analysis is not None:
+                print(f"   ✅ Loaded reference features from store: {os.path.basename(video2_path)}")
+                existing_pipeline.video2_data = reference_analysis['video_data']
+            else:
+                existing_pipeline.video2_data = existing_pipeline.process_video_data(video2_path)
 
             # Set metadata for analyzers
             existing_pipeline.video1_metadata = existing_pipeline.video1_data.get('metadata', {})
@@ -145,8 +416,17 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
                 # Selection was cancelled
                 return {'error': 'Shot selection cancelled'}, existing_pipeline
             
+            # The precomputed user analyses cover the whole video, so only reuse them without a shot choice
+            video1_phase_analyses = None
+            if user_analysis is not None and selected_shot1 is None:
+                video1_phase_analyses = user_analysis['phase_analyses']
+            video2_phase_analyses = None
+            if reference_analysis is not None and selected_shot2 is None:
+                video2_phase_analyses = reference_analysis['phase_analyses']
+            
             # Run phase analysis with selected shots
-            existing_results = existing_pipeline.perform_comparison(selected_shot1, selected_shot2)
+            existing_results = existing_pipeline.perform_comparison(selected_shot1, selected_shot2,
+                                                                    video1_phase_analyses, video2_phase_analyses)
             
             if not existing_results:
                 print("❌ Phase analysis failed")
@@ -160,6 +440,35 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
             traceback.print_exc()
             return {'error': f'Phase analysis failed: {str(e)}'}, None
     
+    def _phase_pipeline(self, video1_path: str, video2_path: Optional[str]) -> ShootingComparisonPipeline:
+        """
+        Get this thread's phase analysis pipeline, reset for a new comparison.
+        
+        The pipeline (phase analyzers, interpreter) is built once per thread and reused;
+        only its per-comparison fields are cleared. compare_one_to_many and compare_shots
+        run phase analyses on worker threads, so one shared instance would mix their videos.
+        
+        Args:
+            video1_path: Path to first video
+            video2_path: Path to second video (None when only video1 is analyzed)
+            
+        Returns:
+            ShootingComparisonPipeline ready for video1_path vs video2_path
+        """
+        pipeline = getattr(self._phase_pipelines, 'pipeline', None)
+        if pipeline is None:
+            pipeline = self._phase_pipelines.pipeline = ShootingComparisonPipeline()
+        pipeline.video1_path = video1_path
+        pipeline.video2_path = video2_path
+        pipeline.video1_data = None
+        pipeline.video2_data = None
+        pipeline.video1_metadata = None
+        pipeline.video2_metadata = None
+        pipeline.comparison_results = None
+        pipeline.selected_hand = 'right'
+        pipeline.prompt_file_name = None
+        return pipeline
+    
     def _run_phase_interpretation(self, existing_results: Dict) -> Dict:
         """
         Interpret phase-based analysis results.
@@ -267,10 +576,14 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
     
     def _run_dtw_analysis(self, existing_results: Dict, existing_interpretation: Dict,
                          existing_pipeline: 'ShootingComparisonPipeline',
-                         create_visualizations: bool) -> Dict:
+                         create_visualizations: bool,
+                         user_analysis: Optional[Dict] = None) -> Dict:
         """
         Add DTW analysis to existing results.
         
+        Args:
+            user_analysis: prepare_user_analysis() result whose DTW features are reused for video1
+        
         Returns:
             Enhanced results dict
         """
@@ -294,8 +607,14 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
             existing_results['video2_data'] = video2_data
             
             # Extend existing interpretation with DTW
+            reference_analysis = None
+            if existing_results.get('metadata', {}).get('selected_shot2') is None:
+                reference_analysis = self.reference_store.load(existing_pipeline.video2_path, selected_hand)
+            
             enhanced_interpretation = self.dtw_extension.extend_existing_interpretation(
-                existing_interpretation, existing_results, video1_data, video2_data, selected_hand
+                existing_interpretation, existing_results, video1_data, video2_data, selected_hand,
+                video1_features=user_analysis['dtw_features'] if user_analysis else None,
+                video2_features=reference_analysis['dtw_features'] if reference_analysis else None
             )
             
             # Preserve existing analysis
@@ -332,9 +651,9 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
                 final_results = self._create_dtw_visualizations(final_results, enhanced_interpretation,
                                                                video1_data, video2_data)
             
-            # Remove frame data to reduce file size
-            final_results['video1_data']['frames'] = []
-            final_results['video2_data']['frames'] = []
+            # Remove frame data to reduce file size (copies: the video data may be shared across comparisons)
+            final_results['video1_data'] = {**video1_data, 'frames': []}
+            final_results['video2_data'] = {**video2_data, 'frames': []}
             
             return final_results
             
@@ -373,7 +692,8 @@ class EnhancedShootingComparisonPipeline(ShootingComparisonPipeline):
             visualization_plot_paths = visualizer.create_comprehensive_dtw_report(
                 dtw_results_for_viz, 
                 video1_data, video2_data, 
-                self.video1_path, self.video2_path
+                self.video1_path, self.video2_path,
+                **self.plot_options
             )
             
             if visualization_plot_paths:
@@ -924,6 +1244,21 @@ if __name__ == "__main__":
     viz_choice = input("🎨 Create DTW visualizations? (y/n, default: y): ").strip().lower()
     create_visualizations = viz_choice != 'n'
     
+    # Ask about per-shot comparison (every shot of video 1 against video 2)
+    multi_shot_choice = input("🎯 Compare every shot of video 1 separately (consistency report)? (y/n, default: n): ").strip().lower()
+    if multi_shot_choice == 'y':
+        shot_comparison = pipeline.compare_shots(video1_path, video2_path, create_visualizations=create_visualizations)
+        if 'error' in shot_comparison:
+            print(f"❌ Analysis failed: {shot_comparison['error']}")
+        else:
+            consistency = shot_comparison['consistency']
+            print(f"\n🎉 Compared {consistency['scored_shots']}/{consistency['shot_count']} shots")
+            for shot in shot_comparison['shots']:
+                if shot.get('overall_similarity') is not None:
+                    print(f"   📊 {shot['shot_id']}: {shot['overall_similarity']:.1f}% ({shot['grade']})")
+            print(f"🎯 Consistency score: {consistency['consistency_score']:.1f}/100 (best: {consistency['best_shot']})")
+        exit(0)
+    
     # Ask about shot selection
     shot_selection_choice = input("🎯 Enable shot selection for enhanced analysis? (y/n, default: y): ").strip().lower()
     enable_shot_selection = shot_selection_choice != 'n'
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Reference Feature Store
+
+Precomputed per-video analysis (phase analyses + DTW features) for reference
+profiles such as the synthetic NBA players. Reference data does not change
+between deploys, so it is analyzed once by the build step and loaded from disk
+(and then from memory) by every comparison.
+
+Build:
+    python -m shooting_comparison.reference_feature_store output_dir/lebron output_dir/curry ...
+"""
+
+import os
+import sys
+import hashlib
+import pickle
+import argparse
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .shooting_comparison_pipeline import ShootingComparisonPipeline
+from .dtw_analysis.dtw_analyzer import DTWAnalyzer
+
+# Bump when the structure of a stored analysis (or the code producing it) changes
+STORE_FORMAT_VERSION = 1
+
+# Reference analyses depend on the user's shooting hand, so both are stored
+HANDS = ['right', 'left']
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(PACKAGE_DIR), "data", "reference_features")
+CONFIG_FILES = [
+    os.path.join(PACKAGE_DIR, "config.py"),
+    os.path.join(PACKAGE_DIR, "dtw_analysis", "dtw_config.py"),
+]
+
+
+def compute_config_version() -> str:
+    """Hash of the analysis/DTW config files (and store format) that stored features depend on"""
+    digest = hashlib.sha256(f"format:{STORE_FORMAT_VERSION}".encode())
+    for config_file in CONFIG_FILES:
+        with open(config_file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def build_video_analysis(video_path: str, selected_hand: Optional[str] = None,
+                         dtw_analyzer: Optional[DTWAnalyzer] = None,
+                         video_data: Optional[Dict] = None,
+                         pipeline: Optional[ShootingComparisonPipeline] = None) -> Optional[Dict]:
+    """
+    Run every per-video analysis used by a comparison (whole video, no shot selection).
+
+    Args:
+        video_path: Video path (processed data is loaded from data/results)
+        selected_hand: Shooting hand to analyze with (None = the video's own hand)
+        dtw_analyzer: DTW analyzer to extract features with
+        video_data: Already loaded processed data (loaded from video_path if None)
+        pipeline: Phase analysis pipeline to run with (a new one if None)
+
+    Returns:
+        Dict with video_path, video_data, selected_hand, phase_analyses and dtw_features,
+        or None if the processed data is missing
+    """
+    pipeline = pipeline or ShootingComparisonPipeline()
+    pipeline.video1_path = video_path
+    if video_data is None:
+        video_data = pipeline.process_video_data(video_path)
+    if not video_data:
+        return None
+
+    filtered_data = pipeline._filter_data_by_shot(video_data, None)
+    if filtered_data is None:
+        return None
+
+    if selected_hand is None:
+        selected_hand = filtered_data.get('metadata', {}).get('hand', 'right')
+    dtw_analyzer = dtw_analyzer or DTWAnalyzer()
+    return {
+        'video_path': video_path,
+        'video_data': video_data,
+        'selected_hand': selected_hand,
+        'phase_analyses': pipeline.analyze_video_phases(filtered_data, selected_hand),
+        'dtw_features': dtw_analyzer.extract_video_features(video_data, selected_hand)
+    }
+
+
+class ReferenceFeatureStore:
+    """
+    On-disk + in-memory store of reference video analyses.
+
+    Entries live under <store_dir>/<config_version>/, so changing config.py or
+    dtw_config.py makes old entries invisible instead of silently reusing them.
+    """
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR):
+        self.store_dir = store_dir
+        self.config_version = compute_config_version()
+        self.results_dir = os.path.join(os.path.dirname(PACKAGE_DIR), "data", "results")
+        # entry path -> (entry file mtime, analysis)
+        self._memory: Dict[str, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def _reference_name(self, reference_path: str) -> str:
+        return os.path.splitext(os.path.basename(reference_path))[0]
+
+    def _source_file(self, reference_path: str) -> str:
+        return os.path.join(self.results_dir, f"{self._reference_name(reference_path)}_normalized_output.json")
+
+    def _entry_path(self, reference_path: str, selected_hand: str) -> str:
+        return os.path.join(self.store_dir, self.config_version,
+                            f"{self._reference_name(reference_path)}_{selected_hand}.pkl")
+
+    def load(self, reference_path: str, selected_hand: str) -> Optional[Dict]:
+        """
+        Get a stored reference analysis.
+
+        Args:
+            reference_path: Reference video path (e.g. "output_dir/curry")
+            selected_hand: Shooting hand the comparison uses
+
+        Returns:
+            Stored analysis (see build_video_analysis) or None if not built / stale
+        """
+        entry_path = self._entry_path(reference_path, selected_hand)
+        # Memory hits get the same checks as disk entries: a rebuilt entry or a
+        # newer source JSON drops the cached copy
+        if not os.path.exists(entry_path):
+            self._forget(entry_path)
+            return None
+        entry_mtime = os.path.getmtime(entry_path)
+        source_file = self._source_file(reference_path)
+        if os.path.exists(source_file) and os.path.getmtime(source_file) > entry_mtime:
+            self._forget(entry_path)
+            print(f"⚠️ Reference features outdated: {os.path.basename(entry_path)}")
+            return None
+
+        with self._lock:
+            cached = self._memory.get(entry_path)
+        if cached is not None and cached[0] == entry_mtime:
+            return cached[1]
+
+        try:
+            with open(entry_path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Could not load reference features {entry_path}: {e}")
+            return None
+
+        with self._lock:
+            self._memory[entry_path] = (entry_mtime, entry)
+        return entry
+
+    def _forget(self, entry_path: str):
+        """Drop the in-memory copy of an entry"""
+        with self._lock:
+            self._memory.pop(entry_path, None)
+
+    def build(self, reference_paths: List[str], hands: List[str] = HANDS,
+              rebuild: bool = False) -> List[str]:
+        """
+        Analyze references and write their entries.
+
+        Args:
+            reference_paths: Reference video paths
+            hands: Shooting hands to build for
+            rebuild: Rebuild entries that already exist
+
+        Returns:
+            Paths of entries written
+        """
+        os.makedirs(os.path.join(self.store_dir, self.config_version), exist_ok=True)
+        dtw_analyzer = DTWAnalyzer()
+        written = []
+
+        for reference_path in reference_paths:
+            video_data = None
+            for selected_hand in hands:
+                entry_path = self._entry_path(reference_path, selected_hand)
+                if not rebuild and self.load(reference_path, selected_hand) is not None:
+                    print(f"✅ Up to date: {os.path.basename(entry_path)}")
+                    continue
+
+                entry = build_video_analysis(reference_path, selected_hand, dtw_analyzer, video_data)
+                if entry is None:
+                    print(f"❌ No processed data for reference: {reference_path}")
+                    break
+                video_data = entry['video_data']
+
+                # Write then rename so concurrent readers never see a partial file
+                tmp_path = f"{entry_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, entry_path)
+                with self._lock:
+                    self._memory[entry_path] = (os.path.getmtime(entry_path), entry)
+                written.append(entry_path)
+                print(f"💾 Reference features saved: {os.path.basename(entry_path)}")
+
+        return written
+
+
+reference_feature_store = ReferenceFeatureStore()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the reference feature store")
+    parser.add_argument("references", nargs="+", help="Reference video paths (e.g. output_dir/curry)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild entries that already exist")
+    args = parser.parse_args(argv)
+
+    print(f"🔧 Reference feature store: {reference_feature_store.store_dir} (config {reference_feature_store.config_version})")
+    reference_feature_store.build(args.references, rebuild=args.rebuild)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,12 @@ from .follow_through_analyzer import FollowThroughAnalyzer
 from .landing_analyzer import LandingAnalyzer
 from .analysis_interpreter import AnalysisInterpreter
 
+# Per-phase analysis result keys (each holds {'video1': ..., 'video2': ...} in comparison results)
+PHASE_ANALYSIS_KEYS = [
+    'setup_analysis', 'loading_analysis', 'rising_analysis',
+    'release_analysis', 'follow_through_analysis', 'landing_analysis'
+]
+
 class ShootingComparisonPipeline:
     """Pipeline for comparing basketball shooting forms between two videos"""
     
@@ -211,13 +217,51 @@ class ShootingComparisonPipeline:
         
         return phase_data
 
-    def perform_comparison(self, selected_shot1: Optional[str] = None, selected_shot2: Optional[str] = None) -> Optional[Dict]:
+    def analyze_video_phases(self, filtered_data: Dict, selected_hand: str) -> Dict:
+        """
+        Run every phase analyzer on one video's (shot-filtered) data.
+        The result depends only on that video, so it can be reused across comparisons.
+        
+        Args:
+            filtered_data: Shot-filtered video data
+            selected_hand: Shooting hand ('left' or 'right')
+        
+        Returns:
+            Dictionary keyed by PHASE_ANALYSIS_KEYS
+        """
+        print("📊 Performing set-up phase analysis...")
+        setup_analysis = self.setup_analyzer.analyze_setup_phase(filtered_data)
+        print("📊 Performing loading phase analysis...")
+        loading_analysis = self.loading_analyzer.analyze_loading_phase(filtered_data)
+        print("📊 Performing rising phase analysis...")
+        rising_analysis = self.rising_analyzer.analyze_rising_phase(filtered_data, selected_hand)
+        print("📊 Performing release phase analysis...")
+        release_analysis = self.release_analyzer.analyze_release_phase(filtered_data, selected_hand)
+        print("📊 Performing follow-through phase analysis...")
+        follow_through_analysis = self.follow_through_analyzer.analyze_follow_through_phase(filtered_data, selected_hand)
+        print("📊 Performing landing phase analysis...")
+        landing_analysis = self.landing_analyzer.analyze_landing_phase(filtered_data)
+        
+        return {
+            'setup_analysis': setup_analysis,
+            'loading_analysis': loading_analysis,
+            'rising_analysis': rising_analysis,
+            'release_analysis': release_analysis,
+            'follow_through_analysis': follow_through_analysis,
+            'landing_analysis': landing_analysis
+        }
+
+    def perform_comparison(self, selected_shot1: Optional[str] = None, selected_shot2: Optional[str] = None,
+                           video1_phase_analyses: Optional[Dict] = None,
+                           video2_phase_analyses: Optional[Dict] = None) -> Optional[Dict]:
         """
         Perform DTW-based comparison between the two videos
         
         Args:
             selected_shot1: Selected shot from video 1 (None for all shots)
             selected_shot2: Selected shot from video 2 (None for all shots)
+            video1_phase_analyses: Precomputed analyze_video_phases() result for video 1
+            video2_phase_analyses: Precomputed analyze_video_phases() result for video 2
         
         Returns:
             Comparison results dictionary or None if failed
@@ -255,65 +299,17 @@ class ShootingComparisonPipeline:
             selected_hand = filtered_video1_data.get('metadata', {}).get('hand', 'right')
             print(f"🔍 [DEBUG] Selected hand: {selected_hand}")
             self.selected_hand = selected_hand  # Store for analyzers
-            # Perform Set-up phase analysis
-            print("📊 Performing set-up phase analysis...")
-            setup_analysis1 = self.setup_analyzer.analyze_setup_phase(filtered_video1_data)
-            setup_analysis2 = self.setup_analyzer.analyze_setup_phase(filtered_video2_data)
-            comparison_results['setup_analysis'] = {
-                'video1': setup_analysis1,
-                'video2': setup_analysis2
-            }
-            print("🔍 [DEBUG] Setup analysis completed")
-            
-            # Perform Loading phase analysis
-            print("📊 Performing loading phase analysis...")
-            loading_analysis1 = self.loading_analyzer.analyze_loading_phase(filtered_video1_data)
-            loading_analysis2 = self.loading_analyzer.analyze_loading_phase(filtered_video2_data)
-            comparison_results['loading_analysis'] = {
-                'video1': loading_analysis1,
-                'video2': loading_analysis2
-            }
-            print("🔍 [DEBUG] Loading analysis completed")
-            
-            # Perform Rising phase analysis
-            print("📊 Performing rising phase analysis...")
-            rising_analysis1 = self.rising_analyzer.analyze_rising_phase(filtered_video1_data, self.selected_hand)
-            rising_analysis2 = self.rising_analyzer.analyze_rising_phase(filtered_video2_data, self.selected_hand)
-            comparison_results['rising_analysis'] = {
-                'video1': rising_analysis1,
-                'video2': rising_analysis2
-            }
-            print("🔍 [DEBUG] Rising analysis completed")
-            
-            # Perform Release phase analysis
-            print("📊 Performing release phase analysis...")
-            release_analysis1 = self.release_analyzer.analyze_release_phase(filtered_video1_data, self.selected_hand)
-            release_analysis2 = self.release_analyzer.analyze_release_phase(filtered_video2_data, self.selected_hand)
-            comparison_results['release_analysis'] = {
-                'video1': release_analysis1,
-                'video2': release_analysis2
-            }
-            print("🔍 [DEBUG] Release analysis completed")
-            
-            # Perform Follow-through phase analysis
-            print("📊 Performing follow-through phase analysis...")
-            follow_through_analysis1 = self.follow_through_analyzer.analyze_follow_through_phase(filtered_video1_data, self.selected_hand)
-            follow_through_analysis2 = self.follow_through_analyzer.analyze_follow_through_phase(filtered_video2_data, self.selected_hand)
-            comparison_results['follow_through_analysis'] = {
-                'video1': follow_through_analysis1,
-                'video2': follow_through_analysis2
-            }
-            print("🔍 [DEBUG] Follow-through analysis completed")
-            
-            # Perform Landing phase analysis
-            print("📊 Performing landing phase analysis...")
-            landing_analysis1 = self.landing_analyzer.analyze_landing_phase(filtered_video1_data)
-            landing_analysis2 = self.landing_analyzer.analyze_landing_phase(filtered_video2_data)
-            comparison_results['landing_analysis'] = {
-                'video1': landing_analysis1,
-                'video2': landing_analysis2
-            }
-            print("🔍 [DEBUG] Landing analysis completed")
+            # Per-video phase analyses (either side may be precomputed once and reused)
+            if video1_phase_analyses is None:
+                video1_phase_analyses = self.analyze_video_phases(filtered_video1_data, selected_hand)
+            if video2_phase_analyses is None:
+                video2_phase_analyses = self.analyze_video_phases(filtered_video2_data, selected_hand)
+            for analysis_key in PHASE_ANALYSIS_KEYS:
+                comparison_results[analysis_key] = {
+                    'video1': video1_phase_analyses.get(analysis_key),
+                    'video2': video2_phase_analyses.get(analysis_key)
+                }
+            print("🔍 [DEBUG] Phase analyses completed")
             
             # Add metadata
             comparison_results['metadata'] = {
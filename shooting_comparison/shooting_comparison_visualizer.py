@@ -9,11 +9,64 @@ import cv2
 import numpy as np
 import os
 import json
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from matplotlib.colors import LinearSegmentedColormap
 import sys
 import traceback
 
+from video_encoder import open_video_writer
+
+
+class SequentialFrameReader:
+    """
+    Frame access for rendering DTW-matched pairs without random seeks.
+
+    Warping paths are monotone and repeat indices, so frames are decoded in order
+    (skipped frames are only grabbed) and the resized results are kept in a small
+    LRU cache keyed by frame index. A request behind the cache falls back to a seek.
+    """
+
+    # Resized frames kept for repeated indices (warping paths repeat frames in runs)
+    FRAME_CACHE_SIZE = 64
+
+    def __init__(self, cap: cv2.VideoCapture, frame_size: Tuple[int, int]):
+        """
+        Args:
+            cap: Opened video capture (positioned at the start)
+            frame_size: (width, height) returned frames are resized to
+        """
+        self.cap = cap
+        self.frame_size = frame_size
+        self.next_index = 0
+        self.cache = OrderedDict()
+
+    def get(self, frame_idx: int) -> Optional[np.ndarray]:
+        """Resized frame at frame_idx (shared with the cache, do not modify), or None if unreadable"""
+        frame = self.cache.get(frame_idx)
+        if frame is not None:
+            self.cache.move_to_end(frame_idx)
+            return frame
+
+        if frame_idx < self.next_index:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+        else:
+            while self.next_index < frame_idx:
+                if not self.cap.grab():
+                    return None
+                self.next_index += 1
+        self.next_index = frame_idx + 1
+
+        ret, frame = self.cap.read()
+        if not ret:
+            return None
+        frame = cv2.resize(frame, self.frame_size)
+        self.cache[frame_idx] = frame
+        if len(self.cache) > self.FRAME_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return frame
+
+
 class ShootingComparisonVisualizer:
     """
     Visualizer for shooting comparison results.
@@ -439,50 +492,46 @@ class ShootingComparisonVisualizer:
             output_width = max(width1, width2) * 2
             output_height = max(height1, height2)
             
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, min(fps1, fps2), (output_width, output_height))
+            out = open_video_writer(output_path, min(fps1, fps2), (output_width, output_height))
             
             if not out.isOpened():
                 print("❌ Error creating output video")
                 return False
             
-            print(f"📊 Processing {len(actual_frame_path)} overall matched frames...")
-            
-            # Process each matched frame pair
-            for i, (frame1_idx, frame2_idx) in enumerate(actual_frame_path):
-                # Read frames
-                cap1.set(cv2.CAP_PROP_POS_FRAMES, frame1_idx)
-                cap2.set(cv2.CAP_PROP_POS_FRAMES, frame2_idx)
+            try:
+                print(f"📊 Processing {len(actual_frame_path)} overall matched frames...")
                 
-                ret1, frame1 = cap1.read()
-                ret2, frame2 = cap2.read()
+                # Decode each video once in order (resized frames cached for repeated indices)
+                reader1 = SequentialFrameReader(cap1, (output_width // 2, output_height))
+                reader2 = SequentialFrameReader(cap2, (output_width // 2, output_height))
                 
-                if not ret1 or not ret2:
-                    print(f"⚠️  Failed to read frames: V1:{frame1_idx}, V2:{frame2_idx}")
-                    continue
-                
-                # Resize frames
-                frame1_resized = cv2.resize(frame1, (output_width // 2, output_height))
-                frame2_resized = cv2.resize(frame2, (output_width // 2, output_height))
-                
-                # Create side-by-side frame
-                combined_frame = np.hstack([frame1_resized, frame2_resized])
-                
-                # Add title and frame info
-                combined_frame = self._add_overlay_text(
-                    combined_frame, title, frame1_idx, frame2_idx, i, len(actual_frame_path)
-                )
-                
-                out.write(combined_frame)
-                
-                # Progress indicator
-                if i % 30 == 0:
-                    progress = (i / len(actual_frame_path)) * 100
-                    print(f"   📈 Progress: {progress:.1f}%")
-            
-            cap1.release()
-            cap2.release()
-            out.release()
+                # Process each matched frame pair
+                for i, (frame1_idx, frame2_idx) in enumerate(actual_frame_path):
+                    frame1_resized = reader1.get(frame1_idx)
+                    frame2_resized = reader2.get(frame2_idx)
+                    
+                    if frame1_resized is None or frame2_resized is None:
+                        print(f"⚠️  Failed to read frames: V1:{frame1_idx}, V2:{frame2_idx}")
+                        continue
+                    
+                    # Create side-by-side frame
+                    combined_frame = np.hstack([frame1_resized, frame2_resized])
+                    
+                    # Add title and frame info
+                    combined_frame = self._add_overlay_text(
+                        combined_frame, title, frame1_idx, frame2_idx, i, len(actual_frame_path)
+                    )
+                    
+                    out.write(combined_frame)
+                    
+                    # Progress indicator
+                    if i % 30 == 0:
+                        progress = (i / len(actual_frame_path)) * 100
+                        print(f"   📈 Progress: {progress:.1f}%")
+            finally:
+                cap1.release()
+                cap2.release()
+                out.release()
             
             print(f"✅ {title} visualization created: {os.path.basename(output_path)}")
             return True
@@ -549,149 +598,143 @@ class ShootingComparisonVisualizer:
             output_width = max(width1, width2) * 2
             output_height = max(height1, height2)
             
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, min(fps1, fps2), (output_width, output_height))
+            out = open_video_writer(output_path, min(fps1, fps2), (output_width, output_height))
             
             if not out.isOpened():
                 print("❌ Error creating output video")
                 return False
             
-            # Get frame data for phase mapping
-            frame_data1 = video1_data.get('frames', [])
-            frame_data2 = video2_data.get('frames', [])
-            
-            # Create phase-to-frame mappings
-            def get_phase_frames(frame_data):
-                phase_frames = {}
-                for i, frame in enumerate(frame_data):
-                    phase = frame.get('phase', 'General')
-                    if phase not in phase_frames:
-                        phase_frames[phase] = []
-                    phase_frames[phase].append(i)
-                return phase_frames
-            
-            phase_frames1 = get_phase_frames(frame_data1)
-            phase_frames2 = get_phase_frames(frame_data2)
-            
-            print(f"\n🔍 Phase frame distribution:")
-            print(f"Video1: {[(p, len(f)) for p, f in phase_frames1.items()]}")
-            print(f"Video2: {[(p, len(f)) for p, f in phase_frames2.items()]}")
-            
-            # Process each phase in order
-            total_frames = 0
-            phase_frame_mappings = {}
-            
-            # First pass: calculate total frames and create mappings
-            for phase in phase_order:
-                if phase not in phase_paths:
-                    continue
+            try:
+                # Get frame data for phase mapping
+                frame_data1 = video1_data.get('frames', [])
+                frame_data2 = video2_data.get('frames', [])
                 
-                phase_data = phase_paths[phase]
-                warping_path = phase_data['warping_path']
-                actual_frame_path = phase_data['actual_frame_path']
+                # Create phase-to-frame mappings
+                def get_phase_frames(frame_data):
+                    phase_frames = {}
+                    for i, frame in enumerate(frame_data):
+                        phase = frame.get('phase', 'General')
+                        if phase not in phase_frames:
+                            phase_frames[phase] = []
+                        phase_frames[phase].append(i)
+                    return phase_frames
                 
-                print(f"   📊 {phase} phase:")
-                print(f"      Warping path length: {len(warping_path)}")
-                print(f"      Actual frame path length: {len(actual_frame_path)}")
+                phase_frames1 = get_phase_frames(frame_data1)
+                phase_frames2 = get_phase_frames(frame_data2)
                 
-                # Use actual_frame_path if available, otherwise convert warping_path
-                if actual_frame_path:
-                    phase_matches = actual_frame_path
-                    print(f"      Using actual_frame_path: {len(phase_matches)} matches")
-                    # Show first few matches for debugging
-                    if phase_matches:
-                        print(f"      First 3 matches: {phase_matches[:3]}")
-                else:
-                    # Convert warping path to actual frame indices (fallback)
-                    phase_matches = []
-                    # Determine which actual phases this DTW covers
-                    if phase == 'loading':
-                        target_phases = ['Loading', 'Loading-Rising']
-                    elif phase == 'rising':
-                        target_phases = ['Rising', 'Loading-Rising']
-                    elif phase == 'release':
-                        target_phases = ['Release']
-                    elif phase == 'follow_through':
-                        target_phases = ['Follow-through']
-                    else:
+                print(f"\n🔍 Phase frame distribution:")
+                print(f"Video1: {[(p, len(f)) for p, f in phase_frames1.items()]}")
+                print(f"Video2: {[(p, len(f)) for p, f in phase_frames2.items()]}")
+                
+                # Process each phase in order
+                total_frames = 0
+                phase_frame_mappings = {}
+                
+                # First pass: calculate total frames and create mappings
+                for phase in phase_order:
+                    if phase not in phase_paths:
                         continue
                     
-                    # Get frames for this DTW phase from both videos
-                    video1_dtw_frames = []
-                    video2_dtw_frames = []
+                    phase_data = phase_paths[phase]
+                    warping_path = phase_data['warping_path']
+                    actual_frame_path = phase_data['actual_frame_path']
                     
-                    for phase_name in target_phases:
-                        video1_dtw_frames.extend(phase_frames1.get(phase_name, []))
-                        video2_dtw_frames.extend(phase_frames2.get(phase_name, []))
+                    print(f"   📊 {phase} phase:")
+                    print(f"      Warping path length: {len(warping_path)}")
+                    print(f"      Actual frame path length: {len(actual_frame_path)}")
                     
-                    video1_dtw_frames.sort()
-                    video2_dtw_frames.sort()
-                    
-                    print(f"      Video1 DTW frames: {len(video1_dtw_frames)}")
-                    print(f"      Video2 DTW frames: {len(video2_dtw_frames)}")
-                    
-                    for path_idx1, path_idx2 in warping_path:
-                        if path_idx1 < len(video1_dtw_frames) and path_idx2 < len(video2_dtw_frames):
-                            actual_frame1 = video1_dtw_frames[path_idx1]
-                            actual_frame2 = video2_dtw_frames[path_idx2]
-                            phase_matches.append((actual_frame1, actual_frame2))
+                    # Use actual_frame_path if available, otherwise convert warping_path
+                    if actual_frame_path:
+                        phase_matches = actual_frame_path
+                        print(f"      Using actual_frame_path: {len(phase_matches)} matches")
+                        # Show first few matches for debugging
+                        if phase_matches:
+                            print(f"      First 3 matches: {phase_matches[:3]}")
+                    else:
+                        # Convert warping path to actual frame indices (fallback)
+                        phase_matches = []
+                        # Determine which actual phases this DTW covers
+                        if phase == 'loading':
+                            target_phases = ['Loading', 'Loading-Rising']
+                        elif phase == 'rising':
+                            target_phases = ['Rising', 'Loading-Rising']
+                        elif phase == 'release':
+                            target_phases = ['Release']
+                        elif phase == 'follow_through':
+                            target_phases = ['Follow-through']
+                        else:
+                            continue
+                        
+                        # Get frames for this DTW phase from both videos
+                        video1_dtw_frames = []
+                        video2_dtw_frames = []
+                        
+                        for phase_name in target_phases:
+                            video1_dtw_frames.extend(phase_frames1.get(phase_name, []))
+                            video2_dtw_frames.extend(phase_frames2.get(phase_name, []))
+                        
+                        video1_dtw_frames.sort()
+                        video2_dtw_frames.sort()
+                        
+                        print(f"      Video1 DTW frames: {len(video1_dtw_frames)}")
+                        print(f"      Video2 DTW frames: {len(video2_dtw_frames)}")
+                        
+                        for path_idx1, path_idx2 in warping_path:
+                            if path_idx1 < len(video1_dtw_frames) and path_idx2 < len(video2_dtw_frames):
+                                actual_frame1 = video1_dtw_frames[path_idx1]
+                                actual_frame2 = video2_dtw_frames[path_idx2]
+                                phase_matches.append((actual_frame1, actual_frame2))
+                        
+                        print(f"      Converted warping_path: {len(phase_matches)} matches")
+                        if phase_matches:
+                            print(f"      First 3 converted matches: {phase_matches[:3]}")
                     
-                    print(f"      Converted warping_path: {len(phase_matches)} matches")
-                    if phase_matches:
-                        print(f"      First 3 converted matches: {phase_matches[:3]}")
+                    phase_frame_mappings[phase] = phase_matches
+                    total_frames += len(phase_matches)
                 
-                phase_frame_mappings[phase] = phase_matches
-                total_frames += len(phase_matches)
-            
-            print(f"📊 Total phase-specific matched frames: {total_frames}")
-            
-            # Second pass: create visualization
-            frame_count = 0
-            
-            for phase in phase_order:
-                if phase not in phase_frame_mappings:
-                    continue
+                print(f"📊 Total phase-specific matched frames: {total_frames}")
                 
-                phase_matches = phase_frame_mappings[phase]
-                print(f"   📊 Processing {phase} phase: {len(phase_matches)} frames")
+                # Second pass: create visualization
+                frame_count = 0
+                reader1 = SequentialFrameReader(cap1, (output_width // 2, output_height))
+                reader2 = SequentialFrameReader(cap2, (output_width // 2, output_height))
                 
-                # Process each matched frame pair in this phase
-                for i, (frame1_idx, frame2_idx) in enumerate(phase_matches):
-                    # Read frames
-                    cap1.set(cv2.CAP_PROP_POS_FRAMES, frame1_idx)
-                    cap2.set(cv2.CAP_PROP_POS_FRAMES, frame2_idx)
-                    
-                    ret1, frame1 = cap1.read()
-                    ret2, frame2 = cap2.read()
-                    
-                    if not ret1 or not ret2:
-                        print(f"⚠️  Failed to read frames: V1:{frame1_idx}, V2:{frame2_idx}")
+                for phase in phase_order:
+                    if phase not in phase_frame_mappings:
                         continue
                     
-                    # Resize frames
-                    frame1_resized = cv2.resize(frame1, (output_width // 2, output_height))
-                    frame2_resized = cv2.resize(frame2, (output_width // 2, output_height))
-                    
-                    # Create side-by-side frame
-                    combined_frame = np.hstack([frame1_resized, frame2_resized])
-                    
-                    # Add phase info and frame info
-                    combined_frame = self._add_phase_overlay_text(
-                        combined_frame, title, phase, frame1_idx, frame2_idx, 
-                        frame_count, total_frames
-                    )
-                    
-                    out.write(combined_frame)
-                    frame_count += 1
+                    phase_matches = phase_frame_mappings[phase]
+                    print(f"   📊 Processing {phase} phase: {len(phase_matches)} frames")
                     
-                    # Progress indicator
-                    if frame_count % 30 == 0:
-                        progress = (frame_count / total_frames) * 100
-                        print(f"   📈 Progress: {progress:.1f}%")
-            
-            cap1.release()
-            cap2.release()
-            out.release()
+                    # Process each matched frame pair in this phase
+                    for i, (frame1_idx, frame2_idx) in enumerate(phase_matches):
+                        frame1_resized = reader1.get(frame1_idx)
+                        frame2_resized = reader2.get(frame2_idx)
+                        
+                        if frame1_resized is None or frame2_resized is None:
+                            print(f"⚠️  Failed to read frames: V1:{frame1_idx}, V2:{frame2_idx}")
+                            continue
+                        
+                        # Create side-by-side frame
+                        combined_frame = np.hstack([frame1_resized, frame2_resized])
+                        
+                        # Add phase info and frame info
+                        combined_frame = self._add_phase_overlay_text(
+                            combined_frame, title, phase, frame1_idx, frame2_idx, 
+                            frame_count, total_frames
+                        )
+                        
+                        out.write(combined_frame)
+                        frame_count += 1
+                        
+                        # Progress indicator
+                        if frame_count % 30 == 0:
+                            progress = (frame_count / total_frames) * 100
+                            print(f"   📈 Progress: {progress:.1f}%")
+            finally:
+                cap1.release()
+                cap2.release()
+                out.release()
             
             print(f"✅ {title} visualization created: {os.path.basename(output_path)}")
             return True
@@ -0,0 +1,135 @@
+"""
+Shot Consistency
+
+Shot-to-shot consistency metrics for a clip compared shot by shot against one reference
+(see EnhancedShootingComparisonPipeline.compare_shots).
+
+Each shot's DTW comparison is reduced to a shot summary (overall/feature/phase similarity
+and per-phase frame counts), and the summaries are aggregated into mean/spread statistics.
+A consistency score of 100 means every shot matched the reference equally well.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def summarize_shot(shot_id: str, shot_info: Dict, final_results: Dict) -> Dict:
+    """
+    Reduce one shot's comparison results to the values used for consistency metrics.
+
+    Args:
+        shot_id: Shot key (e.g. "shot1")
+        shot_info: Shot metadata from the normalized data (start_frame, end_frame, ...)
+        final_results: Comparison results for the shot (run_comparison format)
+
+    Returns:
+        Shot summary dict
+    """
+    summary = {
+        'shot_id': shot_id,
+        'start_frame': shot_info.get('start_frame'),
+        'end_frame': shot_info.get('end_frame')
+    }
+    if 'error' in final_results:
+        summary['error'] = final_results['error']
+        return summary
+
+    dtw_analysis = final_results.get('dtw_analysis', {})
+    summary['overall_similarity'] = dtw_analysis.get('overall_similarity')
+    summary['grade'] = dtw_analysis.get('grade', 'N/A')
+    summary['feature_similarities'] = dict(dtw_analysis.get('feature_similarities', {}))
+    summary['phase_similarities'] = {
+        phase: phase_data['similarity']
+        for phase, phase_data in dtw_analysis.get('phase_similarities', {}).items()
+        if isinstance(phase_data, dict) and 'similarity' in phase_data
+    }
+    summary['phase_frames'] = dict(final_results.get('phase_statistics', {}).get('video1_phases', {}))
+    return summary
+
+
+def _spread(values: List[float]) -> Dict:
+    """Mean/std/min/max and coefficient of variation of a list of values"""
+    array = np.asarray(values, dtype=float)
+    mean = float(array.mean())
+    std = float(array.std())
+    return {
+        'mean': mean,
+        'std': std,
+        'min': float(array.min()),
+        'max': float(array.max()),
+        'cv': std / mean if mean > 0 else 0.0,
+        'count': int(array.size)
+    }
+
+
+def _collect(summaries: List[Dict], field: str) -> Dict[str, List[float]]:
+    """Group a per-shot dict field ({name: value}) into {name: [value per shot]}"""
+    grouped: Dict[str, List[float]] = {}
+    for summary in summaries:
+        for name, value in summary.get(field, {}).items():
+            if isinstance(value, (int, float)):
+                grouped.setdefault(name, []).append(float(value))
+    return grouped
+
+
+def consistency_score(spread: Optional[Dict]) -> float:
+    """Consistency 0-100 from a spread: 100 * (1 - coefficient of variation)"""
+    if not spread:
+        return 0.0
+    return float(np.clip(100.0 * (1.0 - spread['cv']), 0.0, 100.0))
+
+
+def compute_shot_consistency(summaries: List[Dict]) -> Dict:
+    """
+    Aggregate shot summaries into shot-to-shot consistency metrics.
+
+    Args:
+        summaries: summarize_shot() results (shots that failed are counted but not scored)
+
+    Returns:
+        Dict with shot counts, best/worst shot, overall similarity spread, consistency score,
+        and per-feature / per-phase similarity and timing spreads
+    """
+    scored = [summary for summary in summaries
+              if 'error' not in summary and isinstance(summary.get('overall_similarity'), (int, float))]
+    metrics = {
+        'shot_count': len(summaries),
+        'scored_shots': len(scored)
+    }
+    if not scored:
+        return metrics
+
+    best = max(scored, key=lambda summary: summary['overall_similarity'])
+    worst = min(scored, key=lambda summary: summary['overall_similarity'])
+    overall = _spread([summary['overall_similarity'] for summary in scored])
+
+    feature_spreads = {name: _spread(values) for name, values in _collect(scored, 'feature_similarities').items()}
+    phase_spreads = {name: _spread(values) for name, values in _collect(scored, 'phase_similarities').items()}
+    # Timing: how much each phase's length (frames) varies from shot to shot
+    timing_spreads = {name: _spread(values) for name, values in _collect(scored, 'phase_frames').items()}
+
+    metrics.update({
+        'best_shot': best['shot_id'],
+        'worst_shot': worst['shot_id'],
+        'overall_similarity': overall,
+        'consistency_score': consistency_score(overall),
+        'feature_consistency': {
+            name: {**spread, 'consistency_score': consistency_score(spread)}
+            for name, spread in feature_spreads.items()
+        },
+        'phase_consistency': {
+            name: {**spread, 'consistency_score': consistency_score(spread)}
+            for name, spread in phase_spreads.items()
+        },
+        'phase_timing': {
+            name: {**spread, 'consistency_score': consistency_score(spread)}
+            for name, spread in timing_spreads.items()
+        }
+    })
+    if len(scored) > 1 and len(feature_spreads) > 1:
+        # Features that vary the most between shots are the ones to work on first
+        ordered = sorted(feature_spreads, key=lambda name: feature_spreads[name]['std'])
+        metrics['most_consistent_feature'] = ordered[0]
+        metrics['least_consistent_feature'] = ordered[-1]
+    return metrics
@@ -0,0 +1,77 @@
+"""
+Rolling Stats
+
+Fixed-capacity ring buffer of recent measurements (e.g. per-frame torso lengths)
+with cached summary statistics.
+"""
+
+import numpy as np
+from typing import List, Optional
+
+
+class RollingStats:
+    """
+    Ring buffer holding the last `capacity` values (with the frame each came from).
+
+    push() is O(1); mean() is cached until the next push/clear and is computed by
+    summing the (at most capacity) values oldest first, which matches np.mean over
+    the same window exactly.
+    """
+
+    def __init__(self, capacity: int = 4):
+        """
+        Args:
+            capacity: Number of most recent values kept
+        """
+        self.capacity = capacity
+        self._values = [0.0] * capacity
+        self._frames = [None] * capacity
+        self._start = 0  # Slot of the oldest value
+        self._count = 0
+        self._mean = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float, frame_idx: Optional[int] = None):
+        """Add a value, dropping the oldest one when full"""
+        slot = (self._start + self._count) % self.capacity
+        if self._count == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._count += 1
+        self._values[slot] = value
+        self._frames[slot] = frame_idx
+        self._mean = None
+
+    def clear(self):
+        """Drop all values"""
+        self._start = 0
+        self._count = 0
+        self._mean = None
+
+    def values(self) -> List[float]:
+        """Values oldest first"""
+        return [self._values[(self._start + i) % self.capacity] for i in range(self._count)]
+
+    def frames(self) -> List[Optional[int]]:
+        """Frame index of each value, oldest first"""
+        return [self._frames[(self._start + i) % self.capacity] for i in range(self._count)]
+
+    def mean(self) -> float:
+        """Mean of the buffered values (nan when empty)"""
+        if self._mean is None:
+            if self._count == 0:
+                return np.nan
+            total = 0.0
+            for i in range(self._count):
+                total += self._values[(self._start + i) % self.capacity]
+            self._mean = np.float64(total) / self._count
+        return self._mean
+
+    def trimmed_mean(self) -> float:
+        """Mean without the smallest and largest value (plain mean for fewer than 3 values)"""
+        if self._count < 3:
+            return self.mean()
+        values = sorted(self.values())
+        return np.float64(sum(values[1:-1])) / (self._count - 2)
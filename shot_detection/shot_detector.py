@@ -5,8 +5,14 @@ Real-time shot detection and lifecycle management for basketball shooting analys
 Manages shot start/end/cancel transitions and provides shot-specific torso measurements.
 """
 
+import logging
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from analysis_logging import get_logger
+from .rolling_stats import RollingStats
+
+logger = get_logger(__name__)
 
 
 class ShotDetector:
@@ -28,8 +34,8 @@ class ShotDetector:
         # Torso management
         self.current_shot_fixed_torso = None
         self.torso_tracking_active = True  # Whether to update rolling torso
-        self.rolling_torso_values = []  # Last 4 torso measurements
-        self.rolling_torso_frames = []  # Corresponding frame indices
+        self.rolling_torso = RollingStats(capacity=4)  # Last 4 torso measurements (with frame indices)
+        self._frame_torso = None  # (frame_idx, torso_length) of the last measured frame
         
         # Shot collection (same format as analyzer's output)
         self.shots = []  # List of completed shots with metadata
@@ -43,7 +49,7 @@ class ShotDetector:
     
     def reset(self):
         """Reset shot detector state for new video analysis."""
-        print("🔄 Resetting ShotDetector state for new video...")
+        logger.debug("🔄 Resetting ShotDetector state for new video...")
         
         # Shot state management
         self.is_shot_active = False
@@ -54,8 +60,8 @@ class ShotDetector:
         # Torso management
         self.current_shot_fixed_torso = None
         self.torso_tracking_active = True
-        self.rolling_torso_values = []
-        self.rolling_torso_frames = []
+        self.rolling_torso.clear()
+        self._frame_torso = None
         
         # Shot collection
         self.shots = []
@@ -65,7 +71,7 @@ class ShotDetector:
         self.previous_phase = "General"
         self.current_shot_phases = []
         
-        print("✅ ShotDetector state reset completed")
+        logger.debug("✅ ShotDetector state reset completed")
     
     def get_shot_torso(self, pose: Dict = None) -> float:
         """
@@ -80,38 +86,62 @@ class ShotDetector:
         if self.is_shot_active and self.current_shot_fixed_torso is not None:
             # Return fixed torso for active shot
             return self.current_shot_fixed_torso
-        elif len(self.rolling_torso_values) >= 4:
-            # Return rolling average
-            return np.mean(self.rolling_torso_values[-4:])
-        elif len(self.rolling_torso_values) > 0:
-            # Return available average
-            return np.mean(self.rolling_torso_values)
+        elif len(self.rolling_torso) > 0:
+            # Return rolling average (cached until the window changes)
+            return self.rolling_torso.mean()
         else:
             # Fallback calculation from current pose
             if pose:
                 return self._calculate_torso_from_pose(pose)
             return 0.0
     
-    def update_rolling_torso(self, frame_idx: int, pose: Dict):
+    def update_rolling_torso(self, frame_idx: int, pose: Optional[Dict], torso_length: Optional[float] = None):
         """
         Update rolling torso measurement.
         
         Args:
             frame_idx: Current frame index
-            pose: Current pose data
+            pose: Current pose data (unused when torso_length is given)
+            torso_length: Precomputed torso length for this frame (e.g. PoseSequence.torso_lengths)
         """
         if not self.torso_tracking_active:
             return  # Skip if tracking is paused
         
-        torso_length = self._calculate_torso_from_pose(pose)
+        torso_length = self.measure_torso(frame_idx, pose, torso_length)
         if torso_length > 0:
-            self.rolling_torso_values.append(torso_length)
-            self.rolling_torso_frames.append(frame_idx)
+            self.rolling_torso.push(torso_length, frame_idx)
+    
+    def measure_torso(self, frame_idx: int, pose: Optional[Dict], torso_length: Optional[float] = None) -> float:
+        """
+        Torso length of a frame, measured once per frame.
+        
+        The phase detector and the segmentation loop both report each frame; the second
+        report reuses the first measurement instead of re-measuring the pose.
+        
+        Args:
+            frame_idx: Current frame index
+            pose: Current pose data (unused when torso_length is given or already measured)
+            torso_length: Precomputed torso length for this frame
             
-            # Keep only last 4 measurements
-            if len(self.rolling_torso_values) > 4:
-                self.rolling_torso_values.pop(0)
-                self.rolling_torso_frames.pop(0)
+        Returns:
+            Torso length (0.0 if it cannot be measured)
+        """
+        if torso_length is None:
+            if self._frame_torso is not None and self._frame_torso[0] == frame_idx:
+                return self._frame_torso[1]
+            torso_length = self._calculate_torso_from_pose(pose)
+        self._frame_torso = (frame_idx, torso_length)
+        return torso_length
+    
+    @property
+    def rolling_torso_values(self) -> List[float]:
+        """Rolling torso measurements, oldest first"""
+        return self.rolling_torso.values()
+    
+    @property
+    def rolling_torso_frames(self) -> List[int]:
+        """Frame indices of the rolling torso measurements, oldest first"""
+        return self.rolling_torso.frames()
     
     def detect_shot_transitions(self, frame_idx: int, current_phase: str) -> bool:
         """
@@ -135,80 +165,80 @@ class ShotDetector:
         # 1. Shot start: General → Set-up (새로운 shot 시작)
         if (prev_phase == "General" and current_phase == "Set-up"):
             if self.is_shot_active:
-                print(f"   ⚠️ FORCE CANCEL: New shot starting while shot {self.current_shot_id} is active at frame {frame_idx}")
+                logger.warning("   ⚠️ FORCE CANCEL: New shot starting while shot %s is active at frame %s", self.current_shot_id, frame_idx)
                 self._cancel_current_shot(frame_idx, reason="Forced by new shot start")
             
             self._start_new_shot(frame_idx)
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   🏀 SHOT START: General → Set-up transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   🏀 SHOT START: General → Set-up transition at frame %s", frame_idx)
             state_changed = True
         
         # 2. Shot cancel: Various phases → General (shot 감지 취소)
         elif (self.is_shot_active and current_phase == "General" and 
               prev_phase in ["Set-up", "Loading", "Rising", "Loading-Rising", "Release"]):
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   ❌ SHOT CANCEL: {prev_phase} → General transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   ❌ SHOT CANCEL: %s → General transition at frame %s", prev_phase, frame_idx)
             self._cancel_current_shot(frame_idx, reason=f"{prev_phase} → General (abnormal return)")
             state_changed = True
         
         # 3. Shot cancel: Backward transitions (Rising/Loading-Rising → Set-up)
         # Cancel current shot and immediately start new shot
         elif (self.is_shot_active and prev_phase in ["Rising", "Loading-Rising"] and current_phase == "Set-up"):
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   ❌ SHOT CANCEL: {prev_phase} → Set-up backward transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   ❌ SHOT CANCEL: %s → Set-up backward transition at frame %s", prev_phase, frame_idx)
             self._cancel_current_shot(frame_idx, reason=f"{prev_phase} → Set-up (backward motion)")
             
             # Immediately start new shot since we're already in Set-up
-            print(f"   🔄 IMMEDIATE RESTART: Starting new shot at Set-up phase")
+            logger.debug("   🔄 IMMEDIATE RESTART: Starting new shot at Set-up phase")
             self._start_new_shot(frame_idx)
             state_changed = True
             
         # 4. Shot cancel: Loading backward transitions (Loading → Set-up)
         # Cancel current shot and immediately start new shot  
         elif (self.is_shot_active and prev_phase == "Loading" and current_phase == "Set-up"):
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   ❌ SHOT CANCEL: Loading → Set-up backward transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   ❌ SHOT CANCEL: Loading → Set-up backward transition at frame %s", frame_idx)
             self._cancel_current_shot(frame_idx, reason="Loading → Set-up (backward motion)")
             
             # Immediately start new shot since we're already in Set-up
-            print(f"   🔄 IMMEDIATE RESTART: Starting new shot at Set-up phase")
+            logger.debug("   🔄 IMMEDIATE RESTART: Starting new shot at Set-up phase")
             self._start_new_shot(frame_idx)
             state_changed = True
         
         # 5. Shot end: Follow-through → General (shot 완료)
         elif (prev_phase == "Follow-through" and current_phase == "General" and self.is_shot_active):
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   🎯 SHOT COMPLETE: Follow-through → General transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   🎯 SHOT COMPLETE: Follow-through → General transition at frame %s", frame_idx)
             self._complete_current_shot(frame_idx)
             state_changed = True
         
         # 6. Meaningful transition within shot: Set-up → Loading/Rising (fix torso)
         elif (self.is_shot_active and prev_phase == "Set-up" and 
               current_phase in ["Loading", "Rising", "Loading-Rising"] and self.torso_tracking_active):
-            print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
-            print(f"   🔒 TORSO FIX: Set-up → {current_phase} meaningful transition at frame {frame_idx}")
+            logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
+            logger.debug("   🔒 TORSO FIX: Set-up → %s meaningful transition at frame %s", current_phase, frame_idx)
             self._fix_shot_torso(frame_idx)
             state_changed = True
         
         # 7. Regular transitions (no state change)
         elif prev_phase != current_phase:
             if self.is_shot_active:
-                print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
+                logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
             else:
                 # Only log non-shot transitions occasionally to reduce noise
                 if frame_idx % 60 == 0:  # Every 2 seconds
-                    print(f"   🔄 TRANSITION: {prev_phase} → {current_phase} at frame {frame_idx} (Shot active: {self.is_shot_active})")
+                    logger.debug("   🔄 TRANSITION: %s → %s at frame %s (Shot active: %s)", prev_phase, current_phase, frame_idx, self.is_shot_active)
         
         # Update previous phase
         self.previous_phase = current_phase
         
         # Periodic status updates
-        if frame_idx % 30 == 0:  # Every second
+        if frame_idx % 30 == 0 and logger.isEnabledFor(logging.DEBUG):  # Every second
             if self.is_shot_active:
                 phases_summary = " → ".join(set(self.current_shot_phases)) if self.current_shot_phases else "None"
-                print(f"   📊 Frame {frame_idx}: Shot {self.current_shot_id} active (phases: {phases_summary}), Torso: {'Fixed' if not self.torso_tracking_active else 'Tracking'}")
+                logger.debug("   📊 Frame %s: Shot %s active (phases: %s), Torso: %s", frame_idx, self.current_shot_id, phases_summary, 'Fixed' if not self.torso_tracking_active else 'Tracking')
             else:
-                print(f"   📊 Frame {frame_idx}: No active shot, waiting for General → Set-up")
+                logger.debug("   📊 Frame %s: No active shot, waiting for General → Set-up", frame_idx)
         
         return state_changed
     
@@ -221,13 +251,13 @@ class ShotDetector:
         self.torso_tracking_active = True  # Keep tracking until meaningful transition
         self.current_shot_phases = ["Set-up"]  # Initialize with Set-up phase
         
-        print(f"\n🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print(f"🏀 SHOT {self.current_shot_id} STARTED at frame {frame_idx}")
-        print(f"   📍 Start frame: {frame_idx}")
-        print(f"   🎯 State: Shot Active = True")
-        print(f"   📏 Torso: Tracking Active (waiting for meaningful transition)")
-        print(f"   🔄 Initial phase: Set-up")
-        print(f"🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        logger.info("🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        logger.info("🏀 SHOT %s STARTED at frame %s", self.current_shot_id, frame_idx)
+        logger.info("   📍 Start frame: %s", frame_idx)
+        logger.info("   🎯 State: Shot Active = True")
+        logger.info("   📏 Torso: Tracking Active (waiting for meaningful transition)")
+        logger.info("   🔄 Initial phase: Set-up")
+        logger.info("🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     
     def _cancel_current_shot(self, frame_idx: int, reason: str = "Unknown"):
         """Cancel current shot and reset state."""
@@ -237,14 +267,14 @@ class ShotDetector:
             phases_sequence = " → ".join(self.current_shot_phases) if self.current_shot_phases else "None"
             torso_status = f"Fixed ({self.current_shot_fixed_torso:.4f})" if self.current_shot_fixed_torso else "Not Fixed"
             
-            print(f"\n🔴 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print(f"❌ SHOT {self.current_shot_id} CANCELLED at frame {frame_idx}")
-            print(f"   📍 Frame range: {self.current_shot_start} → {frame_idx} ({shot_duration} frames)")
-            print(f"   🔄 Phase sequence: {phases_sequence}")
-            print(f"   📏 Torso status: {torso_status}")
-            print(f"   💭 Cancellation reason: {reason}")
-            print(f"   🎯 State change: Shot Active = False")
-            print(f"🔴 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("🔴 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("❌ SHOT %s CANCELLED at frame %s", self.current_shot_id, frame_idx)
+            logger.info("   📍 Frame range: %s → %s (%s frames)", self.current_shot_start, frame_idx, shot_duration)
+            logger.info("   🔄 Phase sequence: %s", phases_sequence)
+            logger.info("   📏 Torso status: %s", torso_status)
+            logger.info("   💭 Cancellation reason: %s", reason)
+            logger.info("   🎯 State change: Shot Active = False")
+            logger.info("🔴 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
             
             # Reset shot state
             self.is_shot_active = False
@@ -252,11 +282,10 @@ class ShotDetector:
             self.current_shot_end = None
             self.current_shot_fixed_torso = None
             self.torso_tracking_active = True  # Resume rolling torso tracking
-            self.rolling_torso_values = []  # Clear rolling window for fresh start
-            self.rolling_torso_frames = []
+            self.rolling_torso.clear()  # Clear rolling window for fresh start
             self.current_shot_phases = []  # Clear phase tracking
             
-            print(f"   🔄 Waiting for next General → Set-up to start new shot...")
+            logger.info("   🔄 Waiting for next General → Set-up to start new shot...")
     
     def _fix_shot_torso(self, frame_idx: int):
         """Fix torso for current shot when meaningful transition is found."""
@@ -264,19 +293,19 @@ class ShotDetector:
             return
         
         # Use available torso data from rolling window
-        if len(self.rolling_torso_values) > 0:
-            self.current_shot_fixed_torso = np.mean(self.rolling_torso_values)
+        if len(self.rolling_torso) > 0:
+            self.current_shot_fixed_torso = self.rolling_torso.mean()
             self.torso_tracking_active = False  # Stop updating rolling torso
             
-            print(f"\n🔒 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print(f"📏 TORSO FIXED for Shot {self.current_shot_id} at frame {frame_idx}")
-            print(f"   🎯 Fixed torso value: {self.current_shot_fixed_torso:.4f}")
-            print(f"   📊 Based on {len(self.rolling_torso_values)} rolling measurements")
-            print(f"   ⏸️ Rolling torso tracking: PAUSED")
-            print(f"   🔄 Shot will use this fixed torso for all remaining frames")
-            print(f"🔒 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("🔒 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("📏 TORSO FIXED for Shot %s at frame %s", self.current_shot_id, frame_idx)
+            logger.info("   🎯 Fixed torso value: %.4f", self.current_shot_fixed_torso)
+            logger.info("   📊 Based on %s rolling measurements", len(self.rolling_torso))
+            logger.info("   ⏸️ Rolling torso tracking: PAUSED")
+            logger.info("   🔄 Shot will use this fixed torso for all remaining frames")
+            logger.info("🔒 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         else:
-            print(f"   ⚠️ WARNING: No rolling torso data available, keeping tracking active")
+            logger.warning("   ⚠️ WARNING: No rolling torso data available, keeping tracking active")
     
     def _complete_current_shot(self, frame_idx: int):
         """Complete current shot and add to shots list."""
@@ -302,14 +331,14 @@ class ShotDetector:
             }
             self.shots.append(shot_info)
             
-            print(f"\n🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            print(f"🎯 SHOT {self.current_shot_id} COMPLETED at frame {frame_idx}")
-            print(f"   📍 Frame range: {self.current_shot_start} → {frame_idx} ({shot_duration} frames)")
-            print(f"   🔄 Full phase sequence: {phases_sequence}")
-            print(f"   📏 Fixed torso: {torso_status}")
-            print(f"   💾 Saved as Shot {sequential_shot_id} (sequential numbering)")
-            print(f"   🎯 State change: Shot Active = False")
-            print(f"🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            logger.info("🎯 SHOT %s COMPLETED at frame %s", self.current_shot_id, frame_idx)
+            logger.info("   📍 Frame range: %s → %s (%s frames)", self.current_shot_start, frame_idx, shot_duration)
+            logger.info("   🔄 Full phase sequence: %s", phases_sequence)
+            logger.info("   📏 Fixed torso: %s", torso_status)
+            logger.info("   💾 Saved as Shot %s (sequential numbering)", sequential_shot_id)
+            logger.info("   🎯 State change: Shot Active = False")
+            logger.info("🟢 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
             
             # Reset for next shot
             self.is_shot_active = False
@@ -317,8 +346,7 @@ class ShotDetector:
             self.current_shot_end = None
             self.current_shot_fixed_torso = None
             self.torso_tracking_active = True  # Resume rolling torso tracking
-            self.rolling_torso_values = []  # Clear rolling window for fresh start
-            self.rolling_torso_frames = []
+            self.rolling_torso.clear()  # Clear rolling window for fresh start
             self.current_shot_phases = []  # Clear phase tracking
     
     def finalize_frame_shots(self, total_frames: int):
@@ -334,13 +362,13 @@ class ShotDetector:
             
             # Only complete shots that reached Release or Follow-through phase
             if self.previous_phase in ["Release", "Follow-through"]:
-                print(f"\n🎬 VIDEO END: Completing active shot in {self.previous_phase} phase")
+                logger.info("🎬 VIDEO END: Completing active shot in %s phase", self.previous_phase)
                 self._complete_current_shot(last_frame)
             else:
-                print(f"\n🎬 VIDEO END: Discarding incomplete shot in {self.previous_phase} phase (not saved)")
-                print(f"   📍 Incomplete shot: frames {self.current_shot_start} → {last_frame}")
-                print(f"   🔄 Phase sequence: {' → '.join(self.current_shot_phases) if self.current_shot_phases else 'None'}")
-                print(f"   💭 Reason: Shot must reach Release or Follow-through to be saved")
+                logger.info("🎬 VIDEO END: Discarding incomplete shot in %s phase (not saved)", self.previous_phase)
+                logger.info("   📍 Incomplete shot: frames %s → %s", self.current_shot_start, last_frame)
+                logger.info("   🔄 Phase sequence: %s", ' → '.join(self.current_shot_phases) if self.current_shot_phases else 'None')
+                logger.info("   💭 Reason: Shot must reach Release or Follow-through to be saved")
                 
                 # Reset state without saving to shots list
                 self.is_shot_active = False
@@ -348,8 +376,7 @@ class ShotDetector:
                 self.current_shot_end = None
                 self.current_shot_fixed_torso = None
                 self.torso_tracking_active = True
-                self.rolling_torso_values = []
-                self.rolling_torso_frames = []
+                self.rolling_torso.clear()
                 self.current_shot_phases = []
         
         # Initialize frame_shots list - same length as total frames
@@ -365,11 +392,11 @@ class ShotDetector:
                 if frame_idx < total_frames:
                     self.frame_shots[frame_idx] = shot_id
         
-        print(f"\n🎯 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print(f"📋 SHOT PROCESSING COMPLETED")
-        print(f"   🎯 Total shots detected: {len(self.shots)}")
-        print(f"   📊 Total frames processed: {total_frames}")
-        print(f"🎯 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        logger.info("🎯 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        logger.info("📋 SHOT PROCESSING COMPLETED")
+        logger.info("   🎯 Total shots detected: %s", len(self.shots))
+        logger.info("   📊 Total frames processed: %s", total_frames)
+        logger.info("🎯 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         
         # Validation report
         self._print_shot_validation_report()
@@ -396,11 +423,11 @@ class ShotDetector:
     
     def _print_shot_validation_report(self):
         """Print detailed validation report for shot detection."""
-        print(f"\n📊 Shot Detection Validation Report:")
-        print("=" * 50)
+        logger.info("📊 Shot Detection Validation Report:")
+        logger.info("=" * 50)
         
         if not self.shots:
-            print("❌ No shots detected")
+            logger.info("❌ No shots detected")
             return
         
         for shot in self.shots:
@@ -411,21 +438,24 @@ class ShotDetector:
             total = shot['total_frames']
             torso = shot['fixed_torso']
             
-            print(f"🎯 Shot {shot_id}:")
-            print(f"   📍 Frames: {start} → {end} ({total} frames)")
-            print(f"   🔢 Original ID: {original_id}")
-            print(f"   📏 Fixed torso: {torso:.4f}" if torso else "   📏 Fixed torso: None")
+            logger.info("🎯 Shot %s:", shot_id)
+            logger.info("   📍 Frames: %s → %s (%s frames)", start, end, total)
+            logger.info("   🔢 Original ID: %s", original_id)
+            if torso:
+                logger.info("   📏 Fixed torso: %.4f", torso)
+            else:
+                logger.info("   📏 Fixed torso: None")
             
             # Check for common issues
             if total < 30:
-                print(f"   ⚠️  Very short shot ({total} frames)")
+                logger.warning("   ⚠️  Very short shot (%s frames)", total)
             if not torso:
-                print(f"   ⚠️  No torso fixed (no meaningful transition)")
+                logger.warning("   ⚠️  No torso fixed (no meaningful transition)")
         
         # Overall statistics
         assigned_frames = sum(1 for shot in self.frame_shots if shot is not None)
         coverage = (assigned_frames / len(self.frame_shots)) * 100 if self.frame_shots else 0
-        print(f"\n📈 Coverage: {assigned_frames}/{len(self.frame_shots)} frames ({coverage:.1f}%)")
+        logger.info("📈 Coverage: %s/%s frames (%.1f%%)", assigned_frames, len(self.frame_shots), coverage)
         
         # Validate shot continuity
         self._validate_shot_continuity()
@@ -454,11 +484,11 @@ class ShotDetector:
             prev_end = end
         
         if issues:
-            print(f"\n⚠️  Shot continuity issues:")
+            logger.warning("⚠️  Shot continuity issues:")
             for issue in issues:
-                print(f"   • {issue}")
+                logger.warning("   • %s", issue)
         else:
-            print(f"\n✅ Shot continuity validation passed")
+            logger.info("✅ Shot continuity validation passed")
     
     def _calculate_torso_from_pose(self, pose: Dict) -> float:
         """
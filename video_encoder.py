@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Video encoder
+Pluggable writer backends for analyzed/comparison videos
+
+- ffmpeg: frames are piped to an ffmpeg process encoding H.264 (libx264, or libopenh264
+  where x264 is not built in). Much smaller files than mp4v at the same quality.
+- opencv: cv2.VideoWriter with mp4v (previous behavior, used when ffmpeg is missing)
+
+Writers expose the cv2.VideoWriter interface (isOpened/write/release) and by default
+encode on a background thread, so overlay drawing and encoding overlap. Unlike
+cv2.VideoWriter, release() raises RuntimeError when encoding failed (after removing the
+truncated output), so callers never report a partial video as written.
+
+Settings come from the environment (VIDEO_ENCODER, VIDEO_ENCODER_CODEC, VIDEO_ENCODER_PRESET,
+VIDEO_ENCODER_CRF, VIDEO_ENCODER_LITE, VIDEO_LITE_HEIGHT) and can be overridden per call.
+"""
+
+import os
+import queue
+import shutil
+import subprocess
+import threading
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+
+# "auto" = ffmpeg when installed, otherwise opencv
+VIDEO_ENCODER = os.getenv("VIDEO_ENCODER", "auto")
+VIDEO_ENCODER_CODEC = os.getenv("VIDEO_ENCODER_CODEC", "libx264")
+VIDEO_ENCODER_PRESET = os.getenv("VIDEO_ENCODER_PRESET", "veryfast")
+VIDEO_ENCODER_CRF = int(os.getenv("VIDEO_ENCODER_CRF", "23"))
+# libopenh264 has no CRF mode, so it encodes at a target bitrate instead
+VIDEO_ENCODER_BITRATE = os.getenv("VIDEO_ENCODER_BITRATE", "2M")
+# Lite output: downscale so the height is at most VIDEO_LITE_HEIGHT (smaller upload/download)
+VIDEO_ENCODER_LITE = os.getenv("VIDEO_ENCODER_LITE", "0") == "1"
+VIDEO_LITE_HEIGHT = int(os.getenv("VIDEO_LITE_HEIGHT", "480"))
+
+# H.264 encoders in order of preference
+H264_CODECS = ['libx264', 'libopenh264']
+
+# Frames buffered between the drawing thread and the encoder thread
+WRITE_QUEUE_SIZE = 32
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+FFMPEG_AVAILABLE = FFMPEG_PATH is not None
+
+_ffmpeg_encoders = None
+
+
+def _available_ffmpeg_encoders() -> set:
+    """Names of the video encoders the installed ffmpeg was built with (cached)"""
+    global _ffmpeg_encoders
+    if _ffmpeg_encoders is None:
+        _ffmpeg_encoders = set()
+        try:
+            output = subprocess.run([FFMPEG_PATH, "-hide_banner", "-encoders"],
+                                    capture_output=True, text=True, timeout=10).stdout
+            for line in output.splitlines():
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].startswith('V'):
+                    _ffmpeg_encoders.add(parts[1])
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"⚠️ Could not list ffmpeg encoders: {e}")
+    return _ffmpeg_encoders
+
+
+def _select_h264_codec(requested: str) -> Optional[str]:
+    """Requested codec if ffmpeg has it, otherwise the first available H.264 encoder"""
+    encoders = _available_ffmpeg_encoders()
+    for codec in [requested] + H264_CODECS:
+        if codec in encoders:
+            return codec
+    return None
+
+
+def lite_frame_size(frame_size: Tuple[int, int], max_height: int = VIDEO_LITE_HEIGHT) -> Tuple[int, int]:
+    """
+    Output size for lite videos (aspect ratio kept, even dimensions for H.264).
+
+    Args:
+        frame_size: (width, height) of the frames written
+        max_height: Maximum output height
+
+    Returns:
+        (width, height) of the encoded video
+    """
+    width, height = frame_size
+    if height <= max_height:
+        return width, height
+    scale = max_height / height
+    return max(2, int(width * scale) // 2 * 2), max(2, int(max_height) // 2 * 2)
+
+
+def _remove_partial_output(output_path: str):
+    """Delete a video whose encoding failed, so it is never mistaken for a finished one"""
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+
+
+class OpenCVVideoWriter:
+    """cv2.VideoWriter (mp4v) with optional downscaling to a smaller output size"""
+
+    def __init__(self, output_path: str, fps: float, frame_size: Tuple[int, int],
+                 output_size: Optional[Tuple[int, int]] = None):
+        self.output_path = output_path
+        self.frame_size = tuple(frame_size)
+        self.output_size = tuple(output_size or frame_size)
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        self.writer = cv2.VideoWriter(output_path, fourcc, fps, self.output_size)
+
+    def isOpened(self) -> bool:
+        return self.writer.isOpened()
+
+    def write(self, frame: np.ndarray):
+        if self.output_size != self.frame_size:
+            frame = cv2.resize(frame, self.output_size, interpolation=cv2.INTER_AREA)
+        self.writer.write(frame)
+
+    def release(self):
+        self.writer.release()
+
+
+class FFmpegVideoWriter:
+    """Pipes raw BGR frames to ffmpeg, which encodes H.264 (yuv420p, faststart for streaming)"""
+
+    def __init__(self, output_path: str, fps: float, frame_size: Tuple[int, int], codec: str,
+                 preset: str = VIDEO_ENCODER_PRESET, crf: int = VIDEO_ENCODER_CRF,
+                 output_size: Optional[Tuple[int, int]] = None):
+        """
+        Args:
+            output_path: Output video path (.mp4)
+            fps: Output frame rate
+            frame_size: (width, height) of the frames written
+            codec: ffmpeg encoder (libx264 / libopenh264)
+            preset: x264 speed/size preset (ultrafast ... veryslow)
+            crf: x264 constant rate factor (lower = better quality, larger file)
+            output_size: (width, height) to encode at (default: frame_size rounded to even)
+        """
+        self.output_path = output_path
+        self.frame_size = tuple(frame_size)
+        width, height = self.frame_size
+        out_width, out_height = output_size or (width, height)
+        # yuv420p needs even dimensions
+        out_width, out_height = out_width // 2 * 2, out_height // 2 * 2
+
+        command = [
+            FFMPEG_PATH, "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", f"{fps}",
+            "-i", "-", "-an", "-c:v", codec
+        ]
+        if codec == 'libx264':
+            command += ["-preset", preset, "-crf", str(crf)]
+        else:
+            command += ["-b:v", VIDEO_ENCODER_BITRATE]
+        if (out_width, out_height) != (width, height):
+            command += ["-vf", f"scale={out_width}:{out_height}"]
+        command += ["-pix_fmt", "yuv420p", "-movflags", "+faststart", output_path]
+
+        self.process = None
+        try:
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            print(f"❌ Failed to start ffmpeg: {e}")
+
+    def isOpened(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def write(self, frame: np.ndarray):
+        if frame.shape[1] != self.frame_size[0] or frame.shape[0] != self.frame_size[1]:
+            frame = cv2.resize(frame, self.frame_size)
+        self.process.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+
+    def release(self):
+        """Finish encoding (raises RuntimeError if ffmpeg exited with an error)"""
+        if self.process is None:
+            return
+        process, self.process = self.process, None
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass  # ffmpeg already exited; its exit code and stderr are reported below
+        stderr = process.stderr.read()
+        if process.wait() != 0:
+            _remove_partial_output(self.output_path)
+            raise RuntimeError(f"ffmpeg exited with code {process.returncode}: "
+                               f"{stderr.decode(errors='replace').strip()}")
+
+
+class ThreadedVideoWriter:
+    """
+    Runs another writer's write() on a background thread.
+
+    write() hands the frame over without copying, so callers must not modify a frame
+    after writing it (the analysis loops create a new frame every iteration).
+    """
+
+    def __init__(self, writer, queue_size: int = WRITE_QUEUE_SIZE):
+        self.writer = writer
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                return
+            if self.error is not None:
+                continue  # Drain the queue so the producer never blocks
+            try:
+                self.writer.write(frame)
+            except Exception as e:
+                self.error = e
+
+    def isOpened(self) -> bool:
+        return self.error is None and self.writer.isOpened()
+
+    def write(self, frame: np.ndarray):
+        if self.error is not None:
+            raise RuntimeError(f"Video encoder failed: {self.error}")
+        self.frames.put(frame)
+
+    def release(self):
+        """Encode the queued frames and release the writer (raises RuntimeError if encoding failed)"""
+        self.frames.put(None)
+        self.thread.join()
+        try:
+            self.writer.release()
+        finally:
+            if self.error is not None:
+                _remove_partial_output(self.writer.output_path)
+                raise RuntimeError(f"Video encoder failed: {self.error}") from self.error
+
+
+def open_video_writer(output_path: str, fps: float, frame_size: Tuple[int, int],
+                      backend: Optional[str] = None, codec: Optional[str] = None,
+                      preset: Optional[str] = None, crf: Optional[int] = None,
+                      lite: Optional[bool] = None, threaded: bool = True):
+    """
+    Open a video writer for analysis output.
+
+    Args:
+        output_path: Output video path
+        fps: Output frame rate
+        frame_size: (width, height) of the frames that will be written
+        backend: "ffmpeg", "opencv" or "auto" (default: VIDEO_ENCODER)
+        codec: ffmpeg H.264 encoder (default: VIDEO_ENCODER_CODEC)
+        preset: x264 preset (default: VIDEO_ENCODER_PRESET)
+        crf: x264 CRF (default: VIDEO_ENCODER_CRF)
+        lite: Downscale to VIDEO_LITE_HEIGHT (default: VIDEO_ENCODER_LITE)
+        threaded: Encode on a background thread
+
+    Returns:
+        Writer with the cv2.VideoWriter interface (check isOpened())
+    """
+    backend = backend or VIDEO_ENCODER
+    lite = VIDEO_ENCODER_LITE if lite is None else lite
+    frame_size = (int(frame_size[0]), int(frame_size[1]))
+    output_size = lite_frame_size(frame_size) if lite else frame_size
+
+    writer = None
+    if backend in ("auto", "ffmpeg"):
+        selected_codec = _select_h264_codec(codec or VIDEO_ENCODER_CODEC) if FFMPEG_AVAILABLE else None
+        if selected_codec:
+            writer = FFmpegVideoWriter(
+                output_path, fps, frame_size, selected_codec,
+                preset=preset or VIDEO_ENCODER_PRESET,
+                crf=VIDEO_ENCODER_CRF if crf is None else crf,
+                output_size=output_size
+            )
+            print(f"🎞️ Video encoder: ffmpeg {selected_codec} {output_size[0]}x{output_size[1]}")
+        else:
+            print("⚠️ ffmpeg with an H.264 encoder not found, using OpenCV mp4v")
+    if writer is None:
+        writer = OpenCVVideoWriter(output_path, fps, frame_size, output_size)
+
+    if threaded and writer.isOpened():
+        writer = ThreadedVideoWriter(writer)
+    return writer